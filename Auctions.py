@@ -0,0 +1,164 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Auctions for properties nobody bought. When a player
+#                   lands on an unowned space and doesn't call buy_space,
+#                   the space can be put up for auction. Pending auctions
+#                   are cleared together: players submit sealed bids on the
+#                   spaces they want, and the bids are settled from highest
+#                   to lowest with a heap, each winner paying its bid
+#                   through RealEstateGame.award_space.
+
+import heapq
+from collections import namedtuple
+
+
+# A settled auction: the space's board index, the winner, and the price paid.
+Sale = namedtuple("Sale", ["index", "name", "price"])
+
+# Players without a bidder of their own that bid in each clear by default.
+DEFAULT_BIDDERS = 4
+
+
+def discount_bidder(game, name, spaces):
+    """
+    Default bidder. Bids on each space what it is worth to the player: its
+    price discounted by the share of the player's balance it would take,
+    price * balance / (balance + price). Richer players bid closer to the
+    price, and a bid is always less than the player's balance.
+    :return: dictionary mapping space indices to bids
+    """
+    balance = game.get_player_account_balance(name)
+
+    return {index: space.get_price() * balance // (balance + space.get_price())
+            for index, space in spaces}
+
+
+class AuctionHouse:
+    """
+    Represents the pending auctions of one game. Spaces are opened for
+    auction one at a time and cleared in batches. Clearing asks every
+    solvent player that has a bidder of its own, plus only the few richest
+    of the others, once for the whole batch. A clear therefore takes time
+    proportional to the number of solvent players, plus the number of
+    spaces times the number of default bidders, plus b log b for the b bids
+    made, rather than to players times spaces. Bidders return sparse
+    dictionaries: a player that wants nothing returns an empty one.
+    """
+    def __init__(self, game, default_bidder=discount_bidder, default_bidders=DEFAULT_BIDDERS):
+        """
+        Creates an auction house with no pending auctions.
+        :param game: RealEstateGame class object
+        :param default_bidder: callable taking (game, name, spaces) and
+                               returning a dictionary of bids, used for
+                               players without a bidder of their own (None
+                               for players without one to never bid)
+        :param default_bidders: int representing how many players without a
+                                bidder of their own bid in each clear: those
+                                with the largest balances
+        """
+        self._game = game
+        self._default_bidder = default_bidder
+        self._default_bidders = default_bidders
+        self._bidders = {}              # Player name to bidder
+        self._pending = {}              # Ordered set of space indices
+    def set_bidder(self, name, bidder):
+        """
+        Setter for a player's bidder, for example the bid method of a
+        BuyStrategy from Strategies.py.
+        :param name: string representing player name
+        :param bidder: callable taking (game, name, spaces) and returning a
+                       dictionary mapping space indices to bids, or None to
+                       use the default bidder
+        :return: None
+        """
+        if bidder is None:
+            self._bidders.pop(name, None)
+        else:
+            self._bidders[name] = bidder
+
+    def get_pending(self):
+        """
+        Getter for pending
+        :return: list of ints representing the board indices of spaces
+                 waiting to be auctioned, in the order they were opened
+        """
+        return list(self._pending)
+
+    def open(self, index):
+        """
+        Puts a space up for auction at the next clear. GO, owned spaces,
+        and spaces already pending are ignored.
+        :param index: int representing the space's index on the board
+        :return: True if the auction was opened, False otherwise
+        """
+        game = self._game
+
+        if (index in self._pending or not 0 < index < len(game._board)
+                or game.get_space(index).get_owner() is not None):
+            return False
+
+        self._pending[index] = None
+
+        return True
+
+    def clear(self):
+        """
+        Settles every pending auction. The bidders of the solvent players
+        that have one, and the default bidder of the richest default_bidders
+        solvent players that don't, are called once each with the spaces
+        still unowned, cheapest first. Bids that are not greater than 0 or
+        not less than the bidder's balance are dropped, so winning an auction
+        never leaves a player bankrupt. Bids are then taken from a heap,
+        highest first, with ties going to the player that became solvent
+        first. The top bid on a space wins it if the bidder's balance is
+        still greater than the bid after earlier wins; otherwise the next bid
+        on that space is tried. Spaces nobody wins stay unowned.
+        :return: list of Sale namedtuples in the order they were settled
+        """
+        game = self._game
+        spaces = sorted(((game.get_space(index).get_price(), index)
+                         for index in self._pending
+                         if game.get_space(index).get_owner() is None))
+        self._pending = {}
+
+        if len(spaces) == 0:
+            return []
+
+        spaces = [(index, game.get_space(index)) for price, index in spaces]
+        open_indices = {index for index, space in spaces}
+        bidders = []                    # (rank, player, bidder) tuples
+        defaults = []
+
+        for rank, player in enumerate(game._players.get_solvent()):
+            bidder = self._bidders.get(player.get_name())
+
+            if bidder is not None:
+                bidders.append((rank, player, bidder))
+            elif self._default_bidder is not None:
+                defaults.append((rank, player, self._default_bidder))
+
+        bidders.extend(heapq.nlargest(self._default_bidders, defaults,
+                                      key=lambda item: item[1].get_balance()))
+        heap = []
+
+        for rank, player, bidder in bidders:
+            name = player.get_name()
+            balance = player.get_balance()
+
+            for index, amount in bidder(game, name, spaces).items():
+                if index in open_indices and 0 < amount < balance:
+                    heap.append((-amount, rank, index, name))
+
+        heapq.heapify(heap)
+        sales = []
+
+        while heap and open_indices:
+            amount, rank, index, name = heapq.heappop(heap)
+
+            if (index in open_indices and -amount < game.get_player_account_balance(name)
+                    and game.award_space(name, index, -amount)):
+                open_indices.discard(index)
+                sales.append(Sale(index, name, -amount))
+
+        return sales
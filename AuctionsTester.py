@@ -0,0 +1,196 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for Auctions.py. Checks which spaces can be
+#                   opened for auction and how a batch clears when bidders
+#                   can't afford everything they bid on.
+
+
+import unittest
+
+from Auctions import AuctionHouse, Sale, discount_bidder
+from RealEstateGame import RealEstateGame
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+
+def new_game(*players):
+    """
+    Creates a game on the standard board.
+    :param players: (name, balance) tuples in seating order
+    :return: RealEstateGame class object
+    """
+    game = RealEstateGame()
+    game.create_spaces(50, RENTS)
+
+    for name, balance in players:
+        game.create_player(name, balance)
+
+    return game
+
+
+def fixed_bidder(bids, calls=None):
+    """
+    Creates a bidder that always makes the same bids.
+    :param bids: dictionary mapping space indices to bids
+    :param calls: list to append the spaces offered on each call to, or None
+    :return: callable bidder
+    """
+    def bidder(game, name, spaces):
+        if calls is not None:
+            calls.append([index for index, space in spaces])
+
+        return dict(bids)
+
+    return bidder
+
+
+class TestAuctions(unittest.TestCase):
+    """Contains unit tests for AuctionHouse"""
+
+    def test_open(self):
+        """Only unowned spaces on the board can be opened, once each"""
+        game = new_game(("Player 1", 1000))
+        game.move_player("Player 1", 2)
+        game.buy_space("Player 1")
+        house = AuctionHouse(game)
+
+        self.assertTrue(house.open(5))
+        self.assertTrue(house.open(1))
+        self.assertFalse(house.open(5))                 # Pending
+        self.assertFalse(house.open(0))                 # GO
+        self.assertFalse(house.open(25))                # Off the board
+        self.assertFalse(house.open(2))                 # Owned
+        self.assertEqual(house.get_pending(), [5, 1])
+
+    def test_bids_above_balance(self):
+        """Bids above the bidder's balance are dropped before clearing"""
+        game = new_game(("Player 1", 300), ("Player 2", 1000))
+        house = AuctionHouse(game)
+        house.set_bidder("Player 1", fixed_bidder({1: 301, 2: 0, 3: -5}))
+        house.set_bidder("Player 2", fixed_bidder({1: 100}))
+
+        for index in (1, 2, 3):
+            house.open(index)
+
+        self.assertEqual(house.clear(), [Sale(1, "Player 2", 100)])
+        self.assertEqual(game.get_player_account_balance("Player 1"), 300)
+        self.assertEqual(game.get_player_account_balance("Player 2"), 900)
+
+        for index in (2, 3):                            # Nobody won them
+            self.assertIsNone(game.get_space(index).get_owner())
+
+    def test_fall_back_to_next_bid(self):
+        """A winner that can no longer afford a bid loses it to the next one"""
+        game = new_game(("Player 1", 300), ("Player 2", 1000))
+        house = AuctionHouse(game)
+        house.set_bidder("Player 1", fixed_bidder({1: 250, 2: 240, 3: 230}))
+        house.set_bidder("Player 2", fixed_bidder({2: 100}))
+
+        for index in (1, 2, 3, 4):
+            house.open(index)
+
+        self.assertEqual(house.clear(), [Sale(1, "Player 1", 250), Sale(2, "Player 2", 100)])
+        self.assertEqual(game.get_player_account_balance("Player 1"), 50)
+        self.assertEqual(game.get_player_account_balance("Player 2"), 900)
+        self.assertIsNone(game.get_space(3).get_owner())    # Only bid unaffordable
+        self.assertIsNone(game.get_space(4).get_owner())    # No bids
+        self.assertEqual(house.get_pending(), [])
+        self.assertEqual(house.clear(), [])
+
+    def test_whole_balance(self):
+        """Bids that would leave the winner at 0 lose to the next bid"""
+        game = new_game(("Player 1", 300), ("Player 2", 1000), ("Player 3", 1000),
+                        ("Player 4", 0))
+        house = AuctionHouse(game)
+        calls = []
+        house.set_bidder("Player 1", fixed_bidder({1: 300, 2: 200, 3: 100}, calls))
+        house.set_bidder("Player 2", fixed_bidder({1: 150}, calls))
+        house.set_bidder("Player 3", fixed_bidder({1: 150, 3: 50}, calls))
+        house.set_bidder("Player 4", fixed_bidder({1: 1000}, calls))
+
+        for index in (3, 2, 1):
+            house.open(index)
+
+        self.assertEqual(house.clear(), [Sale(2, "Player 1", 200), Sale(1, "Player 2", 150),
+                                         Sale(3, "Player 3", 50)])
+        self.assertEqual(game.get_player_account_balance("Player 1"), 100)
+        self.assertEqual(calls, [[1, 2, 3]] * 3)        # Once each, cheapest first
+
+    def test_ties(self):
+        """Equal bids go to the player seated first"""
+        game = new_game(("Player 1", 1000), ("Player 2", 1000))
+        house = AuctionHouse(game)
+        house.set_bidder("Player 2", fixed_bidder({1: 200}))
+        house.set_bidder("Player 1", fixed_bidder({1: 200}))
+        house.open(1)
+
+        self.assertEqual(house.clear(), [Sale(1, "Player 1", 200)])
+
+    def test_discount_bidder(self):
+        """Default bids discount the price by the share of balance it takes"""
+        game = new_game(("Player 1", 300), ("Player 2", 2000))
+        self.assertEqual(discount_bidder(game, "Player 1", [(1, game.get_space(1)),
+                                                            (24, game.get_space(24))]),
+                         {1: 136, 24: 256})                 # Prices 250 and 1750
+        self.assertEqual(discount_bidder(game, "Player 2", [(1, game.get_space(1))]), {1: 222})
+
+        house = AuctionHouse(game)
+        house.set_bidder("Player 2", fixed_bidder({}))
+
+        for index in (1, 4, 24):
+            house.open(index)
+
+        self.assertEqual(house.clear(), [Sale(24, "Player 1", 256)])
+
+        house.set_bidder("Player 2", None)              # Back to the default
+        house.open(4)
+        self.assertEqual(house.clear(), [Sale(4, "Player 2", 315)])
+
+        silent = AuctionHouse(game, default_bidder=None)
+        silent.open(1)
+        self.assertEqual(silent.clear(), [])
+
+    def test_default_bidders(self):
+        """Only the richest players without a bidder use the default one"""
+        game = new_game(*[(f"Player {seat}", 100 * seat) for seat in range(1, 201)])
+        asked = []
+
+        def bidder(game, name, spaces):
+            asked.append(name)
+            return discount_bidder(game, name, spaces)
+
+        house = AuctionHouse(game, default_bidder=bidder, default_bidders=3)
+        house.set_bidder("Player 1", fixed_bidder({}))
+
+        for index in range(1, len(RENTS) + 1):
+            house.open(index)
+
+        sales = house.clear()
+        self.assertEqual(asked, ["Player 200", "Player 199", "Player 198"])
+        self.assertEqual(len(sales), len(RENTS))
+        self.assertEqual(sales[0], Sale(22, "Player 200", 1609))
+
+        for seat in (198, 199, 200):
+            name = f"Player {seat}"
+            self.assertEqual(game.get_player_account_balance(name),
+                             100 * seat - sum(sale.price for sale in sales if sale.name == name))
+            self.assertGreater(game.get_player_account_balance(name), 0)
+
+    def test_owned_before_clear(self):
+        """Spaces bought after opening are skipped when clearing"""
+        game = new_game(("Player 1", 1000), ("Player 2", 1000))
+        house = AuctionHouse(game)
+        house.set_bidder("Player 2", fixed_bidder({1: 500}))
+        house.open(1)
+        game.move_player("Player 1", 1)
+        game.buy_space("Player 1")
+
+        self.assertEqual(house.clear(), [])
+        self.assertEqual(game.get_player_account_balance("Player 2"), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
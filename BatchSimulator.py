@@ -0,0 +1,227 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A vectorized simulator that plays many games of the
+#                   simplified Monopoly in RealEstateGame.py at once. Each
+#                   game's state is stored as rows of NumPy arrays so a turn
+#                   is advanced for every game with a handful of array
+#                   operations. Follows the exact rules of move_player,
+#                   buy_space, and check_game_over.
+
+import numpy as np
+
+from RealEstateGame import RealEstateGame
+
+
+class BatchSimulator:
+    """
+    Represents a batch of games that share a board and a seating of players.
+    Game state is held in parallel arrays:
+        positions: (games, players) array of board indices
+        balances:  (games, players) array of player balances
+        owners:    (games, spaces) array of owning seat indices (-1 if none)
+    Rents, prices, and color groups are taken from the board created by
+    create_spaces, so a full set charges its multiplied rent. Every
+    call to step advances all games by one turn for the seat whose turn it is.
+    Seats rotate in the order players were created, matching a driver that
+    calls move_player and buy_space for each player in turn.
+    """
+    def __init__(self, games, payout, rents, balances, groups=None):
+        """
+        Creates a batch of identical games at their starting state.
+        :param games: int representing the number of games in the batch
+        :param payout: int or float representing payout amount for GO space
+        :param rents: list of ints or floats representing space rent values
+        :param balances: list of ints or floats representing the starting
+                         balance of each seat
+        :param groups: list of (list of property indices, multiplier) tuples,
+                       or None, as passed to create_spaces
+        """
+        game = RealEstateGame()         # Use the object model to derive rents,
+        game.create_spaces(payout, rents, groups=groups)    # prices, and groups
+        board_size = len(game._board)   # so both stay in sync
+
+        prices = [0] + [game.get_space(index).get_price() for index in range(1, board_size)]
+        multipliers = [multiplier for indices, multiplier in game.get_groups()]
+        dtype = np.result_type(*([payout] + list(rents) + prices + multipliers + list(balances)))
+
+        self._payout = np.asarray(payout, dtype=dtype)
+        self._rents = np.asarray([0] + list(rents), dtype=dtype)
+        self._prices = np.asarray(prices, dtype=dtype)
+        self._groups = [(np.asarray(indices), np.asarray(multiplier, dtype=dtype))
+                        for indices, multiplier in game.get_groups()]
+        self._games = np.arange(games)
+        self._turn = 0
+
+        self.positions = np.zeros((games, len(balances)), dtype=np.int64)
+        self.balances = np.tile(np.asarray(balances, dtype=dtype), (games, 1))
+        self.owners = np.full((games, board_size), -1, dtype=np.int64)
+
+    @classmethod
+    def from_game(cls, game, games):
+        """
+        Creates a batch of games that each start from the board and players
+        of an existing RealEstateGame object. Positions and ownership of the
+        existing game are copied as well.
+        :param game: RealEstateGame class object
+        :param games: int representing the number of games in the batch
+        :return: BatchSimulator class object
+        """
+        players = list(game._players)
+        seats = {player: seat for seat, player in enumerate(players)}
+        rents = [game.get_space(index).get_base_rent() for index in range(1, len(game._board))]
+
+        batch = cls(games, game.get_space(0).get_payout(), rents,
+                    [player.get_balance() for player in players], game.get_groups())
+        batch.positions[:] = [player.get_pos() for player in players]
+
+        for index in range(1, len(game._board)):
+            owner = game.get_space(index).get_owner()
+
+            if owner is not None:
+                batch.owners[:, index] = seats[owner]
+
+        return batch
+
+    def get_turn(self):
+        """
+        Getter for turn
+        :return: int representing the number of turns played
+        """
+        return self._turn
+
+    def get_seat(self):
+        """
+        :return: int representing the seat whose turn it is
+        """
+        return self._turn % self.balances.shape[1]
+
+    def _update_balance(self, balance, amount):
+        """
+        Vectorized equivalent of Player.update_balance. Clamps the resulting
+        balance at 0 if a charge exceeds the balance.
+        :param balance: array of balances
+        :param amount: array of amounts (positive or negative)
+        :return: array of updated balances
+        """
+        return np.where(amount < -balance, 0, balance + amount).astype(balance.dtype)
+
+    def move(self, rolls):
+        """
+        Vectorized equivalent of move_player for the seat whose turn it is in
+        every game. Players with a balance of 0 do not move. Passing or
+        landing on GO pays the GO payout. Landing on an owned space charges
+        the rent (clamped at the player's balance) and pays the full rent to
+        the owner. If the player's balance is 0 after the rent check, their
+        properties are released.
+        :param rolls: array of ints in range [1..6], one per game
+        :return: None
+        """
+        games = self._games
+        seat = self.get_seat()
+        board_size = self.owners.shape[1]
+        rolls = np.asarray(rolls, dtype=np.int64)
+
+        balance = self.balances[:, seat].copy()
+        pos = self.positions[:, seat]
+        active = balance != 0                   # Ignore players that have lost
+
+        new_pos = pos + rolls
+        passed = active & (new_pos > board_size - 1)
+        new_pos = np.where(passed, new_pos - board_size, new_pos)
+        new_pos = np.where(active, new_pos, pos)
+
+        self.balances[:, seat] = np.where(passed,   # Payout from GO
+                                          self._update_balance(self.balances[:, seat], self._payout),
+                                          self.balances[:, seat])
+        self.positions[:, seat] = new_pos
+
+        landed = active & (new_pos != 0)        # Skip rent check on GO
+        owner = self.owners[games, new_pos]
+        owned = landed & (owner >= 0)
+        rent = self._rents[new_pos]
+
+        for members, multiplier in self._groups:    # Multiply full set rents
+            group_owners = self.owners[:, members]
+            full = (group_owners[:, 0] >= 0) & (group_owners == group_owners[:, :1]).all(axis=1)
+            rent = np.where(full & np.isin(new_pos, members), rent * multiplier, rent)
+
+        charged = self._update_balance(self.balances[:, seat], -rent)
+        self.balances[:, seat] = np.where(owned, charged, self.balances[:, seat])
+        balance = np.where(owned, charged, balance)
+
+        paid = games[owned]                     # Pay owner (owner may be the
+        paid_owner = owner[owned]               # player, after the charge)
+        self.balances[paid, paid_owner] = self._update_balance(
+            self.balances[paid, paid_owner], rent[owned])
+
+        lost = landed & (balance == 0)          # Relinquish losing player's properties
+        self.owners[lost[:, None] & (self.owners == seat)] = -1
+
+    def buy(self, decisions=True):
+        """
+        Vectorized equivalent of buy_space for the seat whose turn it is in
+        every game. A purchase succeeds if the player is not on GO, the space
+        is not owned, and the price does not exceed the player's balance.
+        :param decisions: bool or array of bools, one per game, representing
+                          whether buy_space is called in that game
+        :return: array of bools representing successful purchases
+        """
+        games = self._games
+        seat = self.get_seat()
+        pos = self.positions[:, seat]
+        balance = self.balances[:, seat]
+        price = self._prices[pos]
+
+        bought = (np.asarray(decisions, dtype=bool) & (pos != 0)
+                  & (self.owners[games, pos] < 0) & ~(price > balance))
+
+        self.balances[:, seat] = np.where(bought, self._update_balance(balance, -price), balance)
+        self.owners[games[bought], pos[bought]] = seat
+
+        return bought
+
+    def step(self, rolls, decisions=True):
+        """
+        Plays one turn in every game: the seat whose turn it is moves, then
+        optionally buys the space it landed on. Advances to the next seat.
+        :param rolls: array of ints in range [1..6], one per game
+        :param decisions: bool or array of bools, one per game, representing
+                          whether buy_space is called after the move
+        :return: array of bools representing successful purchases
+        """
+        self.move(rolls)
+        bought = self.buy(decisions)
+        self._turn += 1
+
+        return bought
+
+    def check_game_over(self):
+        """
+        Vectorized equivalent of check_game_over. A game is over when exactly
+        one seat has a balance greater than 0.
+        :return: array of ints representing the winning seat of each game
+                 (-1 if the game is not over)
+        """
+        solvent = self.balances > 0
+        over = solvent.sum(axis=1) == 1
+
+        return np.where(over, solvent.argmax(axis=1), -1)
+
+    def run(self, turns, seed=None, decisions=True):
+        """
+        Plays a number of turns in every game using seeded rolls in range
+        [1..6].
+        :param turns: int representing the number of turns to play
+        :param seed: int or None used to seed NumPy's random generator
+        :param decisions: bool representing whether players always buy
+        :return: array of ints representing the winning seat of each game
+                 (-1 if the game is not over)
+        """
+        rng = np.random.default_rng(seed)
+        rolls = rng.integers(1, 7, size=(turns, len(self._games)))
+
+        for turn in range(turns):
+            self.step(rolls[turn], decisions)
+
+        return self.check_game_over()
@@ -0,0 +1,128 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A differential tester for BatchSimulator.py. Plays the
+#                   same seeded rolls and buy decisions through BatchSimulator
+#                   and through RealEstateGame objects and checks that every
+#                   position, balance, owner, and winner agrees exactly.
+
+
+import unittest
+
+import numpy as np
+
+from RealEstateGame import RealEstateGame
+from BatchSimulator import BatchSimulator
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+
+class TestBatchSimulator(unittest.TestCase):
+    """Contains differential tests comparing BatchSimulator to RealEstateGame"""
+
+    def play(self, payout, rents, balances, games, turns, seed, groups=None):
+        """
+        Plays seeded games through both models, comparing state after every turn.
+        """
+        rng = np.random.default_rng(seed)
+        rolls = rng.integers(1, 7, size=(turns, games))
+        decisions = rng.random((turns, games)) < 0.6
+
+        batch = BatchSimulator(games, payout, rents, balances, groups)
+        objects = []
+
+        for _ in range(games):
+            game = RealEstateGame()
+            game.create_spaces(payout, rents, groups=groups)
+
+            for seat, balance in enumerate(balances):
+                game.create_player(f"Player {seat}", balance)
+
+            objects.append(game)
+
+        names = [f"Player {seat}" for seat in range(len(balances))]
+
+        for turn in range(turns):
+            seat = batch.get_seat()
+            bought = batch.step(rolls[turn], decisions[turn])
+
+            for index, game in enumerate(objects):
+                game.move_player(names[seat], int(rolls[turn, index]))
+
+                if decisions[turn, index]:
+                    self.assertEqual(game.buy_space(names[seat]), bool(bought[index]))
+
+                self.assert_same(batch, index, game, names)
+
+        return batch
+
+    def assert_same(self, batch, index, game, names):
+        """
+        Asserts that one game of the batch matches a RealEstateGame object.
+        """
+        seats = {name: seat for seat, name in enumerate(names)}
+
+        for seat, name in enumerate(names):
+            self.assertEqual(batch.positions[index, seat], game.get_player_current_position(name))
+            self.assertEqual(batch.balances[index, seat], game.get_player_account_balance(name))
+
+        for space in range(1, len(game._board)):
+            owner = game.get_space(space).get_owner()
+            expected = -1 if owner is None else seats[owner.get_name()]
+            self.assertEqual(batch.owners[index, space], expected)
+
+        winner = batch.check_game_over()[index]
+        expected = game.check_game_over()
+        self.assertEqual(-1 if expected == "" else seats[expected], winner)
+
+    def test_standard_board(self):
+        """Standard rents and balances, long enough for bankruptcies"""
+        batch = self.play(50, RENTS, [1500, 1500, 1500, 1500], 40, 300, 1)
+        self.assertTrue((batch.check_game_over() >= 0).any())
+
+    def test_tight_balances(self):
+        """Small balances so rent is clamped and properties are released"""
+        self.play(20, RENTS, [400, 300, 500], 60, 150, 2)
+
+    def test_float_values(self):
+        """Float rents, payout, and balances"""
+        rents = [rent + 0.25 for rent in RENTS]
+        self.play(12.5, rents, [900.5, 1000.75], 30, 200, 3)
+
+    def test_small_board(self):
+        """A short custom board where players pass GO and land on their own spaces"""
+        self.play(10, [5, 40, 80, 5, 20, 60], [200, 150], 30, 120, 4)
+
+    def test_color_groups(self):
+        """Full sets charge multiplied rent, including float multipliers"""
+        self.play(50, RENTS, [1500, 1500], 40, 300, 5, [([1, 2, 3], 2), ([7, 8, 9], 1.5)])
+
+    def test_from_game(self):
+        """A batch copied from an existing game starts from the same state"""
+        game = RealEstateGame()
+        game.create_spaces(50, RENTS, groups=[([2, 3], 3)])
+        game.create_player("Player 0", 1000)
+        game.create_player("Player 1", 1000)
+
+        for _ in range(3):
+            game.move_player("Player 0", 1)
+            game.buy_space("Player 0")
+
+        batch = BatchSimulator.from_game(game, 5)
+
+        for index in range(5):
+            self.assert_same(batch, index, game, ["Player 0", "Player 1"])
+
+        game.move_player("Player 0", 1)
+        game.move_player("Player 1", 2)         # Pays the full set rent
+        batch.step([1] * 5, False)
+        batch.step([2] * 5, False)
+
+        for index in range(5):
+            self.assert_same(batch, index, game, ["Player 0", "Player 1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
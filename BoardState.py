@@ -0,0 +1,266 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A compact, column-oriented copy of a RealEstateGame's
+#                   board and players. Rents, prices, owners, balances, and
+#                   positions are stored in typed arrays instead of one
+#                   object per space or player. Read access goes through
+#                   lightweight views that offer the same getters as the
+#                   Space, GO, Property, and Player classes.
+
+from array import array
+
+from RealEstateGame import property_name
+
+
+def _typecode(values):
+    """
+    Chooses an array typecode that stores every value without loss.
+    :param values: list of ints or floats
+    :return: "q" if every value is an int, "d" otherwise
+    """
+    for value in values:
+        if not isinstance(value, int):
+            return "d"
+
+    return "q"
+
+
+class PlayerView:
+    """
+    Represents a read-only view of one player stored in a BoardState.
+    Offers the getters of the Player class.
+    """
+    __slots__ = ("_state", "_index")
+
+    def __init__(self, state, index):
+        """
+        Creates a view of the player at the passed index.
+        :param state: BoardState class object
+        :param index: int representing the player's index in the state
+        """
+        self._state = state
+        self._index = index
+
+    def get_name(self):
+        """
+        :return: string representing player's name
+        """
+        return self._state._player_names[self._index]
+
+    def get_balance(self):
+        """
+        :return: int or float representing player's balance
+        """
+        return self._state._balances[self._index]
+
+    def get_pos(self):
+        """
+        :return: int representing the index of the player's position
+        """
+        return self._state._positions[self._index]
+
+
+class SpaceView:
+    """
+    Represents a read-only view of one space stored in a BoardState.
+    Offers the getters of the GO class at index 0 and of the Property
+    class at every other index.
+    """
+    __slots__ = ("_state", "_index")
+
+    def __init__(self, state, index):
+        """
+        Creates a view of the space at the passed index.
+        :param state: BoardState class object
+        :param index: int representing the index of the space [0..24]
+        """
+        self._state = state
+        self._index = index
+
+    def get_name(self):
+        """
+        :return: string representing space's name
+        """
+        if self._index == 0:
+            return "GO"
+
+        return self._state.property_name(self._index)
+
+    def get_payout(self):
+        """
+        :return: int or float representing GO space's payout value
+        """
+        return self._state._payout
+
+    def get_rent(self):
+        """
+        :return: int or float representing space's rent value, multiplied
+                 while one player owns every property of its color group
+        """
+        state = self._state
+        index = self._index
+        rent = state._rents[index]
+
+        for indices, multiplier in state._groups:
+            if index in indices:
+                owner = state._owners[indices[0]]
+
+                if owner >= 0 and all(state._owners[member] == owner for member in indices):
+                    return rent * multiplier
+
+                break
+
+        return rent
+
+    def get_base_rent(self):
+        """
+        :return: int or float representing space's rent without any color
+                 group multiplier
+        """
+        return self._state._rents[self._index]
+
+    def get_price(self):
+        """
+        :return: int or float representing space's purchase price
+        """
+        return self._state._prices[self._index]
+
+    def get_owner(self):
+        """
+        :return: PlayerView representing space's owner (None if no owner)
+        """
+        owner = self._state._owners[self._index]
+
+        if owner < 0:
+            return None
+
+        return PlayerView(self._state, owner)
+
+
+class BoardState:
+    """
+    Represents the state of a game as typed columns. Space names are not
+    stored because create_spaces derives them from the space index. Index 0
+    of the rent and price columns belongs to GO and holds 0, and rents are
+    base rents; color groups are kept as passed to create_spaces. Owners
+    are stored as player indices, with -1 for spaces without an owner.
+    Intended for archiving game states; it does not play turns.
+    """
+    __slots__ = ("_payout", "_rents", "_prices", "_owners",
+                 "_player_names", "_balances", "_positions", "_groups")
+
+    def __init__(self, payout, rents, prices, owners, player_names, balances, positions,
+                 groups=()):
+        """
+        Creates a state from columns. Use from_game to copy a RealEstateGame.
+        :param payout: int or float representing payout amount for GO space
+        :param rents: array of space rents, index 0 for GO
+        :param prices: array of space prices, index 0 for GO
+        :param owners: array of owner player indices, -1 for no owner
+        :param player_names: tuple of strings representing player names
+        :param balances: array of player balances
+        :param positions: array of player positions
+        :param groups: tuple of (tuple of property indices, multiplier) tuples
+        """
+        self._payout = payout
+        self._rents = rents
+        self._prices = prices
+        self._owners = owners
+        self._player_names = player_names
+        self._balances = balances
+        self._positions = positions
+        self._groups = groups
+
+    @classmethod
+    def from_game(cls, game):
+        """
+        Copies the board and players of a RealEstateGame into columns.
+        :param game: RealEstateGame class object with a board
+        :return: BoardState class object
+        """
+        board = game._board
+        players = list(game._players)
+        indices = {player: index for index, player in enumerate(players)}
+
+        rents = [0] + [space.get_base_rent() for space in board[1:]]
+        prices = [0] + [space.get_price() for space in board[1:]]
+        owners = [-1] * len(board)
+
+        for index in range(1, len(board)):
+            owner = board[index].get_owner()
+
+            if owner is not None:
+                owners[index] = indices[owner]
+
+        balances = [player.get_balance() for player in players]
+
+        return cls(board[0].get_payout(),
+                   array(_typecode(rents), rents),
+                   array(_typecode(prices), prices),
+                   array("l", owners),
+                   tuple(player.get_name() for player in players),
+                   array(_typecode(balances), balances),
+                   array("l", [player.get_pos() for player in players]),
+                   game.get_groups())
+
+    def get_groups(self):
+        """
+        Getter for groups
+        :return: tuple of (tuple of property indices, multiplier) tuples
+        """
+        return self._groups
+
+    def property_name(self, index):
+        """
+        Recreates the name create_spaces gives the property at index.
+        :param index: int representing the index of a property space
+        :return: string representing the property's name
+        """
+        return property_name(index)
+
+    def __len__(self):
+        """
+        :return: int representing the number of spaces on the board
+        """
+        return len(self._rents)
+
+    def get_space(self, index):
+        """
+        Getter for views of spaces on the board
+        :param index: int representing index of space [0..24]
+        :return: SpaceView class object for the passed index
+        """
+        return SpaceView(self, index)
+
+    def get_player(self, name):
+        """
+        Getter for views of players
+        :param name: string representing player name
+        :return: PlayerView class object for the player
+                 None if player doesn't exist
+        """
+        if name in self._player_names:
+            return PlayerView(self, self._player_names.index(name))
+
+    def get_player_account_balance(self, name):
+        """
+        :param name: string representing player name
+        :return: int or float representing player's balance
+                 None if player doesn't exist
+        """
+        player = self.get_player(name)
+
+        if player is not None:
+            return player.get_balance()
+
+    def get_player_current_position(self, name):
+        """
+        :param name: string representing player name
+        :return: int representing the index of the player's position
+                 None if player doesn't exist
+        """
+        player = self.get_player(name)
+
+        if player is not None:
+            return player.get_pos()
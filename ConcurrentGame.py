@@ -0,0 +1,225 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A RealEstateGame that can be called from many threads.
+#                   move_player and buy_space read and then write balances
+#                   and ownership across several objects, so two threads
+#                   could both see a space as unowned and both buy it, or
+#                   interleave two rent transfers. Every public method,
+#                   getters included, holds the game's lock, so no call
+#                   sees a move, purchase, or elimination half done.
+
+from threading import RLock
+
+from RealEstateGame import RealEstateGame
+
+
+class ConcurrentRealEstateGame(RealEstateGame):
+    """
+    Represents a RealEstateGame whose moves, purchases, and other compound
+    operations are atomic. Each game has its own reentrant lock, so separate
+    games never wait on each other, and callbacks run under the lock may
+    call back into the game.
+    """
+    def __init__(self):
+        """
+        Creates a new game with no board and no players.
+        """
+        super().__init__()
+        self._lock = RLock()
+
+    def get_lock(self):
+        """
+        Getter for lock. Hold it to make a sequence of calls atomic.
+        :return: threading.RLock
+        """
+        return self._lock
+
+    def set_journal(self, journal):
+        """
+        Locked version of RealEstateGame.set_journal.
+        """
+        with self._lock:
+            super().set_journal(journal)
+
+    def set_metrics(self, metrics):
+        """
+        Locked version of RealEstateGame.set_metrics.
+        """
+        with self._lock:
+            super().set_metrics(metrics)
+
+    def set_publisher(self, publisher):
+        """
+        Locked version of RealEstateGame.set_publisher.
+        """
+        with self._lock:
+            super().set_publisher(publisher)
+
+    def create_spaces(self, payout, rents, lazy=False, groups=None):
+        """
+        Locked version of RealEstateGame.create_spaces.
+        """
+        with self._lock:
+            super().create_spaces(payout, rents, lazy, groups)
+
+    def create_player(self, name, balance):
+        """
+        Locked version of RealEstateGame.create_player.
+        """
+        with self._lock:
+            super().create_player(name, balance)
+
+    def remove_player(self, name):
+        """
+        Locked version of RealEstateGame.remove_player.
+        """
+        with self._lock:
+            return super().remove_player(name)
+
+    def rename_player(self, name, new_name):
+        """
+        Locked version of RealEstateGame.rename_player.
+        """
+        with self._lock:
+            return super().rename_player(name, new_name)
+
+    def get_space(self, index):
+        """
+        Locked version of RealEstateGame.get_space.
+        """
+        with self._lock:
+            return super().get_space(index)
+
+    def get_groups(self):
+        """
+        Locked version of RealEstateGame.get_groups.
+        """
+        with self._lock:
+            return super().get_groups()
+
+    def get_player(self, name):
+        """
+        Locked version of RealEstateGame.get_player.
+        """
+        with self._lock:
+            return super().get_player(name)
+
+    def get_player_account_balance(self, name):
+        """
+        Locked version of RealEstateGame.get_player_account_balance.
+        """
+        with self._lock:
+            return super().get_player_account_balance(name)
+
+    def get_player_current_position(self, name):
+        """
+        Locked version of RealEstateGame.get_player_current_position.
+        """
+        with self._lock:
+            return super().get_player_current_position(name)
+
+    def get_player_properties(self, name):
+        """
+        Locked version of RealEstateGame.get_player_properties.
+        """
+        with self._lock:
+            return super().get_player_properties(name)
+
+    def buy_space(self, name):
+        """
+        Locked version of RealEstateGame.buy_space. The ownership check,
+        charge, and change of owner happen as one step.
+        """
+        with self._lock:
+            return super().buy_space(name)
+
+    def award_space(self, name, index, price):
+        """
+        Locked version of RealEstateGame.award_space.
+        """
+        with self._lock:
+            return super().award_space(name, index, price)
+
+    def move_player(self, name, spaces):
+        """
+        Locked version of RealEstateGame.move_player. The GO payout, rent
+        transfer, and release of a losing player's properties happen as one
+        step.
+        """
+        with self._lock:
+            super().move_player(name, spaces)
+
+    def play_turns(self, turns, rolls=None, buys=None):
+        """
+        Locked version of RealEstateGame.play_turns. Holds the lock for the
+        whole batch of turns.
+        """
+        with self._lock:
+            return super().play_turns(turns, rolls, buys)
+
+    def check_game_over(self):
+        """
+        Locked version of RealEstateGame.check_game_over. The count of
+        solvent players and the winner are read at the same moment, so an
+        elimination on another thread can't fall between them.
+        """
+        with self._lock:
+            return super().check_game_over()
+
+    def add_elimination_callback(self, callback):
+        """
+        Locked version of RealEstateGame.add_elimination_callback.
+        """
+        with self._lock:
+            super().add_elimination_callback(callback)
+
+    def add_victory_callback(self, callback):
+        """
+        Locked version of RealEstateGame.add_victory_callback.
+        """
+        with self._lock:
+            super().add_victory_callback(callback)
+
+    def get_layout(self):
+        """
+        Locked version of RealEstateGame.get_layout.
+        """
+        with self._lock:
+            return super().get_layout()
+
+    def snapshot(self):
+        """
+        Locked version of RealEstateGame.snapshot. Balances, positions, and
+        owners are copied from the same moment.
+        """
+        with self._lock:
+            return super().snapshot()
+
+    def restore(self, snapshot):
+        """
+        Locked version of RealEstateGame.restore.
+        """
+        with self._lock:
+            super().restore(snapshot)
+
+    def clone(self):
+        """
+        Locked version of RealEstateGame.clone.
+        """
+        with self._lock:
+            return super().clone()
+
+    def render(self):
+        """
+        Locked version of RealEstateGame.render.
+        """
+        with self._lock:
+            return super().render()
+
+    def display(self):
+        """
+        Locked version of RealEstateGame.display.
+        """
+        with self._lock:
+            super().display()
@@ -0,0 +1,184 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A stress tester for ConcurrentGame.py. Many threads move
+#                   players and buy spaces in one game at once, then the
+#                   test checks that no money was created or lost and that
+#                   every property has exactly one owner.
+
+
+import random
+import sys
+import threading
+import unittest
+
+from ConcurrentGame import ConcurrentRealEstateGame
+from GameEvents import Bankrupt, EventPublisher, Purchased, RentPaid
+from RealEstateGameTester import RENTS
+
+
+THREADS = 16
+TURNS_PER_THREAD = 2000
+PLAYERS = 8
+
+
+class TestConcurrentRealEstateGame(unittest.TestCase):
+
+    def setUp(self):
+        """Switches threads often so operations interleave"""
+        self._interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self._interval)
+
+    def hammer(self, game, work):
+        """Runs work(thread index) on THREADS threads started together"""
+        barrier = threading.Barrier(THREADS)
+        errors = []
+
+        def run(index):
+            barrier.wait()
+
+            try:
+                work(index)
+            except Exception as error:      # Report failures in the test thread
+                errors.append(error)
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(THREADS)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+    def test_money_and_ownership(self):
+        """Concurrent moves and purchases conserve money and ownership"""
+        # GO pays nothing and balances are too large for rent to be clamped
+        # or anyone to lose, so the only money leaving players is purchases.
+        game = ConcurrentRealEstateGame()
+        game.create_spaces(0, RENTS)
+        names = [f"Player {seat}" for seat in range(PLAYERS)]
+
+        for name in names:
+            game.create_player(name, 10 ** 9)
+
+        purchases = [0] * THREADS
+
+        def work(index):
+            rng = random.Random(index)
+
+            for _ in range(TURNS_PER_THREAD):
+                name = rng.choice(names)
+                game.move_player(name, rng.randint(1, 6))
+
+                if game.buy_space(rng.choice(names)):
+                    purchases[index] += 1
+
+        self.hammer(game, work)
+
+        owned = [game.get_space(index) for index in range(1, len(RENTS) + 1)
+                 if game.get_space(index).get_owner() is not None]
+        balances = sum(game.get_player_account_balance(name) for name in names)
+        prices = sum(space.get_price() for space in owned)
+
+        self.assertEqual(balances + prices, PLAYERS * 10 ** 9)
+        self.assertEqual(sum(purchases), len(owned))
+
+        for space in owned:
+            holders = [name for name in names
+                       if space in game.get_player_properties(name)]
+            self.assertEqual(holders, [space.get_owner().get_name()])
+
+    def test_eliminations(self):
+        """Players go bankrupt while other threads read the game"""
+        # GO pays nothing, so money only leaves players through purchases
+        # and only enters when an owner is paid more rent than the payer
+        # had left. Half the threads play turns until one player is left;
+        # the others read the winner and balances the whole time.
+        game = ConcurrentRealEstateGame()
+        game.create_spaces(0, RENTS)
+        names = [f"Player {seat}" for seat in range(PLAYERS)]
+        publisher = EventPublisher()
+        game.set_publisher(publisher)
+        events = publisher.subscribe(maxsize=10 ** 6)
+
+        for name in names:
+            game.create_player(name, 1000)
+
+        done = threading.Event()
+
+        def work(index):
+            rng = random.Random(index)
+
+            if index % 2 == 1:          # Reader
+                while not done.is_set():
+                    self.assertIn(game.check_game_over(), names + [""])
+                    self.assertGreaterEqual(game.get_player_account_balance(rng.choice(names)), 0)
+
+                    with game.get_lock():
+                        solvent = [name for name in names
+                                   if game.get_player_account_balance(name) > 0]
+                        self.assertEqual(game.check_game_over(),
+                                         solvent[0] if len(solvent) == 1 else "")
+                return
+
+            try:
+                for turn in range(TURNS_PER_THREAD):
+                    if game.check_game_over() != "":
+                        break
+
+                    name = rng.choice(names)
+                    game.move_player(name, rng.randint(1, 6))
+                    game.buy_space(name)
+            finally:
+                done.set()
+
+        self.hammer(game, work)
+
+        solvent = [name for name in names if game.get_player_account_balance(name) > 0]
+        received = list(events.drain())
+        spent = sum(event.price for event in received if type(event) is Purchased)
+        excess = sum(event.rent - event.charged for event in received if type(event) is RentPaid)
+        bankrupt = {event.name for event in received if type(event) is Bankrupt}
+
+        self.assertEqual(game.check_game_over(), solvent[0] if len(solvent) == 1 else "")
+        self.assertEqual(sum(game.get_player_account_balance(name) for name in names) + spent,
+                         PLAYERS * 1000 + excess)
+        self.assertGreaterEqual(len(bankrupt), PLAYERS // 2)
+        self.assertLessEqual(set(names) - set(solvent), bankrupt)
+
+        for index in range(1, len(RENTS) + 1):
+            space = game.get_space(index)
+            holders = [name for name in names if space in game.get_player_properties(name)]
+            owner = space.get_owner()
+            self.assertEqual(holders, [] if owner is None else [owner.get_name()])
+
+    def test_single_buyer(self):
+        """Only one of many threads on the same space can buy it"""
+        for attempt in range(20):
+            game = ConcurrentRealEstateGame()
+            game.create_spaces(0, RENTS)
+            names = [f"Player {seat}" for seat in range(THREADS)]
+
+            for name in names:
+                game.create_player(name, 10 ** 6)
+                game.move_player(name, 5)
+
+            results = [False] * THREADS
+
+            def work(index):
+                results[index] = game.buy_space(names[index])
+
+            self.hammer(game, work)
+
+            self.assertEqual(sum(results), 1)
+            self.assertEqual(sum(game.get_player_account_balance(name) for name in names),
+                             THREADS * 10 ** 6 - game.get_space(5).get_price())
+
+
+if __name__ == "__main__":
+    unittest.main()
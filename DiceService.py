@@ -0,0 +1,265 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Dice for drivers of RealEstateGame. move_player expects
+#                   the caller to roll a die in range [1..6]. A DiceStream
+#                   is a seeded stream of such rolls that is filled in large
+#                   pre-generated blocks, so a roll is an index into a bytes
+#                   object instead of a call into the random module. A
+#                   DiceService hands out an independent stream per game,
+#                   derived from one seed and the game's key, so any game
+#                   can be reproduced exactly in any process. Streams can
+#                   record their rolls, and recorded rolls can be replayed.
+
+import random
+from array import array
+
+import numpy as np
+
+
+SIDES = 6
+
+
+def stream_seed(seed, key):
+    """
+    Derives the seed of an independent stream from a parent seed and a key,
+    such as a game id or shard index. The same seed and key always give the
+    same stream, no matter which process asks.
+    :param seed: int representing the parent seed
+    :param key: int or string identifying the stream
+    :return: int representing the stream's seed
+    """
+    return random.Random(f"{seed}:{key}").getrandbits(64)
+
+
+def validate_roll(spaces):
+    """
+    Checks a roll against the contract of move_player.
+    :param spaces: value to be passed to move_player
+    :return: True if spaces is an int in range [1..6], False otherwise
+    """
+    return isinstance(spaces, int) and not isinstance(spaces, bool) and 1 <= spaces <= SIDES
+
+
+def check_roll(spaces):
+    """
+    Checks a roll against the contract of move_player before it is played.
+    :param spaces: value to be passed to move_player
+    :return: spaces, if it is an int in range [1..6]
+    :raises ValueError: if it is not
+    """
+    if not validate_roll(spaces):
+        raise ValueError(f"invalid roll {spaces!r}, expected an int in range [1..{SIDES}]")
+
+    return spaces
+
+
+def validate_rolls(rolls):
+    """
+    Checks a sequence of rolls against the contract of move_player.
+    :param rolls: iterable of values to be passed to move_player
+    :return: int representing the index of the first invalid roll
+             (-1 if every roll is valid)
+    """
+    for index, spaces in enumerate(rolls):
+        if not validate_roll(spaces):
+            return index
+
+    return -1
+
+
+class DiceStream:
+    """
+    Represents a seeded stream of rolls in range [1..6]. Rolls are generated
+    block_size at a time with NumPy's PCG64 generator. The sequence depends
+    only on the seed and block size, not on how it is read: roll and rolls
+    can be mixed.
+    """
+    def __init__(self, seed=None, block_size=4096, record=False):
+        """
+        :param seed: int or None (None draws a seed from the OS; pass record
+                     to be able to replay such a stream)
+        :param block_size: int representing rolls generated at a time
+        :param record: True to keep every roll read, for get_record
+        """
+        self._seed = seed
+        self._rng = np.random.default_rng(seed)
+        self._block_size = block_size
+        self._block = b""
+        self._index = 0
+        self._record = array("b") if record else None
+
+    def get_seed(self):
+        """
+        Getter for seed
+        :return: int or None representing the stream's seed
+        """
+        return self._seed
+
+    def get_record(self):
+        """
+        Getter for record
+        :return: array of every roll read so far, or None if not recording
+        """
+        return self._record
+
+    def _refill(self):
+        """
+        Generates the next block of rolls.
+        """
+        self._block = self._rng.integers(1, SIDES + 1, size=self._block_size,
+                                         dtype=np.int8).tobytes()
+        self._index = 0
+
+    def roll(self):
+        """
+        :return: int in range [1..6] representing the next roll
+        """
+        if self._index == len(self._block):
+            self._refill()
+
+        spaces = self._block[self._index]
+        self._index += 1
+
+        if self._record is not None:
+            self._record.append(spaces)
+
+        return spaces
+
+    def rolls(self, count):
+        """
+        Reads many rolls at once, for example to pass to play_turns.
+        :param count: int representing the number of rolls
+        :return: array of ints in range [1..6]
+        """
+        rolls = array("b")
+
+        while len(rolls) < count:
+            if self._index == len(self._block):
+                self._refill()
+
+            end = min(len(self._block), self._index + count - len(rolls))
+            rolls.frombytes(self._block[self._index:end])
+            self._index = end
+
+        if self._record is not None:
+            self._record.extend(rolls)
+
+        return rolls
+
+
+class ReplayStream:
+    """
+    Represents a stream that returns previously recorded rolls in order. It
+    offers the same roll and rolls methods as DiceStream.
+    """
+    def __init__(self, record):
+        """
+        Validates the record before storing it.
+        :param record: iterable of ints in range [1..6], such as the record
+                       of a DiceStream
+        :raises ValueError: if a recorded value is not a valid roll
+        """
+        record = list(record)
+        invalid = validate_rolls(record)
+
+        if invalid >= 0:
+            raise ValueError(f"invalid roll {record[invalid]!r} at index {invalid} of the record")
+
+        self._rolls = array("b", record)
+        self._index = 0
+
+    def get_remaining(self):
+        """
+        Getter for remaining
+        :return: int representing the number of rolls not yet read
+        """
+        return len(self._rolls) - self._index
+
+    def roll(self):
+        """
+        :return: int representing the next recorded roll (IndexError if
+                 every roll has been read)
+        """
+        spaces = self._rolls[self._index]
+        self._index += 1
+
+        return spaces
+
+    def rolls(self, count):
+        """
+        :param count: int representing the number of rolls
+        :return: array of the next count recorded rolls (fewer if the
+                 record runs out)
+        """
+        rolls = self._rolls[self._index:self._index + count]
+        self._index += len(rolls)
+
+        return rolls
+
+
+class DiceService:
+    """
+    Represents the dice of many games. Each game, identified by a key, gets
+    its own DiceStream seeded from the service's seed and the key, so games
+    are independent of each other and of the order they are played in.
+    """
+    def __init__(self, seed=0, block_size=4096, record=False):
+        """
+        :param seed: int representing the service's seed
+        :param block_size: int representing rolls generated at a time per game
+        :param record: True to record every game's rolls
+        """
+        self._seed = seed
+        self._block_size = block_size
+        self._record = record
+        self._streams = {}
+
+    def get_seed(self):
+        """
+        Getter for seed
+        :return: int representing the service's seed
+        """
+        return self._seed
+
+    def stream(self, key):
+        """
+        Getter for a game's stream. Creates it on first use.
+        :param key: int or string identifying the game
+        :return: DiceStream class object
+        """
+        stream = self._streams.get(key)
+
+        if stream is None:
+            stream = DiceStream(stream_seed(self._seed, key), self._block_size, self._record)
+            self._streams[key] = stream
+
+        return stream
+
+    def get_record(self, key):
+        """
+        Getter for the rolls a game has read
+        :param key: int or string identifying the game
+        :return: array of rolls, or None if not recording or never used
+        """
+        stream = self._streams.get(key)
+
+        if stream is not None:
+            return stream.get_record()
+
+    def replay(self, key):
+        """
+        Creates a fresh stream that yields the same rolls a game's stream
+        yields, from the start. Needs only the service's seed and the key.
+        :param key: int or string identifying the game
+        :return: DiceStream class object
+        """
+        return DiceStream(stream_seed(self._seed, key), self._block_size)
+
+    def release(self, key):
+        """
+        Forgets a finished game's stream.
+        :param key: int or string identifying the game
+        :return: None
+        """
+        self._streams.pop(key, None)
@@ -0,0 +1,84 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for DiceService.py. Checks that streams are
+#                   reproducible however they are read, that recorded rolls
+#                   replay exactly, and that invalid rolls are rejected.
+
+
+import unittest
+
+from DiceService import DiceService, DiceStream, ReplayStream, check_roll, validate_roll
+from GameDriver import play_game
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+PLAYERS = [("Player 1", 1500), ("Player 2", 1500), ("Player 3", 1500)]
+
+
+class TestDiceService(unittest.TestCase):
+    """Contains reproducibility and replay tests for DiceService"""
+
+    def test_stream_is_reproducible(self):
+        """Mixing roll and rolls across blocks reads the same sequence"""
+        singles = DiceStream(7, block_size=5)
+        expected = [singles.roll() for _ in range(23)]
+        mixed = DiceStream(7, block_size=5)
+        rolls = [mixed.roll()] + list(mixed.rolls(13)) + [mixed.roll() for _ in range(9)]
+
+        self.assertEqual(rolls, expected)
+        self.assertTrue(all(validate_roll(spaces) for spaces in rolls))
+
+    def test_service_streams(self):
+        """Streams depend on the seed and key only, not on the order of use"""
+        first = DiceService(3)
+        second = DiceService(3)
+        ordered = [list(first.stream(key).rolls(10)) for key in ("a", "b")]
+        reversed_order = [list(second.stream(key).rolls(10)) for key in ("b", "a")]
+
+        self.assertEqual(ordered, reversed_order[::-1])
+        self.assertNotEqual(ordered[0], ordered[1])
+        self.assertEqual(list(first.replay("a").rolls(10)), ordered[0])
+
+    def test_replay_record(self):
+        """A game replayed from its recorded rolls has the same result"""
+        service = DiceService(11, record=True)
+        result = play_game(RENTS, 50, PLAYERS, dice=service.stream("game"))
+        replay = ReplayStream(service.get_record("game"))
+
+        self.assertEqual(play_game(RENTS, 50, PLAYERS, dice=replay), result)
+        self.assertEqual(replay.get_remaining(), 0)
+
+    def test_invalid_record(self):
+        """Records with values that aren't rolls are rejected with their index"""
+        for record, invalid in (([1, 6, 7, 2], 2), ([3, 1000], 1), ([2, 2.5], 1),
+                                ([True, 1], 0), (iter([4, 5, 0]), 2)):
+            with self.assertRaisesRegex(ValueError, f"at index {invalid} "):
+                ReplayStream(record)
+
+        replay = ReplayStream(iter([4, 5, 6]))
+        self.assertEqual(list(replay.rolls(5)), [4, 5, 6])
+
+    def test_invalid_rolls_are_not_played(self):
+        """Drivers reject rolls outside [1..6] before moving anyone"""
+        for spaces in (0, 7, 2.0, True, None):
+            self.assertRaises(ValueError, check_roll, spaces)
+
+        self.assertEqual(check_roll(6), 6)
+
+        class LoadedDice:
+            """Rolls 3, then 9"""
+            def __init__(self):
+                self.rolls = [3, 9]
+
+            def roll(self):
+                return self.rolls.pop(0)
+
+        with self.assertRaisesRegex(ValueError, "invalid roll 9"):
+            play_game(RENTS, 50, PLAYERS, dice=LoadedDice())
+
+
+if __name__ == "__main__":
+    unittest.main()
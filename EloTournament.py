@@ -0,0 +1,316 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Rates buying strategies from Strategies.py against each
+#                   other. Every pair of strategies plays a head-to-head
+#                   matchup in batches of games across a pool of worker
+#                   processes, and Elo ratings are updated after each batch.
+#                   A matchup stops early once the confidence interval of
+#                   its score is narrow enough or clearly excludes an even
+#                   result, so games are not wasted on decided matchups.
+
+import argparse
+import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from DiceService import DiceService, stream_seed
+from GameDriver import play_game
+from Strategies import AlwaysBuy, ROIBuy, RandomBuy, ThresholdBuy
+from TournamentRunner import shard_seed
+
+
+class EloRatings:
+    """
+    Represents the Elo ratings of a set of named competitors.
+    """
+    def __init__(self, names, initial=1500, k=16):
+        """
+        :param names: iterable of strings representing competitor names
+        :param initial: int or float representing every starting rating
+        :param k: int or float representing the update factor per game
+        """
+        self._ratings = {name: float(initial) for name in names}
+        self._k = k
+
+    def get_rating(self, name):
+        """
+        Getter for rating
+        :param name: string representing a competitor name
+        :return: float rating
+        """
+        return self._ratings[name]
+
+    def get_ratings(self):
+        """
+        Getter for ratings
+        :return: list of (name, rating) tuples, best first
+        """
+        return sorted(self._ratings.items(), key=lambda item: -item[1])
+
+    def expected(self, first, second):
+        """
+        :return: float expected score of first against second per game
+        """
+        return 1 / (1 + 10 ** ((self._ratings[second] - self._ratings[first]) / 400))
+
+    def update(self, first, second, score, games):
+        """
+        Updates both ratings after a batch of games between two competitors.
+        :param first: string representing a competitor name
+        :param second: string representing a competitor name
+        :param score: float representing first's points (1 per win, 0.5 per
+                      draw) in the batch
+        :param games: int representing the number of games in the batch
+        :return: None
+        """
+        change = self._k * (score - games * self.expected(first, second))
+        self._ratings[first] += change
+        self._ratings[second] -= change
+
+
+class Matchup:
+    """
+    Represents the running results of one strategy against another.
+    """
+    def __init__(self, first, second):
+        """
+        :param first: string representing a strategy name
+        :param second: string representing a strategy name
+        """
+        self._first = first
+        self._second = second
+        self._wins = 0                  # Wins of first
+        self._losses = 0                # Wins of second
+        self._draws = 0
+
+    def get_names(self):
+        """
+        Getter for names
+        :return: tuple of the two strategy names
+        """
+        return self._first, self._second
+
+    def get_games(self):
+        """
+        Getter for games
+        :return: int representing the number of games played
+        """
+        return self._wins + self._losses + self._draws
+
+    def get_record(self):
+        """
+        Getter for record
+        :return: tuple of (first's wins, second's wins, draws)
+        """
+        return self._wins, self._losses, self._draws
+
+    def add_batch(self, wins, losses, draws):
+        """
+        Adds the results of a batch of games.
+        :return: None
+        """
+        self._wins += wins
+        self._losses += losses
+        self._draws += draws
+
+    def get_score(self):
+        """
+        Getter for score
+        :return: float representing first's average points per game
+        """
+        games = self.get_games()
+
+        if games == 0:
+            return 0.5
+
+        return (self._wins + 0.5 * self._draws) / games
+
+    def interval(self, z=1.96):
+        """
+        Computes the Wilson score interval of first's average points per game.
+        :param z: float representing the normal quantile of the confidence
+                  level (1.96 for 95%)
+        :return: tuple of (low, high)
+        """
+        games = self.get_games()
+
+        if games == 0:
+            return 0.0, 1.0
+
+        score = self.get_score()
+        scale = 1 + z * z / games
+        center = (score + z * z / (2 * games)) / scale
+        spread = z * math.sqrt(score * (1 - score) / games + z * z / (4 * games * games)) / scale
+
+        return center - spread, center + spread
+
+    def is_decided(self, precision, z=1.96, min_games=0):
+        """
+        Decides whether more games would change the matchup's conclusion.
+        :param precision: float representing the largest acceptable half width
+                          of the confidence interval
+        :param z: float representing the normal quantile of the confidence level
+        :param min_games: int representing games to play before stopping
+        :return: True if the interval is narrow enough or excludes 0.5
+        """
+        if self.get_games() < min_games:
+            return False
+
+        low, high = self.interval(z)
+
+        return (high - low) / 2 <= precision or low > 0.5 or high < 0.5
+
+
+def play_batch(rents, payout, balance, first, second, games, seed, max_turns):
+    """
+    Plays a batch of head-to-head games in a worker process. Seats alternate
+    so neither strategy always moves first.
+    :param rents: list of ints or floats representing space rent values
+    :param payout: int or float representing payout amount for GO space
+    :param balance: int or float representing each player's starting balance
+    :param first: tuple of (name, BuyStrategy class object)
+    :param second: tuple of (name, BuyStrategy class object)
+    :param games: int representing the number of games in the batch
+    :param seed: int representing the batch's seed
+    :param max_turns: int representing the maximum number of moves per game
+    :return: tuple of (first's wins, second's wins, draws)
+    """
+    dice = DiceService(seed)
+    wins = losses = draws = 0
+
+    for game in range(games):
+        for name, strategy in (first, second):
+            strategy.set_seed(stream_seed(seed, f"{name}:{game}"))
+
+        seats = [(first[0], balance, first[1]), (second[0], balance, second[1])]
+
+        if game % 2 == 1:
+            seats.reverse()
+
+        winner = play_game(rents, payout, seats, max_turns=max_turns,
+                           dice=dice.stream(game)).winner
+        dice.release(game)
+
+        if winner == first[0]:
+            wins += 1
+        elif winner == second[0]:
+            losses += 1
+        else:
+            draws += 1
+
+    return wins, losses, draws
+
+
+def run_round_robin(strategies, rents, payout, balance=1500, batch_size=20,
+                    min_games=40, max_games=1000, precision=0.05, z=1.96,
+                    workers=None, seed=0, max_turns=10000, k=16):
+    """
+    Plays every pair of strategies against each other. Each round submits one
+    batch for every undecided matchup to the process pool, then adds the
+    results and updates ratings in matchup order, so results depend only on
+    the seed and not on the number of workers or which batch finishes first.
+    :param strategies: dictionary mapping unique names to BuyStrategy objects
+    :param rents: list of ints or floats representing space rent values
+    :param payout: int or float representing payout amount for GO space
+    :param balance: int or float representing each player's starting balance
+    :param batch_size: int representing games per batch
+    :param min_games: int representing games per matchup before it can stop
+    :param max_games: int representing the most games per matchup
+    :param precision: float representing the half width of the confidence
+                      interval at which a matchup stops
+    :param z: float representing the normal quantile of the confidence level
+    :param workers: int representing the number of processes (None for one
+                    per core, 0 to play every batch in this process)
+    :param seed: int representing the tournament seed
+    :param max_turns: int representing the maximum number of moves per game
+    :param k: int or float representing the Elo update factor per game
+    :return: tuple of (EloRatings, list of Matchup class objects)
+    """
+    ratings = EloRatings(strategies, k=k)
+    matchups = [Matchup(first, second) for first, second in combinations(strategies, 2)]
+    batches = 0
+    pool = None if workers == 0 else ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        while True:
+            active = [matchup for matchup in matchups
+                      if matchup.get_games() < max_games
+                      and not matchup.is_decided(precision, z, min_games)]
+
+            if len(active) == 0:
+                break
+
+            jobs = []
+
+            for matchup in active:
+                first, second = matchup.get_names()
+                games = min(batch_size, max_games - matchup.get_games())
+                jobs.append((rents, payout, balance,
+                             (first, strategies[first]), (second, strategies[second]),
+                             games, shard_seed(seed, batches), max_turns))
+                batches += 1
+
+            if pool is None:
+                results = [play_batch(*job) for job in jobs]
+            else:
+                futures = [pool.submit(play_batch, *job) for job in jobs]
+                results = [future.result() for future in futures]
+
+            for matchup, (wins, losses, draws) in zip(active, results):
+                first, second = matchup.get_names()
+                matchup.add_batch(wins, losses, draws)
+                ratings.update(first, second, wins + 0.5 * draws, wins + losses + draws)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return ratings, matchups
+
+
+def main():
+    """
+    Command line entry point. Rates the built in strategies on a board with
+    the passed rents and prints ratings and matchup records.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Rate buying strategies with Elo")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--payout", type=float, default=50)
+    parser.add_argument("--balance", type=float, default=1500)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--max-games", type=int, default=1000)
+    parser.add_argument("--precision", type=float, default=0.05)
+    parser.add_argument("--max-turns", type=int, default=10000)
+    parser.add_argument("--rents", type=float, nargs="+",
+                        default=[50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+                                 200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350])
+    args = parser.parse_args()
+
+    strategies = {}
+
+    for strategy in (AlwaysBuy(), ThresholdBuy(200), ThresholdBuy(600),
+                     ROIBuy(125), RandomBuy(0.5)):
+        strategies[strategy.get_name()] = strategy
+
+    ratings, matchups = run_round_robin(strategies, args.rents, args.payout, args.balance,
+                                        args.batch_size, max_games=args.max_games,
+                                        precision=args.precision, workers=args.workers,
+                                        seed=args.seed, max_turns=args.max_turns)
+
+    for name, rating in ratings.get_ratings():
+        print(f"{name:20} {rating:7.1f}")
+
+    print()
+
+    for matchup in matchups:
+        first, second = matchup.get_names()
+        wins, losses, draws = matchup.get_record()
+        low, high = matchup.interval()
+        print(f"{first} vs {second}: {wins}-{losses}-{draws} "
+              f"score {matchup.get_score():.3f} [{low:.3f}, {high:.3f}]")
+
+
+if __name__ == "__main__":
+    main()
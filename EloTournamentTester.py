@@ -0,0 +1,105 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for EloTournament.py. Checks Elo updates, the
+#                   stopping rule of a matchup, and that a round robin's
+#                   results depend only on its seed, not on the number of
+#                   worker processes.
+
+
+import unittest
+
+from EloTournament import EloRatings, Matchup, play_batch, run_round_robin
+from Strategies import AlwaysBuy, ROIBuy, ThresholdBuy
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+
+def make_strategies():
+    """
+    Creates a small set of named strategies.
+    :return: dictionary mapping names to BuyStrategy class objects
+    """
+    strategies = {}
+
+    for strategy in (AlwaysBuy(), ThresholdBuy(600), ROIBuy(125)):
+        strategies[strategy.get_name()] = strategy
+
+    return strategies
+
+
+class TestEloTournament(unittest.TestCase):
+    """Contains unit tests for EloTournament"""
+
+    def test_ratings(self):
+        """Updates move ratings by k times the surprise and keep their sum"""
+        ratings = EloRatings(["A", "B"], initial=1500, k=10)
+        self.assertEqual(ratings.expected("A", "B"), 0.5)
+
+        ratings.update("A", "B", 3, 4)
+        self.assertEqual(ratings.get_rating("A"), 1510)
+        self.assertEqual(ratings.get_rating("B"), 1490)
+        self.assertEqual(ratings.get_ratings(), [("A", 1510), ("B", 1490)])
+        self.assertGreater(ratings.expected("A", "B"), 0.5)
+        self.assertAlmostEqual(ratings.expected("A", "B") + ratings.expected("B", "A"), 1)
+
+    def test_matchup(self):
+        """Scores, intervals, and the stopping rule follow the record"""
+        matchup = Matchup("A", "B")
+        self.assertEqual(matchup.get_score(), 0.5)
+        self.assertEqual(matchup.interval(), (0.0, 1.0))
+        self.assertFalse(matchup.is_decided(0.05))
+
+        matchup.add_batch(6, 2, 2)
+        self.assertEqual(matchup.get_record(), (6, 2, 2))
+        self.assertEqual(matchup.get_games(), 10)
+        self.assertEqual(matchup.get_score(), 0.7)
+
+        low, high = matchup.interval()
+        self.assertLess(low, 0.7)
+        self.assertGreater(high, 0.7)
+        self.assertFalse(matchup.is_decided(0.05))
+
+        matchup.add_batch(90, 0, 0)         # Clearly better than even
+        self.assertGreater(matchup.interval()[0], 0.5)
+        self.assertTrue(matchup.is_decided(0.0))
+        self.assertFalse(matchup.is_decided(0.0, min_games=200))
+
+    def test_play_batch(self):
+        """A batch plays every game and is reproducible from its seed"""
+        strategies = make_strategies()
+        first = ("AlwaysBuy", strategies["AlwaysBuy"])
+        second = ("ThresholdBuy(600)", strategies["ThresholdBuy(600)"])
+        result = play_batch(RENTS, 50, 1500, first, second, 10, 7, 2000)
+
+        self.assertEqual(sum(result), 10)
+        self.assertEqual(play_batch(RENTS, 50, 1500, first, second, 10, 7, 2000), result)
+
+    def test_round_robin(self):
+        """Results depend on the seed only, not on the number of workers"""
+        strategies = make_strategies()
+        options = {"batch_size": 10, "min_games": 20, "max_games": 40, "seed": 3,
+                   "max_turns": 2000}
+        ratings, matchups = run_round_robin(strategies, RENTS, 50, workers=0, **options)
+
+        self.assertEqual([matchup.get_names() for matchup in matchups],
+                         [("AlwaysBuy", "ThresholdBuy(600)"), ("AlwaysBuy", "ROIBuy(125)"),
+                          ("ThresholdBuy(600)", "ROIBuy(125)")])
+
+        for matchup in matchups:
+            self.assertIn(matchup.get_games(), (20, 30, 40))
+
+        self.assertAlmostEqual(sum(rating for name, rating in ratings.get_ratings()), 4500)
+
+        for workers in (0, 2):
+            again, replayed = run_round_robin(make_strategies(), RENTS, 50, workers=workers,
+                                              **options)
+            self.assertEqual(again.get_ratings(), ratings.get_ratings(), workers)
+            self.assertEqual([matchup.get_record() for matchup in replayed],
+                             [matchup.get_record() for matchup in matchups], workers)
+
+
+if __name__ == "__main__":
+    unittest.main()
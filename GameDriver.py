@@ -0,0 +1,133 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A driver that plays complete games of RealEstateGame.
+#                   Players take turns in the order they were created,
+#                   rolling a die in range [1..6] from a seeded DiceStream
+#                   (see DiceService.py). Each player buys every space they can afford
+#                   unless it was given a strategy from Strategies.py.
+#                   Spaces left unbought can be auctioned (see Auctions.py).
+
+from collections import namedtuple
+
+from Auctions import AuctionHouse
+from DiceService import DiceStream, check_roll
+from GameEvents import EventPublisher
+from RealEstateGame import RealEstateGame
+
+
+# Outcome of one game. winner is "" if the turn limit was reached first.
+# bankruptcies maps each eliminated player's name to the turn it lost.
+GameResult = namedtuple("GameResult", ["winner", "turns", "bankruptcies"])
+
+
+def play_game(rents, payout, players, seed=None, max_turns=10000, dice=None, auction_every=0,
+              history=None, game_id=0, statistics=None):
+    """
+    Plays one complete game. Each turn, the current player rolls, moves, and
+    buys the space they land on if possible and if their strategy agrees.
+    Players with a balance of 0 are skipped. The game ends when
+    check_game_over reports a winner or when max_turns moves have been made.
+    :param rents: list of ints or floats representing space rent values
+    :param payout: int or float representing payout amount for GO space
+    :param players: list of (name, balance) or (name, balance, strategy)
+                    tuples in seating order. strategy is a BuyStrategy
+                    class object; players without one always buy
+    :param seed: int or None used to seed the game's dice
+    :param max_turns: int representing the maximum number of moves
+    :param dice: DiceStream or ReplayStream to roll from instead of a new
+                 stream seeded with seed
+    :param auction_every: int representing the number of moves between
+                          auctions of the spaces landed on but not bought
+                          (0 for no auctions). Players bid with their
+                          strategy's bid method; the richest players
+                          without one bid with Auctions.discount_bidder
+    :param history: HistoryWriter from HistoryExport.py that records the
+                    game's state after every move, or None
+    :param game_id: int identifying the game in history
+    :param statistics: GameStatistics from GameStatistics.py to add the
+                       game's events and result to, or None
+    :return: GameResult namedtuple
+    :raises ValueError: if dice returns a roll that is not an int in range
+                        [1..6]
+    """
+    if dice is None:
+        dice = DiceStream(seed)
+
+    roll = dice.roll
+    game = RealEstateGame()
+    game.create_spaces(payout, rents)
+
+    strategies = {}
+    auctions = AuctionHouse(game) if auction_every > 0 else None
+
+    for player in players:
+        game.create_player(player[0], player[1])
+
+        if len(player) > 2 and player[2] is not None:
+            strategies[player[0]] = player[2]
+
+            if auctions is not None:
+                auctions.set_bidder(player[0], player[2].bid)
+
+    if statistics is not None:                  # Follow the game's events
+        publisher = EventPublisher()
+        game.set_publisher(publisher)
+        events = publisher.subscribe()
+
+    names = [player[0] for player in players]
+    bankruptcies = {}
+    turns = 0
+    winner = game.check_game_over()
+
+    while winner == "" and turns < max_turns:
+        round_start = turns
+
+        for name in names:
+            if game.get_player_account_balance(name) == 0:
+                continue                        # Skip players that have lost
+
+            game.move_player(name, check_roll(roll()))
+            strategy = strategies.get(name)
+
+            if strategy is None:
+                game.buy_space(name)
+            else:
+                pos = game.get_player_current_position(name)
+                space = game.get_space(pos)
+
+                # Only ask the strategy when buy_space would succeed
+                if (pos != 0 and space.get_owner() is None
+                        and space.get_price() <= game.get_player_account_balance(name)
+                        and strategy.should_buy(game, name, space)):
+                    game.buy_space(name)
+            turns += 1
+
+            if game.get_player_account_balance(name) == 0:
+                bankruptcies[name] = turns
+            elif auctions is not None:          # Auction the space if not bought
+                auctions.open(game.get_player_current_position(name))
+
+            if auctions is not None and turns % auction_every == 0:
+                auctions.clear()                # Never leaves a winner at 0
+
+            if history is not None:
+                history.record(game_id, turns, game)
+
+            if statistics is not None:
+                statistics.add_events(events.drain())
+
+            winner = game.check_game_over()
+
+            if winner != "" or turns >= max_turns:
+                break
+
+        if turns == round_start:                # Stop if nobody can move
+            break
+
+    result = GameResult(winner, turns, bankruptcies)
+
+    if statistics is not None:
+        statistics.add_result(result, players)
+
+    return result
@@ -0,0 +1,382 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A stream of changes made to a RealEstateGame, so viewers
+#                   can follow a game without reading its whole state after
+#                   every move. An EventPublisher attached with
+#                   RealEstateGame.set_publisher receives typed events from
+#                   create_player, move_player, and buy_space and hands them
+#                   to each Subscription. A subscription holds a bounded
+#                   buffer and is read as a generator or from asyncio. When
+#                   the buffer is full, its policy drops the oldest event,
+#                   merges the new event into a pending one, or makes the
+#                   publisher wait.
+
+import asyncio
+import threading
+from collections import deque, namedtuple
+
+
+# Every event starts with the publisher's sequence number, which increases by
+# 1 per event, so a subscriber can tell that events were dropped. Spaces are
+# identified by board index; released spaces by property name.
+PlayerCreated = namedtuple("PlayerCreated", ["sequence", "name", "balance"])
+Moved = namedtuple("Moved", ["sequence", "name", "old", "new"])
+GoPayout = namedtuple("GoPayout", ["sequence", "name", "amount", "balance"])
+RentPaid = namedtuple("RentPaid", ["sequence", "payer", "owner", "space", "charged", "rent",
+                                   "payer_balance", "owner_balance"])
+Purchased = namedtuple("Purchased", ["sequence", "name", "space", "price", "balance"])
+Bankrupt = namedtuple("Bankrupt", ["sequence", "name", "released"])
+Won = namedtuple("Won", ["sequence", "name"])
+
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+BLOCK = "block"
+POLICIES = (DROP_OLDEST, COALESCE, BLOCK)
+
+
+def event_to_dict(event):
+    """
+    Converts an event to a JSON friendly dictionary.
+    :param event: event namedtuple
+    :return: dictionary with the event's type name under "type"
+    """
+    data = event._asdict()
+    data["type"] = type(event).__name__
+
+    if isinstance(event, Bankrupt):
+        data["released"] = list(event.released)
+
+    return data
+
+
+def coalesce_key(event):
+    """
+    Finds the key under which an event can be merged with an earlier one.
+    Moves of a player merge into one move from the first start to the last
+    end; GO payouts of a player and rent between the same two players on the
+    same space merge by adding amounts. Other events are never merged.
+    :param event: event namedtuple
+    :return: hashable key, or None if the event can't be merged
+    """
+    kind = type(event)
+
+    if kind is Moved or kind is GoPayout:
+        return kind, event.name
+
+    if kind is RentPaid:
+        return kind, event.payer, event.owner, event.space
+
+    return None
+
+
+def merge(pending, event):
+    """
+    Merges a newer event into a pending event with the same coalesce_key.
+    :return: merged event namedtuple carrying the newer sequence number
+    """
+    kind = type(event)
+
+    if kind is Moved:
+        return event._replace(old=pending.old)
+
+    if kind is GoPayout:
+        return event._replace(amount=pending.amount + event.amount)
+
+    return event._replace(charged=pending.charged + event.charged,
+                          rent=pending.rent + event.rent)
+
+
+class Subscription:
+    """
+    Represents one subscriber's bounded buffer of events. Safe to read from
+    another thread than the one playing the game. Read it with get, with a
+    for loop, with get_async, or with async for.
+    """
+    def __init__(self, publisher, maxsize, policy):
+        """
+        Use EventPublisher.subscribe to create subscriptions.
+        :param publisher: EventPublisher class object
+        :param maxsize: int representing the most events buffered
+        :param policy: DROP_OLDEST, COALESCE, or BLOCK
+        """
+        self._publisher = publisher
+        self._maxsize = maxsize
+        self._policy = policy
+        self._buffer = deque()
+        self._slots = {}                # Maps coalesce keys to buffer slots
+        self._condition = threading.Condition()
+        self._closed = False
+        self._dropped = 0
+        self._waiter = None             # (loop, future) of a waiting get_async
+        self._loop_thread = None        # Thread of the asyncio reader, if any
+
+    def get_dropped(self):
+        """
+        Getter for dropped
+        :return: int representing events lost to a full buffer
+        """
+        return self._dropped
+
+    def __len__(self):
+        """
+        :return: int representing the number of buffered events
+        """
+        return len(self._buffer)
+
+    def _offer(self, event):
+        """
+        Buffers an event, applying the policy if the buffer is full. Called
+        by EventPublisher.publish.
+        """
+        with self._condition:
+            if self._closed:
+                return
+
+            if len(self._buffer) >= self._maxsize:
+                if self._policy == BLOCK:
+                    # Wait for the reader, unless this is the thread of an
+                    # asyncio reader, which could never run while waiting.
+                    # That thread drops the oldest event instead
+                    while (len(self._buffer) >= self._maxsize and not self._closed
+                           and threading.get_ident() != self._loop_thread):
+                        self._condition.wait()
+
+                    if self._closed:
+                        return
+
+                    if len(self._buffer) >= self._maxsize:
+                        self._drop_oldest()
+                elif self._policy == COALESCE and self._coalesce(event):
+                    return
+                else:
+                    self._drop_oldest()
+
+            slot = [event]
+            self._buffer.append(slot)
+
+            if self._policy == COALESCE:
+                key = coalesce_key(event)
+
+                if key is not None:
+                    self._slots[key] = slot
+
+            self._condition.notify_all()
+            self._wake()
+
+    def _coalesce(self, event):
+        """
+        Helper for _offer. Merges an event into a buffered one with the same
+        key, if there is one.
+        :return: True if the event was merged
+        """
+        key = coalesce_key(event)
+        slot = self._slots.get(key) if key is not None else None
+
+        if slot is None:
+            return False
+
+        slot[0] = merge(slot[0], event)
+        self._dropped += 1
+
+        return True
+
+    def _drop_oldest(self):
+        """
+        Helper for _offer. Discards the oldest buffered event.
+        """
+        self._pop()
+        self._dropped += 1
+
+    def _pop(self):
+        """
+        Removes and returns the oldest buffered event. Caller holds the
+        condition.
+        """
+        slot = self._buffer.popleft()
+
+        if self._slots:
+            key = coalesce_key(slot[0])
+
+            if key is not None and self._slots.get(key) is slot:
+                del self._slots[key]
+
+        self._condition.notify_all()    # Wake a blocked publisher
+
+        return slot[0]
+
+    def _wake(self):
+        """
+        Resolves a waiting get_async. Caller holds the condition.
+        """
+        if self._waiter is not None:
+            loop, future = self._waiter
+            self._waiter = None
+            loop.call_soon_threadsafe(_resolve, future)
+
+    def get(self, timeout=None):
+        """
+        Waits for the next event.
+        :param timeout: float representing seconds to wait (None for no limit)
+        :return: event namedtuple, or None if closed or timed out
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._buffer or self._closed, timeout):
+                return None
+
+            if self._buffer:
+                return self._pop()
+
+            return None
+
+    def drain(self):
+        """
+        Takes every buffered event without waiting.
+        :return: list of event namedtuples, oldest first
+        """
+        with self._condition:
+            events = [self._pop() for _ in range(len(self._buffer))]
+
+        return events
+
+    def __iter__(self):
+        """
+        Yields events as they arrive until the subscription is closed.
+        """
+        while True:
+            event = self.get()
+
+            if event is None:
+                return
+
+            yield event
+
+    async def get_async(self):
+        """
+        Waits for the next event without blocking the event loop.
+        :return: event namedtuple, or None if closed
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            with self._condition:
+                self._loop_thread = threading.get_ident()
+
+                if self._buffer:
+                    return self._pop()
+
+                if self._closed:
+                    return None
+
+                future = loop.create_future()
+                self._waiter = (loop, future)
+
+            await future
+
+    def __aiter__(self):
+        """
+        :return: this subscription, read with async for until closed
+        """
+        return self
+
+    async def __anext__(self):
+        """
+        :return: next event namedtuple
+        """
+        event = await self.get_async()
+
+        if event is None:
+            raise StopAsyncIteration
+
+        return event
+
+    def close(self):
+        """
+        Stops receiving events. Readers get the events still buffered, then
+        None or the end of iteration.
+        :return: None
+        """
+        self._publisher.unsubscribe(self)
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            self._wake()
+
+
+def _resolve(future):
+    """
+    Helper for Subscription._wake. Runs on the reader's event loop.
+    """
+    if not future.done():
+        future.set_result(None)
+
+
+class EventPublisher:
+    """
+    Represents the source of a game's events. Events are only created while
+    someone is subscribed.
+    """
+    def __init__(self):
+        """
+        Creates a publisher with no subscribers.
+        """
+        self._subscriptions = []
+        self._sequence = 0
+
+    def subscribe(self, maxsize=1024, policy=DROP_OLDEST):
+        """
+        Creates a subscription that receives every later event.
+        :param maxsize: int representing the most events buffered
+        :param policy: DROP_OLDEST to discard the oldest event when full,
+                       COALESCE to merge the new event into a buffered one
+                       (see coalesce_key) and otherwise drop the oldest, or
+                       BLOCK to make the game wait for the reader (a game
+                       played on the thread of an asyncio reader can't
+                       wait, so there the oldest event is dropped)
+        :return: Subscription class object
+        :raises ValueError: if the policy is unknown or maxsize is less than 1
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"unknown policy {policy!r}")
+
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        subscription = Subscription(self, maxsize, policy)
+        self._subscriptions = self._subscriptions + [subscription]
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Stops sending events to a subscription.
+        :param subscription: Subscription class object
+        :return: None
+        """
+        self._subscriptions = [other for other in self._subscriptions
+                               if other is not subscription]
+
+    def get_subscriber_count(self):
+        """
+        Getter for subscriber count
+        :return: int representing the number of subscriptions
+        """
+        return len(self._subscriptions)
+
+    def publish(self, kind, *fields):
+        """
+        Creates an event and offers it to every subscription. Called by
+        RealEstateGame.
+        :param kind: event namedtuple class
+        :param fields: values of the event's fields after sequence
+        :return: None
+        """
+        subscriptions = self._subscriptions
+
+        if subscriptions:
+            self._sequence += 1
+            event = kind(self._sequence, *fields)
+
+            for subscription in subscriptions:
+                subscription._offer(event)
@@ -0,0 +1,558 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      An append-only binary journal of the calls made on a
+#                   RealEstateGame. Every call to create_spaces,
+#                   create_player, buy_space, and move_player is written as
+#                   one or more fixed-width 20 byte frames. Writes are
+#                   buffered and synced to disk in batches. Periodic
+#                   checkpoints store the full game state so a game can be
+#                   recovered without replaying it from the first turn.
+#                   Journals are read back with generators that never hold
+#                   more than one chunk of the file in memory.
+
+import os
+import struct
+
+from RealEstateGame import RealEstateGame, GameSnapshot, LazyBoard
+
+
+# Frame layout: opcode, value type, 2 pad bytes, int a, int b, 8 byte value
+FRAME = struct.Struct("<BBxxii8s")
+FRAME_SIZE = FRAME.size
+INT_VALUE = struct.Struct("<q")
+FLOAT_VALUE = struct.Struct("<d")
+OFFSET = struct.Struct("<Q")
+
+# Opcodes
+SPACES = 1          # a: number of RENT frames that follow, b: 1 if lazy board
+                    # plus 2 per GROUP that follows the rents, value: GO payout
+RENT = 2            # value: rent of the next property space
+PLAYER = 3          # a: player id, b: name length in bytes, value: balance
+BUY = 4             # a: player id
+MOVE = 5            # a: player id, b: spaces
+CHECKPOINT = 6      # a: number of frames in the checkpoint, b: sequence number
+STATE = 7           # a: player id, b: position, value: balance
+OWNER = 8           # a: space index, b: owner player id
+GROUP = 9           # a: number of MEMBER frames that follow, value: multiplier
+MEMBER = 10         # a: property index
+AWARD = 11          # a: player id, b: space index, value: price
+
+# Value types
+NONE_TYPE = 0
+INT_TYPE = 1
+FLOAT_TYPE = 2
+
+
+def pack_frame(opcode, a=0, b=0, value=None):
+    """
+    Packs one frame. Ints and floats are stored so they are read back with
+    the same type.
+    :param opcode: int representing the frame's opcode
+    :param a: int representing the first argument
+    :param b: int representing the second argument
+    :param value: int, float, or None representing the frame's value
+    :return: bytes of length FRAME_SIZE
+    """
+    if value is None:
+        return FRAME.pack(opcode, NONE_TYPE, a, b, bytes(8))
+
+    if isinstance(value, int):
+        return FRAME.pack(opcode, INT_TYPE, a, b, INT_VALUE.pack(value))
+
+    return FRAME.pack(opcode, FLOAT_TYPE, a, b, FLOAT_VALUE.pack(value))
+
+
+def unpack_frame(data, offset=0):
+    """
+    Unpacks one frame.
+    :param data: bytes containing the frame
+    :param offset: int representing where the frame starts in data
+    :return: tuple of (opcode, a, b, value)
+    """
+    opcode, value_type, a, b, raw = FRAME.unpack_from(data, offset)
+
+    if value_type == INT_TYPE:
+        value = INT_VALUE.unpack(raw)[0]
+    elif value_type == FLOAT_TYPE:
+        value = FLOAT_VALUE.unpack(raw)[0]
+    else:
+        value = None
+
+    return opcode, a, b, value
+
+
+def take_frames(frames, count):
+    """
+    Reads a number of frames. Uses a plain loop, so a record cut off by the
+    end of the file raises StopIteration, which read_records treats as the
+    end of the journal; next() in a generator expression would raise
+    RuntimeError instead.
+    :param frames: iterator of frames
+    :param count: int representing the number of frames to read
+    :return: list of bytes objects
+    """
+    taken = []
+
+    for _ in range(count):
+        taken.append(next(frames))
+
+    return taken
+
+
+def pack_spaces(payout, rents, lazy, groups):
+    """
+    Packs the frames of a call to create_spaces.
+    :param payout: int or float representing payout amount for GO space
+    :param rents: list of ints or floats representing space rent values
+    :param lazy: True if the board creates Property objects on first access
+    :param groups: sequence of (property indices, multiplier) tuples
+    :return: list of bytes objects
+    """
+    frames = [pack_frame(SPACES, len(rents), int(lazy) | len(groups) << 1, payout)]
+    frames.extend(pack_frame(RENT, 0, 0, rent) for rent in rents)
+
+    for indices, multiplier in groups:
+        frames.append(pack_frame(GROUP, len(indices), 0, multiplier))
+        frames.extend(pack_frame(MEMBER, index) for index in indices)
+
+    return frames
+
+
+def read_spaces(frames, a, b):
+    """
+    Reads the frames that follow a SPACES frame.
+    :param frames: iterator of frames positioned after the SPACES frame
+    :param a: int representing the SPACES frame's first argument
+    :param b: int representing the SPACES frame's second argument
+    :return: tuple of (list of rents, list of (indices, multiplier) tuples,
+             int representing the number of frames read)
+    """
+    rents = [unpack_frame(frame)[3] for frame in take_frames(frames, a)]
+    groups = []
+    count = a
+
+    for _ in range(b >> 1):
+        opcode, members, unused, multiplier = unpack_frame(next(frames))
+        indices = tuple(unpack_frame(frame)[1] for frame in take_frames(frames, members))
+        groups.append((indices, multiplier))
+        count += members + 1
+
+    return rents, groups, count
+
+
+def pack_name(name):
+    """
+    Packs a player name into whole frames, padding the last one with zeros.
+    :param name: string representing player name
+    :return: tuple of (name length in bytes, padded bytes)
+    """
+    encoded = name.encode("utf-8")
+    frames = -(-len(encoded) // FRAME_SIZE)
+
+    return len(encoded), encoded.ljust(frames * FRAME_SIZE, b"\0")
+
+
+class GameJournal:
+    """
+    Represents a journal file being written for one game. Attach it with
+    RealEstateGame.set_journal. Players are identified in frames by a small
+    integer id assigned when they are created. Each checkpoint reassigns ids
+    to the players' seating order. The offset of every checkpoint is
+    appended to an index file next to the journal so recovery can seek
+    straight to the latest one. The game records each call after applying
+    it, so a checkpoint written when the call is recorded already holds the
+    call's effects.
+    """
+    def __init__(self, path, buffer_size=65536, fsync_every=16, checkpoint_every=10000):
+        """
+        Opens a journal file for appending.
+        :param path: string representing the journal's file path
+        :param buffer_size: int representing how many bytes are buffered
+                            before they are written to the file
+        :param fsync_every: int representing how many buffer writes happen
+                            between calls to os.fsync
+        :param checkpoint_every: int representing how many calls are
+                                 recorded between checkpoints
+        """
+        self._file = open(path, "ab")
+        self._index = open(path + ".idx", "ab")
+        self._offset = self._file.tell()
+        self._buffer = bytearray()
+        self._pending = []              # Checkpoint offsets not yet written
+        self._buffer_size = buffer_size
+        self._fsync_every = fsync_every
+        self._writes = 0
+        self._checkpoint_every = checkpoint_every
+        self._since_checkpoint = 0
+        self._sequence = 0
+        self._ids = {}
+        self._game = None
+
+    def attach(self, game):
+        """
+        Starts recording a game. If the game already has a board or players,
+        a checkpoint is written first so the journal describes its state.
+        Called by RealEstateGame.set_journal.
+        :param game: RealEstateGame class object
+        :return: None
+        """
+        self._game = game
+
+        if len(game._board) > 0 or len(game._players) > 0 or self._offset > 0:
+            self.checkpoint()
+
+    def _append(self, data):
+        """
+        Adds frames to the buffer and writes the buffer if it is full.
+        :param data: bytes made of whole frames
+        :return: None
+        """
+        self._buffer += data
+        self._offset += len(data)
+
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def _recorded(self):
+        """
+        Counts a recorded call and writes a checkpoint when one is due.
+        :return: None
+        """
+        self._since_checkpoint += 1
+
+        if self._since_checkpoint >= self._checkpoint_every:
+            self.checkpoint()
+
+    def record_spaces(self, payout, rents, lazy=False, groups=()):
+        """
+        Records a call to create_spaces.
+        :param payout: int or float representing payout amount for GO space
+        :param rents: list of ints or floats representing space rent values
+        :param lazy: True if the board creates Property objects on first access
+        :param groups: sequence of (property indices, multiplier) tuples
+        :return: None
+        """
+        self._append(b"".join(pack_spaces(payout, rents, lazy, groups)))
+        self._recorded()
+
+    def record_player(self, name, balance):
+        """
+        Records a call to create_player that added a player.
+        :param name: string representing player name
+        :param balance: int or float representing player starting balance
+        :return: None
+        """
+        player_id = len(self._ids)
+        self._ids[name] = player_id
+        length, encoded = pack_name(name)
+        self._append(pack_frame(PLAYER, player_id, length, balance) + encoded)
+        self._recorded()
+
+    def record_buy(self, name):
+        """
+        Records a call to buy_space.
+        :param name: string representing player name
+        :return: None
+        """
+        player_id = self._ids.get(name)
+
+        if player_id is not None:       # Ignore players the journal never saw
+            self._append(pack_frame(BUY, player_id))
+            self._recorded()
+
+    def record_award(self, name, index, price):
+        """
+        Records a call to award_space.
+        :param name: string representing player name
+        :param index: int representing the space's index on the board
+        :param price: int or float representing the amount paid
+        :return: None
+        """
+        player_id = self._ids.get(name)
+
+        if player_id is not None:       # Ignore players the journal never saw
+            self._append(pack_frame(AWARD, player_id, index, price))
+            self._recorded()
+
+    def record_move(self, name, spaces):
+        """
+        Records a call to move_player.
+        :param name: string representing player name
+        :param spaces: int representing spaces to move
+        :return: None
+        """
+        player_id = self._ids.get(name)
+
+        if player_id is not None:       # Ignore players the journal never saw
+            self._append(pack_frame(MOVE, player_id, spaces))
+            self._recorded()
+
+    def checkpoint(self):
+        """
+        Writes the attached game's full state. Player ids are reassigned to
+        the seating order of the snapshot.
+        :return: None
+        """
+        snapshot = self._game.snapshot()
+        payout, rents, names, groups = snapshot.layout
+        lazy = isinstance(self._game._board, LazyBoard)
+        frames = []
+
+        if payout is not None:
+            frames.extend(pack_spaces(payout, rents, lazy, groups))
+
+        for seat, name in enumerate(names):
+            length, encoded = pack_name(name)
+            frames.append(pack_frame(PLAYER, seat, length, snapshot.balances[seat]))
+            frames.append(encoded)
+
+        for seat in range(len(names)):
+            frames.append(pack_frame(STATE, seat, snapshot.positions[seat],
+                                     snapshot.balances[seat]))
+
+        for index, seat in enumerate(snapshot.owners):
+            if seat >= 0:
+                frames.append(pack_frame(OWNER, index, seat))
+
+        payload = b"".join(frames)
+        self._sequence += 1
+        self._pending.append(self._offset)
+        self._append(pack_frame(CHECKPOINT, len(payload) // FRAME_SIZE, self._sequence) + payload)
+
+        self._ids = {name: seat for seat, name in enumerate(names)}
+        self._since_checkpoint = 0
+
+    def flush(self):
+        """
+        Writes buffered frames to the journal file, then the offsets of any
+        checkpoints they contain to the index file. Calls os.fsync on both
+        files every fsync_every writes.
+        :return: None
+        """
+        if len(self._buffer) > 0:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer = bytearray()
+
+            for offset in self._pending:
+                self._index.write(OFFSET.pack(offset))
+
+            self._index.flush()
+            self._pending = []
+            self._writes += 1
+
+            if self._writes % self._fsync_every == 0:
+                os.fsync(self._file.fileno())
+                os.fsync(self._index.fileno())
+
+    def sync(self):
+        """
+        Writes buffered frames and forces both files to disk.
+        :return: None
+        """
+        self.flush()
+        os.fsync(self._file.fileno())
+        os.fsync(self._index.fileno())
+
+    def close(self):
+        """
+        Syncs and closes the journal and detaches it from its game.
+        :return: None
+        """
+        self.sync()
+        self._file.close()
+        self._index.close()
+
+        if self._game is not None:
+            self._game.set_journal(None)
+            self._game = None
+
+
+def read_frames(path, start=0, chunk_frames=4096):
+    """
+    Generator over the frames of a journal file, read one chunk at a time.
+    Name data is yielded as raw frames after the PLAYER frame it belongs to.
+    A partly written frame at the end of the file is ignored.
+    :param path: string representing the journal's file path
+    :param start: int representing the byte offset of the first frame
+    :param chunk_frames: int representing how many frames are read at once
+    :return: generator of bytes objects, one per frame
+    """
+    with open(path, "rb") as journal:
+        journal.seek(start)
+
+        while True:
+            chunk = journal.read(chunk_frames * FRAME_SIZE)
+
+            for offset in range(0, len(chunk) - FRAME_SIZE + 1, FRAME_SIZE):
+                yield chunk[offset:offset + FRAME_SIZE]
+
+            if len(chunk) < chunk_frames * FRAME_SIZE:
+                return
+
+
+def read_records(path, start=0):
+    """
+    Generator over the calls recorded in a journal. Yields tuples of:
+        ("create_spaces", payout, rents, lazy, groups)
+        ("create_player", name, balance)
+        ("buy_space", name)
+        ("award_space", name, index, price)
+        ("move_player", name, spaces)
+        ("checkpoint", GameSnapshot, lazy, groups)
+    A record cut off by the end of the file is not yielded.
+    :param path: string representing the journal's file path
+    :param start: int representing the byte offset of the first record
+    :return: generator of tuples
+    """
+    frames = read_frames(path, start)
+    names = []
+
+    def read_name(length):
+        """Reads the frames holding a name of the passed length"""
+        data = b"".join(take_frames(frames, -(-length // FRAME_SIZE)))
+        return data[:length].decode("utf-8")
+
+    try:
+        for frame in frames:
+            opcode, a, b, value = unpack_frame(frame)
+
+            if opcode == SPACES:
+                rents, groups, count = read_spaces(frames, a, b)
+                yield "create_spaces", value, rents, b & 1 == 1, groups
+            elif opcode == PLAYER:
+                name = read_name(b)
+                names.append(name)
+                yield "create_player", name, value
+            elif opcode == BUY:
+                yield "buy_space", names[a]
+            elif opcode == AWARD:
+                yield "award_space", names[a], b, value
+            elif opcode == MOVE:
+                yield "move_player", names[a], b
+            elif opcode == CHECKPOINT:
+                snapshot, names, lazy, groups = read_checkpoint(frames, a)
+                yield "checkpoint", snapshot, lazy, groups
+    except StopIteration:               # Record cut off by a crash
+        return
+
+
+def read_checkpoint(frames, count):
+    """
+    Reads the frames of a checkpoint into a GameSnapshot.
+    :param frames: iterator of frames positioned after the CHECKPOINT frame
+    :param count: int representing the number of frames in the checkpoint
+    :return: tuple of (GameSnapshot, list of player names by id,
+             True if the board is lazy, list of (indices, multiplier) tuples)
+    """
+    lazy = False
+    payout = None
+    rents = []
+    groups = []
+    names = []
+    balances = []
+    positions = []
+    owners = None
+    remaining = count
+
+    while remaining > 0:
+        opcode, a, b, value = unpack_frame(next(frames))
+        remaining -= 1
+
+        if opcode == SPACES:
+            payout = value
+            lazy = b & 1 == 1
+            rents, groups, count = read_spaces(frames, a, b)
+            remaining -= count
+            owners = [-1] * (a + 1)
+        elif opcode == PLAYER:
+            chunks = -(-b // FRAME_SIZE)
+            data = b"".join(take_frames(frames, chunks))
+            names.append(data[:b].decode("utf-8"))
+            remaining -= chunks
+        elif opcode == STATE:
+            positions.append(b)
+            balances.append(value)
+        elif opcode == OWNER:
+            owners[a] = b
+
+    snapshot = GameSnapshot((payout, tuple(rents), tuple(names), tuple(groups)), tuple(balances),
+                            tuple(positions), tuple(owners if owners is not None else [-1]))
+
+    return snapshot, names, lazy, groups
+
+
+def last_checkpoint(path):
+    """
+    Finds the offset of the latest complete checkpoint using the index file.
+    :param path: string representing the journal's file path
+    :return: int representing the checkpoint's byte offset (0 if none)
+    """
+    if not os.path.exists(path + ".idx"):
+        return 0
+
+    size = os.path.getsize(path)
+
+    with open(path + ".idx", "rb") as index:
+        data = index.read()
+
+    for end in range(len(data) - len(data) % OFFSET.size, 0, -OFFSET.size):
+        offset = OFFSET.unpack_from(data, end - OFFSET.size)[0]
+
+        if offset + FRAME_SIZE > size:
+            continue
+
+        with open(path, "rb") as journal:
+            journal.seek(offset)
+            opcode, a, b, value = unpack_frame(journal.read(FRAME_SIZE))
+
+        if opcode == CHECKPOINT and offset + (a + 1) * FRAME_SIZE <= size:
+            return offset
+
+    return 0
+
+
+def replay_steps(path, resume=True):
+    """
+    Generator that rebuilds a game from a journal one record at a time.
+    Yields the game after each record is applied.
+    :param path: string representing the journal's file path
+    :param resume: True to start from the latest checkpoint, False to
+                   replay every record from the start of the journal
+    :return: generator of (record tuple, RealEstateGame class object)
+    """
+    game = RealEstateGame()
+    start = last_checkpoint(path) if resume else 0
+
+    for record in read_records(path, start):
+        kind = record[0]
+
+        if kind == "checkpoint":
+            snapshot, lazy, groups = record[1:]
+            payout, rents, names, groups = snapshot.layout
+
+            if lazy and payout is not None:         # Restore keeps a board with
+                game.create_spaces(payout, rents, lazy, groups)     # matching rents
+
+            game.restore(snapshot)
+        else:
+            getattr(game, kind)(*record[1:])
+
+        yield record, game
+
+
+def replay(path, resume=True):
+    """
+    Rebuilds a game from a journal.
+    :param path: string representing the journal's file path
+    :param resume: True to start from the latest checkpoint, False to
+                   replay every record from the start of the journal
+    :return: RealEstateGame class object
+    """
+    game = RealEstateGame()
+
+    for record, game in replay_steps(path, resume):
+        pass
+
+    return game
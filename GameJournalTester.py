@@ -0,0 +1,105 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for GameJournal.py. Plays seeded games with a
+#                   journal attached and checks that replaying the journal,
+#                   from the start or from the latest checkpoint, rebuilds
+#                   exactly the live game's state.
+
+
+import os
+import random
+import tempfile
+import unittest
+
+from GameJournal import GameJournal, read_records, replay
+from RealEstateGame import RealEstateGame
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+
+class TestGameJournal(unittest.TestCase):
+    """Contains round trip tests for GameJournal"""
+
+    def setUp(self):
+        """Creates a directory for journal files"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "game.journal")
+
+    def tearDown(self):
+        """Removes the journal files"""
+        self.directory.cleanup()
+
+    def play(self, seed, checkpoint_every, turns=300):
+        """
+        Plays a seeded game with a journal attached.
+        :return: RealEstateGame class object in its final state
+        """
+        rng = random.Random(seed)
+        game = RealEstateGame()
+        journal = GameJournal(self.path, checkpoint_every=checkpoint_every)
+        game.set_journal(journal)
+        game.create_spaces(50, RENTS)
+
+        for seat in range(3):
+            game.create_player(f"Player {seat}", 1000)
+
+        for turn in range(turns):
+            name = f"Player {turn % 3}"
+            game.move_player(name, rng.randint(1, 6))
+
+            if rng.random() < 0.5:
+                game.buy_space(name)
+
+            if rng.random() < 0.05:
+                game.award_space(name, rng.randint(1, len(RENTS)), rng.randint(1, 200))
+
+        journal.close()
+
+        return game
+
+    def test_replay_equals_live_state(self):
+        """Replay matches the live game for every checkpoint interval"""
+        for seed in range(10):
+            for checkpoint_every in (1, 2, 3, 7, 10000):
+                game = self.play(seed, checkpoint_every)
+
+                for resume in (False, True):
+                    self.assertEqual(replay(self.path, resume).snapshot(), game.snapshot(),
+                                     (seed, checkpoint_every, resume))
+
+                os.remove(self.path)
+                os.remove(self.path + ".idx")
+
+    def test_cut_off_records_are_dropped(self):
+        """A journal cut off at any byte replays the complete records only"""
+        game = RealEstateGame()
+        journal = GameJournal(self.path, checkpoint_every=4)
+        game.set_journal(journal)
+        game.create_spaces(50, RENTS, groups=[([1, 2, 3], 2), ([4, 5, 6], 2)])
+        game.create_player("A player with a name longer than one frame", 1000)
+        game.create_player("Player 2", 1000)
+
+        for turn in range(6):
+            game.move_player("Player 2", 3)
+            game.buy_space("Player 2")
+
+        journal.close()
+
+        complete = list(read_records(self.path))
+
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        for end in range(len(data)):
+            with open(self.path, "wb") as file:
+                file.write(data[:end])
+
+            records = list(read_records(self.path))
+            self.assertEqual(records, complete[:len(records)])
+
+
+if __name__ == "__main__":
+    unittest.main()
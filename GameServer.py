@@ -0,0 +1,391 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      An asyncio server that hosts many RealEstateGame tables.
+#                   Clients connect over a local TCP socket and send one JSON
+#                   command per line. Commands for the same table are run in
+#                   the order they arrive; commands for different tables are
+#                   handled independently.
+#
+#                   Command:  {"id": 1, "table": "t1", "op": "move_player",
+#                              "args": {"name": "Player 1", "spaces": 4}}
+#                   Response: {"id": 1, "ok": true, "result": null}
+#                             {"id": 1, "ok": false, "error": "..."}
+#
+#                   The "subscribe" op (args "maxsize" and "policy", see
+#                   GameEvents.py) makes the connection receive the table's
+#                   events as lines of {"table": "t1", "event": {...}} until
+#                   it sends "unsubscribe" or closes.
+
+import argparse
+import asyncio
+import json
+from functools import partial
+
+from DiceService import check_roll
+from GameEvents import DROP_OLDEST, EventPublisher, event_to_dict
+from RealEstateGame import RealEstateGame
+
+
+def space_state(space, index):
+    """
+    Converts a space to a JSON friendly dictionary.
+    :param space: GO or Property class object
+    :param index: int representing the index of the space
+    :return: dictionary of the space's data
+    """
+    if index == 0:
+        return {"name": space.get_name(), "payout": space.get_payout()}
+
+    owner = space.get_owner()
+
+    return {"name": space.get_name(), "rent": space.get_rent(),
+            "price": space.get_price(),
+            "owner": None if owner is None else owner.get_name()}
+
+
+def game_state(game):
+    """
+    Converts the players and ownership of a game to a JSON friendly dictionary.
+    :param game: RealEstateGame class object
+    :return: dictionary of the game's state
+    """
+    snapshot = game.snapshot()
+    payout, rents, names, groups = snapshot.layout
+
+    return {"players": [{"name": name, "balance": balance, "position": pos}
+                        for name, balance, pos in zip(names, snapshot.balances, snapshot.positions)],
+            "owners": [None if seat < 0 else names[seat] for seat in snapshot.owners[1:]],
+            "winner": game.check_game_over()}
+
+
+# Commands a client may send, mapped to functions of (game, args)
+COMMANDS = {
+    "create_spaces": lambda game, args: game.create_spaces(args["payout"], args["rents"],
+                                                           groups=args.get("groups")),
+    "create_player": lambda game, args: game.create_player(args["name"], args["balance"]),
+    "buy_space": lambda game, args: game.buy_space(args["name"]),
+    "move_player": lambda game, args: game.move_player(args["name"], check_roll(args["spaces"])),
+    "check_game_over": lambda game, args: game.check_game_over(),
+    "get_player_account_balance": lambda game, args: game.get_player_account_balance(args["name"]),
+    "get_player_current_position": lambda game, args: game.get_player_current_position(args["name"]),
+    "get_space": lambda game, args: space_state(game.get_space(args["index"]), args["index"]),
+    "state": lambda game, args: game_state(game),
+    "render": lambda game, args: game.render(),
+}
+
+
+class Table:
+    """
+    Represents one hosted game and the queue of commands waiting to run on
+    it. A task runs the table's commands one at a time in arrival order.
+    The task exits when the queue is empty and is restarted by the next
+    command, so idle tables cost no running task.
+    """
+    def __init__(self):
+        """
+        Creates a table with a new game and an empty command queue.
+        """
+        self._game = RealEstateGame()
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def get_game(self):
+        """
+        Getter for game
+        :return: RealEstateGame class object
+        """
+        return self._game
+
+    def subscribe(self, maxsize=1024, policy=DROP_OLDEST):
+        """
+        Subscribes to the game's events. The game only publishes events once
+        a table has been subscribed to.
+        :param maxsize: int representing the most events buffered
+        :param policy: string representing the subscription's overflow policy
+        :return: Subscription class object
+        """
+        publisher = self._game._events
+
+        if publisher is None:
+            publisher = EventPublisher()
+            self._game.set_publisher(publisher)
+
+        return publisher.subscribe(maxsize, policy)
+
+    def submit(self, op, args):
+        """
+        Queues a command and starts the table's task if it is idle.
+        :param op: string representing the command name
+        :param args: dictionary of command arguments
+        :return: asyncio.Future resolved with the command's result
+        """
+        return self.submit_function(COMMANDS[op], args)
+
+    def submit_function(self, function, args):
+        """
+        Queues a function to run on the table's game in turn with commands.
+        :param function: callable of (game, args)
+        :param args: dictionary of arguments
+        :return: asyncio.Future resolved with the function's result
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((function, args, future))
+
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+        return future
+
+    async def _run(self):
+        """
+        Runs queued commands until the queue is empty.
+        :return: None
+        """
+        try:
+            while not self._queue.empty():
+                function, args, future = self._queue.get_nowait()
+
+                try:
+                    future.set_result(function(self._game, args))
+                except Exception as error:
+                    future.set_exception(error)
+
+                await asyncio.sleep(0)          # Let other tables run
+        finally:
+            self._task = None
+
+
+class GameServer:
+    """
+    Represents a server hosting tables identified by string IDs. Tables are
+    created by their first command. Each connection may send commands for
+    any number of tables; responses carry the command's "id" and may arrive
+    in a different order than the commands when they are for different tables.
+    """
+    def __init__(self):
+        """
+        Creates a server with no tables.
+        """
+        self._tables = {}
+        self._server = None
+
+    def get_table(self, table_id):
+        """
+        Getter for tables. Creates the table if it does not exist.
+        :param table_id: string representing the table ID
+        :return: Table class object
+        """
+        table = self._tables.get(table_id)
+
+        if table is None:
+            table = Table()
+            self._tables[table_id] = table
+
+        return table
+
+    def close_table(self, table_id):
+        """
+        Removes a table from the server.
+        :param table_id: string representing the table ID
+        :return: True if the table existed, False otherwise
+        """
+        return self._tables.pop(table_id, None) is not None
+
+    async def _respond(self, writer, request_id, future):
+        """
+        Waits for a command's result and writes the response line.
+        """
+        try:                                # Results that can't be sent
+            line = json.dumps({"id": request_id, "ok": True, "result": await future})
+        except Exception as error:          # as JSON are errors too
+            line = json.dumps({"id": request_id, "ok": False,
+                               "error": f"{type(error).__name__}: {error}"})
+
+        writer.write(line.encode() + b"\n")
+
+    async def _forward(self, writer, table_id, subscription):
+        """
+        Writes a subscription's events to a connection until it is closed.
+        """
+        async for event in subscription:
+            message = {"table": table_id, "event": event_to_dict(event)}
+            writer.write(json.dumps(message).encode() + b"\n")
+
+            if writer.transport.get_write_buffer_size() > 1 << 20:
+                await writer.drain()            # Slow viewers fill the subscription
+
+    def _subscribe(self, writer, subscriptions, table_id, game, args):
+        """
+        Helper for handle. Starts forwarding a table's events to a connection.
+        Runs in turn with the table's commands.
+        :return: True if subscribed, False if already subscribed
+        """
+        if table_id in subscriptions:
+            return False
+
+        subscription = self.get_table(table_id).subscribe(args.get("maxsize", 1024),
+                                                          args.get("policy", DROP_OLDEST))
+        subscriptions[table_id] = subscription
+        asyncio.ensure_future(self._forward(writer, table_id, subscription))
+
+        return True
+
+    @staticmethod
+    def _unsubscribe(subscriptions, table_id, game, args):
+        """
+        Helper for handle. Stops forwarding a table's events to a connection.
+        Runs in turn with the table's commands.
+        :return: True if unsubscribed, False if not subscribed
+        """
+        subscription = subscriptions.pop(table_id, None)
+
+        if subscription is None:
+            return False
+
+        subscription.close()
+
+        return True
+
+    @staticmethod
+    async def _read_line(reader):
+        """
+        Helper for handle. Reads one command line. A line longer than the
+        reader's limit is skipped up to and including its newline.
+        :param reader: asyncio.StreamReader
+        :return: bytes of the line (empty at the end of the stream), or None
+                 if the line was too long
+        """
+        too_long = False
+
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as error:    # Stream ended
+                line = error.partial
+            except asyncio.LimitOverrunError as error:
+                too_long = True
+                await reader.readexactly(error.consumed)    # Skip what was buffered
+                continue
+
+            return None if too_long else line
+
+    async def handle(self, reader, writer):
+        """
+        Reads commands from a connection until it closes.
+        :param reader: asyncio.StreamReader
+        :param writer: asyncio.StreamWriter
+        :return: None
+        """
+        pending = set()
+        subscriptions = {}              # Maps table IDs to this connection's subscriptions
+
+        try:
+            while True:
+                line = await self._read_line(reader)
+
+                if line is not None and not line:
+                    break
+
+                command = None
+
+                try:
+                    if line is None:
+                        raise ValueError("command line is longer than the server's limit")
+
+                    command = json.loads(line)
+                    request_id = command.get("id")
+                    op = command["op"]
+
+                    if op == "close_table":
+                        future = asyncio.get_running_loop().create_future()
+                        future.set_result(self.close_table(command["table"]))
+                    elif op == "subscribe":
+                        table_id = command["table"]
+                        future = self.get_table(table_id).submit_function(
+                            partial(self._subscribe, writer, subscriptions, table_id),
+                            command.get("args", {}))
+                    elif op == "unsubscribe":
+                        table_id = command["table"]
+                        future = self.get_table(table_id).submit_function(
+                            partial(self._unsubscribe, subscriptions, table_id), {})
+                    elif op not in COMMANDS:
+                        raise KeyError(f"unknown op {op}")
+                    else:
+                        future = self.get_table(command["table"]).submit(op, command.get("args", {}))
+                except (ValueError, KeyError, TypeError, AttributeError) as error:
+                    request_id = None if not isinstance(command, dict) else command.get("id")
+                    future = asyncio.get_running_loop().create_future()
+                    future.set_exception(error)
+
+                task = asyncio.ensure_future(self._respond(writer, request_id, future))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+                if writer.transport.get_write_buffer_size() > 1 << 20:
+                    await writer.drain()            # Apply back pressure
+
+            if pending:
+                await asyncio.gather(*pending)
+
+            await writer.drain()
+        finally:
+            for subscription in subscriptions.values():
+                subscription.close()
+
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8765, limit=1 << 20):
+        """
+        Starts listening for connections.
+        :param host: string representing the address to bind
+        :param port: int representing the port to bind (0 for any free port)
+        :param limit: int representing the longest command line in bytes;
+                      longer lines are answered with an error
+        :return: int representing the bound port
+        """
+        self._server = await asyncio.start_server(self.handle, host, port, limit=limit)
+
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """
+        Serves connections until cancelled.
+        :return: None
+        """
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        """
+        Stops listening for connections.
+        :return: None
+        """
+        self._server.close()
+        await self._server.wait_closed()
+
+
+def main():
+    """
+    Command line entry point. Runs a server until interrupted.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Host RealEstateGame tables over a local socket")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    async def run():
+        server = GameServer()
+        port = await server.start(args.host, args.port)
+        print(f"Listening on {args.host}:{port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A load test client for GameServer.py. Opens several
+#                   connections to a server on localhost, sets up many
+#                   tables, and sends a stream of move_player and buy_space
+#                   commands. Reports throughput and latency percentiles.
+#                   Starts its own server in the same process unless a port
+#                   is passed.
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from GameServer import GameServer
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+
+class Connection:
+    """
+    Represents one client connection. Commands are pipelined: they are sent
+    without waiting for earlier responses, and responses are matched to
+    commands by id.
+    """
+    def __init__(self, reader, writer):
+        """
+        Creates a client over an open stream pair and starts reading responses.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._waiting = {}
+        self._task = asyncio.ensure_future(self._read())
+
+    async def _read(self):
+        """
+        Resolves waiting commands as their responses arrive.
+        """
+        while True:
+            line = await self._reader.readline()
+
+            if not line:
+                break
+
+            response = json.loads(line)
+            future, sent = self._waiting.pop(response["id"])
+            future.set_result((response, time.perf_counter() - sent))
+
+    def send(self, table, op, **args):
+        """
+        Sends one command.
+        :return: asyncio.Future resolved with (response, latency in seconds)
+        """
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[self._next_id] = (future, time.perf_counter())
+        command = {"id": self._next_id, "table": table, "op": op, "args": args}
+        self._writer.write(json.dumps(command).encode() + b"\n")
+
+        return future
+
+    async def close(self):
+        """
+        Closes the connection.
+        """
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._task.cancel()
+
+
+def percentile(values, fraction):
+    """
+    :param values: sorted list of numbers
+    :param fraction: float in range [0..1]
+    :return: the value at the passed fraction of the list, or None if the
+             list is empty
+    """
+    if len(values) == 0:
+        return None
+
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def run_load(port, connections, tables, players, commands, window):
+    """
+    Sets up tables and sends commands, keeping at most window commands in
+    flight per connection.
+    :return: dictionary of results
+    """
+    clients = []
+
+    for _ in range(connections):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=1 << 20)
+        clients.append(Connection(reader, writer))
+
+    setup = []
+
+    for table in range(tables):
+        client = clients[table % connections]
+        setup.append(client.send(f"t{table}", "create_spaces", payout=50, rents=RENTS))
+
+        for seat in range(players):
+            setup.append(client.send(f"t{table}", "create_player", name=f"P{seat}", balance=1500))
+
+    await asyncio.gather(*setup)
+
+    async def drive(index, client, count):
+        rng = random.Random(index)
+        latencies = []
+        in_flight = set()
+
+        for sent in range(count):
+            table = f"t{rng.randrange(tables)}"
+            name = f"P{rng.randrange(players)}"
+
+            if sent % 2 == 0:
+                future = client.send(table, "move_player", name=name, spaces=rng.randint(1, 6))
+            else:
+                future = client.send(table, "buy_space", name=name)
+
+            in_flight.add(future)
+
+            if len(in_flight) >= window:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                latencies.extend(future.result()[1] for future in done)
+
+        for future in asyncio.as_completed(in_flight):
+            latencies.append((await future)[1])
+
+        return latencies
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(drive(index, client, commands // connections
+                                           + (1 if index < commands % connections else 0))
+                                     for index, client in enumerate(clients)))
+    elapsed = time.perf_counter() - start
+
+    for client in clients:
+        await client.close()
+
+    latencies = sorted(latency for result in results for latency in result)
+
+    return {"commands": len(latencies),
+            "seconds": elapsed,
+            "throughput": len(latencies) / elapsed,
+            "p50_ms": None if len(latencies) == 0 else percentile(latencies, 0.50) * 1000,
+            "p99_ms": None if len(latencies) == 0 else percentile(latencies, 0.99) * 1000}
+
+
+async def run(args):
+    """
+    Runs the load test against an existing server or one started here.
+    """
+    server = None
+    port = args.port
+
+    if port is None:
+        server = GameServer()
+        port = await server.start("127.0.0.1", 0)
+
+    try:
+        return await run_load(port, args.connections, args.tables, args.players,
+                              args.commands, args.window)
+    finally:
+        if server is not None:
+            await server.stop()
+
+
+def main():
+    """
+    Command line entry point. Prints the load test results.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Load test a GameServer")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--commands", type=int, default=100000)
+    parser.add_argument("--window", type=int, default=64)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    print(f"Commands:   {results['commands']}")
+    print(f"Throughput: {results['throughput']:.0f} commands/s")
+    for label, key in (("p50:", "p50_ms"), ("p99:", "p99_ms")):
+        if results[key] is None:                # No commands were sent
+            print(f"{label:11} n/a")
+        else:
+            print(f"{label:11} {results[key]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for GameServer.py. Starts a server on a free
+#                   local port and plays tables through a client connection.
+
+
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from GameServer import COMMANDS, GameServer
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """Contains client tests for GameServer"""
+
+    async def asyncSetUp(self):
+        """Starts a server and connects a client"""
+        self.server = GameServer()
+        port = await self.server.start("127.0.0.1", 0, limit=4096)
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+        self.next_id = 0
+
+    async def asyncTearDown(self):
+        """Disconnects the client and stops the server"""
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.server.stop()
+
+    def send(self, table, op, **args):
+        """
+        Sends a command without waiting for its response.
+        :return: int representing the command's id
+        """
+        self.next_id += 1
+        command = {"id": self.next_id, "table": table, "op": op, "args": args}
+        self.writer.write(json.dumps(command).encode() + b"\n")
+
+        return self.next_id
+
+    async def receive(self, count):
+        """
+        Reads lines from the server.
+        :return: list of count decoded messages
+        """
+        return [json.loads(await asyncio.wait_for(self.reader.readline(), 5))
+                for _ in range(count)]
+
+    async def call(self, table, op, **args):
+        """
+        Sends a command and waits for its response.
+        :return: dictionary representing the response
+        """
+        request_id = self.send(table, op, **args)
+        [response] = await self.receive(1)
+        self.assertEqual(response["id"], request_id)
+
+        return response
+
+    async def test_tables(self):
+        """Commands run in order per table, and tables are independent"""
+        for table in ("t1", "t2"):
+            await self.call(table, "create_spaces", payout=50, rents=RENTS)
+            await self.call(table, "create_player", name="Player 1", balance=1000)
+            await self.call(table, "create_player", name="Player 2", balance=1000)
+
+        self.send("t1", "move_player", name="Player 1", spaces=3)
+        self.send("t1", "buy_space", name="Player 1")
+        self.send("t2", "move_player", name="Player 2", spaces=5)
+        responses = {response["id"]: response for response in await self.receive(3)}
+
+        self.assertTrue(responses[self.next_id - 1]["result"])
+        self.assertEqual((await self.call("t1", "get_space", index=3))["result"]["owner"],
+                         "Player 1")
+
+        state = (await self.call("t2", "state"))["result"]
+        self.assertEqual([player["position"] for player in state["players"]], [0, 5])
+        self.assertEqual(state["owners"], [None] * len(RENTS))
+        self.assertTrue((await self.call("t2", "close_table"))["result"])
+        self.assertEqual((await self.call("t2", "state"))["result"]["players"], [])
+
+    async def test_errors(self):
+        """Unknown ops and failing commands answer with an error"""
+        response = await self.call("t1", "fly")
+        self.assertFalse(response["ok"])
+        self.assertIn("KeyError", response["error"])
+
+        response = await self.call("t1", "create_spaces", payout=50, rents=RENTS,
+                                   groups=[[[0, 1], 2]])
+        self.assertFalse(response["ok"])
+        self.assertIn("ValueError", response["error"])
+
+        await self.call("t1", "create_player", name="Player 1", balance=1000)
+
+        for spaces in (7, 0, 2.5):
+            response = await self.call("t1", "move_player", name="Player 1", spaces=spaces)
+            self.assertFalse(response["ok"])
+            self.assertIn("invalid roll", response["error"])
+
+        self.assertEqual((await self.call("t1", "get_player_current_position",
+                                          name="Player 1"))["result"], 0)
+
+        response = await self.call("t1", "subscribe", policy="drop_newest")
+        self.assertFalse(response["ok"])
+
+        self.writer.write(b"not json\n")
+        [response] = await self.receive(1)
+        self.assertFalse(response["ok"])
+        self.assertTrue((await self.call("t1", "check_game_over"))["ok"])
+
+    async def test_unsendable_results(self):
+        """Results that can't be sent as JSON answer with an error"""
+        with mock.patch.dict(COMMANDS, {"leak": lambda game, args: game}):
+            response = await self.call("t1", "leak")
+
+        self.assertFalse(response["ok"])
+        self.assertIn("TypeError", response["error"])
+        self.assertTrue((await self.call("t1", "check_game_over"))["ok"])
+
+    async def test_long_lines(self):
+        """Lines over the limit answer with an error and the connection goes on"""
+        for length in (5000, 20000):            # Longer than one buffered chunk too
+            self.send("t1", "create_player", name="x" * length, balance=1000)
+            [response] = await self.receive(1)
+            self.assertFalse(response["ok"])
+            self.assertIn("longer than", response["error"])
+
+        self.assertEqual((await self.call("t1", "state"))["result"]["players"], [])
+
+        self.writer.write(b"{" + b" " * 5000)   # Cut off by the end of the stream
+        self.writer.write_eof()
+        [response] = await self.receive(1)
+        self.assertFalse(response["ok"])
+        self.assertEqual(await self.reader.read(), b"")
+
+    async def test_subscribe(self):
+        """Subscribers receive the table's events until they unsubscribe"""
+        await self.call("t1", "create_spaces", payout=50, rents=RENTS)
+        self.assertTrue((await self.call("t1", "subscribe"))["result"])
+
+        self.send("t1", "create_player", name="Player 1", balance=1000)
+        self.send("t1", "move_player", name="Player 1", spaces=2)
+        messages = await self.receive(4)
+        events = [message["event"]["type"] for message in messages if "event" in message]
+
+        self.assertEqual(events, ["PlayerCreated", "Moved"])
+        self.assertTrue((await self.call("t1", "unsubscribe"))["result"])
+        self.assertFalse((await self.call("t1", "unsubscribe"))["result"])
+
+
+if __name__ == "__main__":
+    unittest.main()
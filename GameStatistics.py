@@ -0,0 +1,439 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Running statistics over any number of games played by
+#                   GameDriver.py, kept in memory that doesn't grow with
+#                   the number of games: mean and variance of game length,
+#                   win rates per seat and per starting balance, landings,
+#                   rent, and return on purchase price per property, and a
+#                   quantile sketch of the turns at which players went
+#                   bankrupt. Statistics gathered by separate workers merge
+#                   into the same totals as if one process had seen every
+#                   game.
+
+import math
+from fractions import Fraction
+
+from GameEvents import Moved, Purchased, RentPaid
+
+
+def _exact(value):
+    """
+    Helper for totals that must merge exactly. Converts a float to the
+    Fraction it exactly represents; ints are already exact.
+    """
+    return Fraction(value) if isinstance(value, float) else value
+
+
+def _rounded(total):
+    """
+    Helper for getters of exact totals.
+    :return: int, or float if the total is a Fraction
+    """
+    return float(total) if isinstance(total, Fraction) else total
+
+
+class RunningStats:
+    """
+    Represents the count, mean, variance, minimum, and maximum of a stream
+    of numbers. Keeps the exact sum and sum of squares of the values: ints
+    as ints, and floats as the Fractions they exactly represent. Merging
+    adds these totals, so merged statistics are exactly those of a single
+    pass over every value, in any order; only the getters round.
+    """
+    __slots__ = ("_count", "_sum", "_squares", "_min", "_max")
+
+    def __init__(self):
+        """
+        Creates statistics of no values.
+        """
+        self._count = 0
+        self._sum = 0                   # Exact sum of values
+        self._squares = 0               # Exact sum of squared values
+        self._min = None
+        self._max = None
+
+    def get_count(self):
+        """
+        Getter for count
+        :return: int representing the number of values
+        """
+        return self._count
+
+    def get_mean(self):
+        """
+        Getter for mean
+        :return: float representing the mean (0.0 if there are no values)
+        """
+        if self._count == 0:
+            return 0.0
+
+        return float(Fraction(self._sum, self._count))
+
+    def get_variance(self):
+        """
+        :return: float representing the sample variance (0.0 for fewer than
+                 2 values)
+        """
+        count = self._count
+
+        if count < 2:
+            return 0.0
+
+        return float(Fraction(self._squares * count - self._sum * self._sum,
+                              count * (count - 1)))
+
+    def get_std(self):
+        """
+        :return: float representing the sample standard deviation
+        """
+        return math.sqrt(self.get_variance())
+
+    def get_min(self):
+        """
+        Getter for min
+        :return: smallest value, or None if there are no values
+        """
+        return self._min
+
+    def get_max(self):
+        """
+        Getter for max
+        :return: largest value, or None if there are no values
+        """
+        return self._max
+
+    def add(self, value):
+        """
+        Adds one value.
+        :param value: int or float
+        :return: None
+        """
+        exact = _exact(value)
+        self._count += 1
+        self._sum += exact
+        self._squares += exact * exact
+
+        if self._min is None or value < self._min:
+            self._min = value
+
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def merge(self, other):
+        """
+        Adds the values summarized by other statistics.
+        :param other: RunningStats class object
+        :return: None
+        """
+        if other._count == 0:
+            return
+
+        self._count += other._count
+        self._sum += other._sum
+        self._squares += other._squares
+
+        if self._min is None or other._min < self._min:
+            self._min = other._min
+
+        if self._max is None or other._max > self._max:
+            self._max = other._max
+
+
+class QuantileSketch:
+    """
+    Represents the distribution of a stream of non-negative ints, such as
+    turn numbers, in log-linear buckets. Values below 2 ** precision each
+    get their own bucket, so their quantiles are exact; larger values share
+    buckets whose width is at most 1 / 2 ** (precision - 1) of the value.
+    The number of buckets is bounded by the precision and the largest
+    value, and merging adds bucket counts, so merged sketches are exactly
+    the sketch of every value.
+    """
+    __slots__ = ("_precision", "_counts", "_count")
+
+    def __init__(self, precision=8):
+        """
+        Creates an empty sketch.
+        :param precision: int representing the number of significant bits kept
+        """
+        self._precision = precision
+        self._counts = {}               # Bucket key to number of values
+        self._count = 0
+
+    def get_count(self):
+        """
+        Getter for count
+        :return: int representing the number of values
+        """
+        return self._count
+
+    def _key(self, value):
+        """
+        Helper for add. Finds a value's bucket. Keys sort in value order.
+        """
+        shift = max(value.bit_length() - self._precision, 0)
+
+        return (shift << self._precision) | (value >> shift)
+
+    def _bounds(self, key):
+        """
+        Helper for quantile.
+        :return: tuple of the smallest and largest int in a bucket
+        """
+        shift = key >> self._precision
+        low = (key & ((1 << self._precision) - 1)) << shift
+
+        return low, low + (1 << shift) - 1
+
+    def add(self, value, count=1):
+        """
+        Adds a value. Negative values are counted as 0.
+        :param value: int
+        :param count: int representing how many times to add it
+        :return: None
+        """
+        key = self._key(max(int(value), 0))
+        self._counts[key] = self._counts.get(key, 0) + count
+        self._count += count
+
+    def merge(self, other):
+        """
+        Adds the values of another sketch with the same precision.
+        :param other: QuantileSketch class object
+        :return: None
+        :raises ValueError: if the sketches' precisions differ, since their
+                            bucket keys don't match
+        """
+        if other._precision != self._precision:
+            raise ValueError(f"can't merge a sketch of precision {other._precision} "
+                             f"into one of precision {self._precision}")
+
+        for key, count in other._counts.items():
+            self._counts[key] = self._counts.get(key, 0) + count
+
+        self._count += other._count
+
+    def quantile(self, fraction):
+        """
+        Estimates a quantile with the nearest rank method.
+        :param fraction: float in range [0..1], e.g. 0.5 for the median
+        :return: int or float representing the value (the middle of its
+                 bucket for large values), or None if the sketch is empty
+        """
+        if self._count == 0:
+            return None
+
+        rank = max(math.ceil(fraction * self._count), 1)
+        seen = 0
+
+        for key in sorted(self._counts):
+            seen += self._counts[key]
+
+            if seen >= rank:
+                low, high = self._bounds(key)
+                return low if low == high else (low + high) / 2
+
+
+class GameStatistics:
+    """
+    Represents running statistics of many games. A driver feeds it the
+    events of each game (see GameEvents.py) with add_events and each
+    outcome with add_result; play_game does both when passed statistics.
+    Per-property values are keyed by board index.
+    """
+    def __init__(self, precision=8):
+        """
+        Creates statistics of no games.
+        :param precision: int representing the precision of the bankruptcy
+                          turn sketch (see QuantileSketch)
+        """
+        self._games = 0
+        self._draws = 0
+        self._lengths = RunningStats()
+        self._bankruptcy_turns = QuantileSketch(precision)
+        self._seat_games = []
+        self._seat_wins = []
+        self._balance_games = {}        # Starting balance to seats played
+        self._balance_wins = {}         # Starting balance to games won
+        self._landings = {}             # Board index to number of landings
+        self._rent = {}                 # Board index to exact rent collected
+        self._purchases = {}            # Board index to number of purchases
+        self._invested = {}             # Board index to exact total price paid
+
+    def get_games(self):
+        """
+        Getter for games
+        :return: int representing the number of games added
+        """
+        return self._games
+
+    def get_draws(self):
+        """
+        Getter for draws
+        :return: int representing the number of games that hit the turn limit
+        """
+        return self._draws
+
+    def get_lengths(self):
+        """
+        Getter for lengths
+        :return: RunningStats class object of game lengths in turns
+        """
+        return self._lengths
+
+    def get_bankruptcy_turns(self):
+        """
+        Getter for bankruptcy turns
+        :return: QuantileSketch class object of the turns at which players
+                 went bankrupt
+        """
+        return self._bankruptcy_turns
+
+    def get_seat_win_rates(self):
+        """
+        :return: list of floats representing the fraction of games won by
+                 each seat, in seating order
+        """
+        return [wins / games for wins, games in zip(self._seat_wins, self._seat_games)]
+
+    def get_balance_win_rates(self):
+        """
+        :return: dictionary mapping starting balances to the fraction of
+                 seats with that balance that won their game
+        """
+        return {balance: self._balance_wins.get(balance, 0) / games
+                for balance, games in self._balance_games.items()}
+
+    def get_landings(self):
+        """
+        Getter for landings
+        :return: dictionary mapping board indices to times landed on
+        """
+        return dict(self._landings)
+
+    def get_rent(self):
+        """
+        Getter for rent
+        :return: dictionary mapping board indices to total rent paid to owners
+                 (floats if any rent was a float)
+        """
+        return {index: _rounded(rent) for index, rent in self._rent.items()}
+
+    def get_purchases(self):
+        """
+        Getter for purchases
+        :return: dictionary mapping board indices to times bought
+        """
+        return dict(self._purchases)
+
+    def get_roi(self):
+        """
+        :return: dictionary mapping board indices of bought properties to
+                 rent collected divided by the total price paid for them.
+                 The price paid is get_price() for buy_space, or the winning
+                 bid for an auction
+        """
+        return {index: float(Fraction(self._rent.get(index, 0)) / invested)
+                for index, invested in self._invested.items() if invested > 0}
+
+    def add_events(self, events):
+        """
+        Adds the events of a game in progress.
+        :param events: iterable of event namedtuples from GameEvents.py
+        :return: None
+        """
+        landings = self._landings
+        rent = self._rent
+
+        for event in events:
+            kind = type(event)
+
+            if kind is Moved:
+                landings[event.new] = landings.get(event.new, 0) + 1
+            elif kind is RentPaid:
+                rent[event.space] = rent.get(event.space, 0) + _exact(event.rent)
+            elif kind is Purchased:
+                self._purchases[event.space] = self._purchases.get(event.space, 0) + 1
+                self._invested[event.space] = (self._invested.get(event.space, 0)
+                                               + _exact(event.price))
+
+    def add_result(self, result, players):
+        """
+        Adds the outcome of a finished game.
+        :param result: GameResult namedtuple returned by play_game
+        :param players: list of (name, balance) or (name, balance, strategy)
+                        tuples in seating order, as passed to play_game
+        :return: None
+        """
+        self._games += 1
+        self._lengths.add(result.turns)
+
+        for turn in result.bankruptcies.values():
+            self._bankruptcy_turns.add(turn)
+
+        if result.winner == "":
+            self._draws += 1
+
+        while len(self._seat_games) < len(players):
+            self._seat_games.append(0)
+            self._seat_wins.append(0)
+
+        for seat, player in enumerate(players):
+            name, balance = player[0], player[1]
+            won = 1 if name == result.winner else 0
+            self._seat_games[seat] += 1
+            self._seat_wins[seat] += won
+            self._balance_games[balance] = self._balance_games.get(balance, 0) + 1
+            self._balance_wins[balance] = self._balance_wins.get(balance, 0) + won
+
+    def merge(self, other):
+        """
+        Adds the games summarized by other statistics, e.g. from another
+        worker process.
+        :param other: GameStatistics class object
+        :return: None
+        :raises ValueError: if the bankruptcy turn sketches' precisions
+                            differ. Nothing is merged then
+        """
+        self._bankruptcy_turns.merge(other._bankruptcy_turns)   # Checked first
+        self._games += other._games
+        self._draws += other._draws
+        self._lengths.merge(other._lengths)
+
+        while len(self._seat_games) < len(other._seat_games):
+            self._seat_games.append(0)
+            self._seat_wins.append(0)
+
+        for seat in range(len(other._seat_games)):
+            self._seat_games[seat] += other._seat_games[seat]
+            self._seat_wins[seat] += other._seat_wins[seat]
+
+        for mine, theirs in ((self._balance_games, other._balance_games),
+                             (self._balance_wins, other._balance_wins),
+                             (self._landings, other._landings),
+                             (self._rent, other._rent),
+                             (self._purchases, other._purchases),
+                             (self._invested, other._invested)):
+            for key, value in theirs.items():
+                mine[key] = mine.get(key, 0) + value
+
+    def summary(self, fractions=(0.5, 0.9, 0.99)):
+        """
+        Collects the statistics in a JSON friendly dictionary.
+        :param fractions: floats representing bankruptcy turn quantiles
+        :return: dictionary
+        """
+        lengths = self._lengths
+
+        return {"games": self._games,
+                "draws": self._draws,
+                "length": {"mean": lengths.get_mean(), "std": lengths.get_std(),
+                           "min": lengths.get_min(), "max": lengths.get_max()},
+                "seat_win_rates": self.get_seat_win_rates(),
+                "balance_win_rates": self.get_balance_win_rates(),
+                "bankruptcy_turns": {str(fraction): self._bankruptcy_turns.quantile(fraction)
+                                     for fraction in fractions},
+                "landings": self.get_landings(),
+                "rent": self.get_rent(),
+                "roi": self.get_roi()}
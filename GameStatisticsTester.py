@@ -0,0 +1,139 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for GameStatistics.py. Plays seeded games into
+#                   separate statistics and checks that merging them gives
+#                   exactly the statistics of one pass over every game.
+
+
+import pickle
+import random
+import statistics
+import unittest
+from fractions import Fraction
+
+from GameDriver import play_game
+from GameEvents import Purchased, RentPaid
+from GameStatistics import GameStatistics, QuantileSketch, RunningStats
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+PLAYERS = [("Player 1", 1500), ("Player 2", 1500), ("Player 3", 1000)]
+
+
+class TestGameStatistics(unittest.TestCase):
+    """Contains merge tests for GameStatistics"""
+
+    def test_running_stats(self):
+        """Mean and variance match the statistics module"""
+        values = [random.Random(1).uniform(-1e6, 1e6) for _ in range(500)] + [7, 11]
+        stats = RunningStats()
+
+        for value in values:
+            stats.add(value)
+
+        self.assertEqual(stats.get_count(), len(values))
+        self.assertEqual(stats.get_mean(), statistics.fmean(values))
+        self.assertAlmostEqual(stats.get_variance() / statistics.variance(values), 1, 12)
+        self.assertEqual((stats.get_min(), stats.get_max()), (min(values), max(values)))
+
+    def test_exact_running_stats_merge(self):
+        """Merging in any grouping and order gives exactly one pass's results"""
+        rng = random.Random(2)
+        values = [rng.choice([1e16, 1.0, -1e16, 0.1, 3]) for _ in range(1000)]
+        whole = RunningStats()
+
+        for value in values:
+            whole.add(value)
+
+        for parts in (2, 3, 7):
+            merged = RunningStats()
+
+            for part in reversed(range(parts)):
+                stats = RunningStats()
+
+                for value in values[part::parts]:
+                    stats.add(value)
+
+                merged.merge(pickle.loads(pickle.dumps(stats)))     # As from a worker
+
+            self.assertEqual(merged.get_count(), whole.get_count())
+            self.assertEqual(merged.get_mean(), whole.get_mean())
+            self.assertEqual(merged.get_variance(), whole.get_variance())
+
+    def test_quantile_sketch(self):
+        """Small values are exact and large ones within the bucket width"""
+        sketch = QuantileSketch(4)
+
+        for value in range(1, 101):
+            sketch.add(value)
+
+        self.assertEqual(sketch.quantile(0.1), 10)
+        self.assertLessEqual(abs(sketch.quantile(0.9) - 90), 90 / 2 ** 3)
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+        with self.assertRaises(ValueError):
+            sketch.merge(QuantileSketch(8))
+
+    def test_exact_game_statistics_merge(self):
+        """Statistics merged from workers equal one process's statistics"""
+        whole = GameStatistics()
+        workers = [GameStatistics() for _ in range(3)]
+
+        for seed in range(30):
+            play_game(RENTS, 50, PLAYERS, seed, statistics=whole)
+            play_game(RENTS, 50, PLAYERS, seed, statistics=workers[seed % 3])
+
+        merged = GameStatistics()
+
+        for worker in workers:
+            merged.merge(worker)
+
+        self.assertEqual(merged.get_games(), 30)
+        self.assertEqual(merged.summary(), whole.summary())
+        self.assertEqual(merged.get_purchases(), whole.get_purchases())
+
+        with self.assertRaises(ValueError):
+            merged.merge(GameStatistics(precision=4))
+
+        self.assertEqual(merged.summary(), whole.summary())
+
+
+    def test_exact_float_totals(self):
+        """Float rents and prices merge to the same totals in any order"""
+        rng = random.Random(3)
+        events = []
+
+        for sequence in range(600):
+            space = rng.randint(1, 3)
+            amount = rng.choice([1e16, 0.1, 2.5, 1 / 3, 7])
+
+            if rng.random() < 0.5:
+                events.append(RentPaid(sequence, "Player 1", "Player 2", space, amount, amount,
+                                       0, 0))
+            else:
+                events.append(Purchased(sequence, "Player 2", space, amount, 0))
+
+        whole = GameStatistics()
+        whole.add_events(events)
+
+        for parts in (2, 5):
+            merged = GameStatistics()
+
+            for part in reversed(range(parts)):
+                worker = GameStatistics()
+                worker.add_events(reversed(events[part::parts]))
+                merged.merge(pickle.loads(pickle.dumps(worker)))
+
+            self.assertEqual(merged.get_rent(), whole.get_rent())
+            self.assertEqual(merged.get_roi(), whole.get_roi())
+
+        self.assertEqual(whole.get_rent()[1],
+                         float(sum(Fraction(event.rent) for event in events
+                                   if type(event) is RentPaid and event.space == 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,377 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Saves RealEstateGame tables to a SQLite database so they
+#                   can be paused, resumed, and queried. Each table is
+#                   stored in a normalized schema of games, spaces, color
+#                   groups, players, and owned spaces, plus a history of
+#                   ownership changes.
+#                   Saving a table only marks it dirty; dirty tables are
+#                   written together in one transaction, and only the rows
+#                   that changed since the last flush are written. Tables
+#                   are loaded in bulk with one query per database table.
+
+import sqlite3
+from itertools import groupby
+
+from RealEstateGame import GameSnapshot, LazyBoard, RealEstateGame, property_name
+
+
+# Columns without a declared type keep values as stored, so int and float
+# balances and rents load back as the same type.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    payout,
+    lazy INTEGER NOT NULL,
+    version INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS spaces (
+    game_id TEXT NOT NULL REFERENCES games,
+    idx INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    rent,
+    PRIMARY KEY (game_id, idx)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS color_groups (
+    game_id TEXT NOT NULL REFERENCES games,
+    idx INTEGER NOT NULL,
+    grp INTEGER NOT NULL,
+    multiplier,
+    PRIMARY KEY (game_id, idx)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS players (
+    game_id TEXT NOT NULL REFERENCES games,
+    seat INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    balance,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (game_id, seat)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS ownership (
+    game_id TEXT NOT NULL REFERENCES games,
+    idx INTEGER NOT NULL,
+    seat INTEGER NOT NULL,
+    PRIMARY KEY (game_id, idx)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS ownership_history (
+    game_id TEXT NOT NULL REFERENCES games,
+    version INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    owner TEXT,
+    PRIMARY KEY (game_id, idx, version)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS players_by_name ON players (name);
+CREATE INDEX IF NOT EXISTS ownership_by_seat ON ownership (game_id, seat);
+"""
+
+
+class GameStore:
+    """
+    Represents a SQLite database of saved games, keyed by a game id string
+    such as a table name. Keeps the snapshot of each game as of its last
+    flush so later flushes only write what changed.
+    """
+    def __init__(self, path=":memory:", batch_size=500):
+        """
+        Opens or creates a database.
+        :param path: string representing the database file
+        :param batch_size: int representing the number of dirty games that
+                           triggers a flush (0 to only flush when asked)
+        """
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(SCHEMA)
+        self._batch_size = batch_size
+        self._dirty = {}                # Maps game ids to games to write
+        self._flushed = {}              # Maps game ids to (snapshot, version)
+
+    def save(self, game_id, game):
+        """
+        Marks a game to be written at the next flush. Flushes if the number
+        of dirty games reaches the batch size.
+        :param game_id: string identifying the game
+        :param game: RealEstateGame class object
+        :return: None
+        """
+        self._dirty[game_id] = game
+
+        if 0 < self._batch_size <= len(self._dirty):
+            self.flush()
+
+    def flush(self):
+        """
+        Writes every dirty game in one transaction. A game whose players or
+        board changed since its last flush is rewritten; otherwise only its
+        changed balances, positions, and owners are written.
+        :return: int representing the number of games written
+        """
+        if len(self._dirty) == 0:
+            return 0
+
+        games = []
+        removed = []
+        spaces = []
+        groups = []
+        players = []
+        moved = []
+        owned = []
+        released = []
+        history = []
+        flushed = {}
+
+        # Games saved before this store was opened continue from the stored
+        # snapshot and version
+        unknown = [game_id for game_id in self._dirty if game_id not in self._flushed]
+        stored = self._read_snapshots(unknown) if unknown else {}
+
+        for game_id, game in self._dirty.items():
+            snapshot = game.snapshot()
+            previous, version = self._flushed.get(game_id) or stored.get(game_id, (None, 0))[:2]
+            version += 1
+            payout, rents, names, game_groups = snapshot.layout
+            lazy = 1 if isinstance(game._board, LazyBoard) else 0
+            games.append((game_id, payout, lazy, version))
+
+            if previous is None or previous.layout != snapshot.layout:
+                removed.append((game_id,))
+                spaces.extend((game_id, index, property_name(index), rents[index - 1])
+                              for index in range(1, len(rents) + 1))
+                groups.extend((game_id, index, group, multiplier)
+                              for group, (indices, multiplier) in enumerate(game_groups)
+                              for index in indices)
+                players.extend((game_id, seat, names[seat], snapshot.balances[seat],
+                                snapshot.positions[seat])
+                               for seat in range(len(names)))
+                owned.extend((game_id, index, seat)
+                             for index, seat in enumerate(snapshot.owners) if seat >= 0)
+            else:
+                moved.extend((snapshot.balances[seat], snapshot.positions[seat], game_id, seat)
+                             for seat in range(len(names))
+                             if snapshot.balances[seat] != previous.balances[seat]
+                             or snapshot.positions[seat] != previous.positions[seat])
+
+                for index, seat in enumerate(snapshot.owners):
+                    if seat != previous.owners[index]:
+                        if seat >= 0:
+                            owned.append((game_id, index, seat))
+                        else:
+                            released.append((game_id, index))
+
+            old_owners = self._owner_names(previous)
+            new_owners = self._owner_names(snapshot)
+
+            for index in range(1, max(len(new_owners), len(old_owners))):
+                old = old_owners[index] if index < len(old_owners) else None
+                new = new_owners[index] if index < len(new_owners) else None
+
+                if old != new:
+                    history.append((game_id, version, index, new))
+
+            flushed[game_id] = (snapshot, version)
+
+        with self._connection as connection:        # One transaction
+            connection.executemany(
+                "INSERT INTO games VALUES (?, ?, ?, ?) ON CONFLICT (game_id) DO UPDATE "
+                "SET payout = excluded.payout, lazy = excluded.lazy, version = excluded.version",
+                games)
+
+            for table in ("spaces", "color_groups", "players", "ownership"):
+                connection.executemany(f"DELETE FROM {table} WHERE game_id = ?", removed)
+
+            connection.executemany("INSERT INTO spaces VALUES (?, ?, ?, ?)", spaces)
+            connection.executemany("INSERT INTO color_groups VALUES (?, ?, ?, ?)", groups)
+            connection.executemany("INSERT INTO players VALUES (?, ?, ?, ?, ?)", players)
+            connection.executemany("UPDATE players SET balance = ?, position = ? "
+                                   "WHERE game_id = ? AND seat = ?", moved)
+            connection.executemany("INSERT OR REPLACE INTO ownership VALUES (?, ?, ?)", owned)
+            connection.executemany("DELETE FROM ownership WHERE game_id = ? AND idx = ?",
+                                   released)
+            connection.executemany("INSERT INTO ownership_history VALUES (?, ?, ?, ?)",
+                                   history)
+
+        self._flushed.update(flushed)               # Only once committed
+        count = len(self._dirty)
+        self._dirty = {}
+
+        return count
+
+    @staticmethod
+    def _owner_names(snapshot):
+        """
+        Helper for flush. Resolves a snapshot's owner seats to player names.
+        :param snapshot: GameSnapshot namedtuple or None
+        :return: list of strings or None, one per space
+        """
+        if snapshot is None:
+            return []
+
+        names = snapshot.layout[2]
+
+        return [None if seat < 0 else names[seat] for seat in snapshot.owners]
+
+    def load_all(self, game_ids=None):
+        """
+        Loads saved games in bulk. Each database table is read with one
+        query, and each game is rebuilt with RealEstateGame.restore.
+        Unflushed changes are written first.
+        :param game_ids: iterable of strings, or None for every saved game
+        :return: dictionary mapping game ids to RealEstateGame class objects
+        """
+        self.flush()
+        games = {}
+
+        for game_id, (snapshot, version, lazy) in self._read_snapshots(game_ids).items():
+            game = RealEstateGame()
+
+            if lazy:                                # Keep the board lazy
+                payout, rents, names, groups = snapshot.layout
+                game.create_spaces(payout, rents, True, groups)
+
+            game.restore(snapshot)
+            games[game_id] = game
+            self._flushed[game_id] = (snapshot, version)
+
+        return games
+
+    def _read_snapshots(self, game_ids):
+        """
+        Helper for load_all and flush. Reads saved games with one query per
+        database table.
+        :param game_ids: iterable of strings, or None for every saved game
+        :return: dictionary mapping game ids to (GameSnapshot, version,
+                 True if the board is lazy) tuples
+        """
+        connection = self._connection
+
+        if game_ids is None:
+            where = ""
+            arguments = ()
+        else:
+            arguments = tuple(game_ids)
+
+            if len(arguments) == 0:
+                return {}
+
+            where = f"WHERE game_id IN ({', '.join('?' * len(arguments))})"
+
+        rows = {}
+
+        for table, columns, order in (("games", "game_id, payout, lazy, version", "game_id"),
+                                      ("spaces", "game_id, rent", "game_id, idx"),
+                                      ("color_groups", "game_id, grp, idx, multiplier",
+                                       "game_id, grp, idx"),
+                                      ("players", "game_id, name, balance, position",
+                                       "game_id, seat"),
+                                      ("ownership", "game_id, idx, seat", "game_id, idx")):
+            cursor = connection.execute(f"SELECT {columns} FROM {table} {where} "
+                                        f"ORDER BY {order}", arguments)
+            rows[table] = {game_id: [row[1:] for row in group]
+                           for game_id, group in groupby(cursor, lambda row: row[0])}
+
+        snapshots = {}
+
+        for game_id, [(payout, lazy, version)] in rows["games"].items():
+            rents = tuple(rent for (rent,) in rows["spaces"].get(game_id, ()))
+            groups = {}                         # Group number to (indices, multiplier)
+
+            for group, index, multiplier in rows["color_groups"].get(game_id, ()):
+                groups.setdefault(group, ([], multiplier))[0].append(index)
+
+            seats = rows["players"].get(game_id, ())
+            owners = [-1] * (len(rents) + 1 if payout is not None else 0)
+
+            for index, seat in rows["ownership"].get(game_id, ()):
+                owners[index] = seat
+
+            snapshot = GameSnapshot((payout, rents, tuple(name for name, balance, pos in seats),
+                                     tuple((tuple(indices), multiplier)
+                                           for group, (indices, multiplier) in sorted(groups.items()))),
+                                    tuple(balance for name, balance, pos in seats),
+                                    tuple(pos for name, balance, pos in seats),
+                                    tuple(owners))
+            snapshots[game_id] = (snapshot, version, lazy == 1)
+
+        return snapshots
+
+    def load(self, game_id):
+        """
+        Loads one saved game.
+        :param game_id: string identifying the game
+        :return: RealEstateGame class object, or None if it was never saved
+        """
+        return self.load_all([game_id]).get(game_id)
+
+    def delete(self, game_id):
+        """
+        Removes a game and its history from the database.
+        :param game_id: string identifying the game
+        :return: None
+        """
+        self._dirty.pop(game_id, None)
+        self._flushed.pop(game_id, None)
+
+        with self._connection as connection:
+            for table in ("games", "spaces", "color_groups", "players", "ownership",
+                          "ownership_history"):
+                connection.execute(f"DELETE FROM {table} WHERE game_id = ?", (game_id,))
+
+    def get_game_ids(self):
+        """
+        Getter for game ids. Unflushed changes are written first.
+        :return: list of strings identifying every saved game
+        """
+        self.flush()
+
+        return [game_id for (game_id,) in
+                self._connection.execute("SELECT game_id FROM games ORDER BY game_id")]
+
+    def find_games_owned(self, player_name, space_name):
+        """
+        Finds the games in which a player owns a space, for example every
+        game where "Player 1" owns "Prop_12". Uses the players_by_name index.
+        Unflushed changes are written first.
+        :param player_name: string representing player name
+        :param space_name: string representing property name
+        :return: list of strings identifying games
+        """
+        self.flush()
+        cursor = self._connection.execute(
+            "SELECT players.game_id FROM players "
+            "JOIN ownership ON ownership.game_id = players.game_id "
+            "AND ownership.seat = players.seat "
+            "JOIN spaces ON spaces.game_id = ownership.game_id AND spaces.idx = ownership.idx "
+            "WHERE players.name = ? AND spaces.name = ? ORDER BY players.game_id",
+            (player_name, space_name))
+
+        return [game_id for (game_id,) in cursor]
+
+    def get_ownership_history(self, game_id, space_name):
+        """
+        Getter for the owners a space has had, as of each flush that changed it.
+        Unflushed changes are written first.
+        :param game_id: string identifying the game
+        :param space_name: string representing property name
+        :return: list of (version, player name or None) tuples, oldest first
+        """
+        self.flush()
+        cursor = self._connection.execute(
+            "SELECT version, owner FROM ownership_history "
+            "JOIN spaces USING (game_id, idx) "
+            "WHERE game_id = ? AND spaces.name = ? ORDER BY version",
+            (game_id, space_name))
+
+        return cursor.fetchall()
+
+    def close(self):
+        """
+        Flushes dirty games and closes the database.
+        :return: None
+        """
+        self.flush()
+        self._connection.close()
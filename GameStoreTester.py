@@ -0,0 +1,120 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for GameStore.py. Saves games to a database
+#                   file, reopens it, and checks that loaded games, later
+#                   saves, and ownership history match the live games.
+
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from GameStore import GameStore
+from RealEstateGame import RealEstateGame
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+
+def new_game():
+    """Creates a game with two players, Player 1 owning Prop_03"""
+    game = RealEstateGame()
+    game.create_spaces(50, RENTS)
+    game.create_player("Player 1", 1000)
+    game.create_player("Player 2", 1000.5)
+    game.move_player("Player 1", 3)
+    game.buy_space("Player 1")
+
+    return game
+
+
+class TestGameStore(unittest.TestCase):
+    """Contains round trip tests for GameStore"""
+
+    def setUp(self):
+        """Creates a directory for the database"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.db")
+
+    def tearDown(self):
+        """Removes the database"""
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """Loaded games have the saved state, with ints and floats kept"""
+        store = GameStore(self.path)
+        game = new_game()
+        store.save("table 1", game)
+        store.close()
+
+        store = GameStore(self.path)
+        loaded = store.load("table 1")
+
+        self.assertEqual(loaded.snapshot(), game.snapshot())
+        self.assertIsInstance(loaded.get_player_account_balance("Player 2"), float)
+        self.assertEqual(store.find_games_owned("Player 1", "Prop_03"), ["table 1"])
+        self.assertIsNone(store.load("table 2"))
+        store.close()
+
+    def test_color_groups(self):
+        """Color groups are saved with the board, for lazy boards too"""
+        store = GameStore(self.path)
+
+        for lazy in (False, True):
+            game = RealEstateGame()
+            game.create_spaces(50, RENTS, lazy, [([4, 5, 6], 2), ([1, 2], 1.5)])
+            game.create_player("Player 1", 1000)
+            store.save(f"table {lazy}", game)
+
+        store.close()
+        store = GameStore(self.path)
+
+        for lazy in (False, True):
+            loaded = store.load(f"table {lazy}")
+            self.assertEqual(loaded.get_groups(), (((4, 5, 6), 2), ((1, 2), 1.5)))
+
+        store.close()
+
+    def test_reopen_and_save(self):
+        """Saving a game again after reopening continues its history"""
+        store = GameStore(self.path)
+        game = new_game()
+        store.save("table 1", game)
+        store.close()
+
+        store = GameStore(self.path)
+        game.move_player("Player 2", 3)         # Pays rent to Player 1
+        game.move_player("Player 2", 2)
+        game.buy_space("Player 2")
+        store.save("table 1", game)
+        store.flush()
+
+        self.assertEqual(store.load("table 1").snapshot(), game.snapshot())
+        self.assertEqual(store.get_ownership_history("table 1", "Prop_03"), [(1, "Player 1")])
+        self.assertEqual(store.get_ownership_history("table 1", "Prop_05"), [(2, "Player 2")])
+        store.close()
+
+    def test_failed_flush_is_retried(self):
+        """A flush whose transaction fails is written in full by the next one"""
+        store = GameStore(self.path, batch_size=0)
+        game = new_game()
+        store.save("table 1", game)
+        connection = store._connection
+        store._connection = sqlite3.connect(":memory:")   # No tables: commit fails
+
+        with self.assertRaises(sqlite3.OperationalError):
+            store.flush()
+
+        store._connection.close()
+        store._connection = connection
+        store.flush()
+
+        self.assertEqual(store.load("table 1").snapshot(), game.snapshot())
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
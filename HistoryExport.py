@@ -0,0 +1,269 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Bulk export of game histories as typed columns. Each
+#                   recorded row is the state of one game after one turn:
+#                   its id, the turn, and the position and balance of every
+#                   seat and the owner of every space. Rows are gathered in
+#                   fixed-size NumPy chunks and appended to one raw binary
+#                   file per column, so memory stays bounded however many
+#                   games are exported. A JSON manifest describes the
+#                   columns, and load_history memory-maps them back without
+#                   copying, ready for NumPy or a dataframe.
+
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+
+
+VERSION = 1
+MANIFEST = "manifest.json"
+
+# Columns of a loaded history. game and turn have one value per row; the
+# others have one row per recorded row and one column per seat or space.
+History = namedtuple("History", ["names", "game", "turn", "positions", "balances", "owners"])
+
+
+class HistoryWriter:
+    """
+    Represents an export in progress. Every game recorded must have the
+    same players in the same seating order and the same number of spaces,
+    so each column has a fixed width:
+        game:      (rows,) int64 game ids
+        turn:      (rows,) int64 turns played
+        positions: (rows, players) int32 board indices
+        balances:  (rows, players) int64 or float64 balances
+        owners:    (rows, spaces) int32 owning seat indices (-1 if none)
+    """
+    def __init__(self, directory, names, spaces, typecode="q", chunk_rows=65536):
+        """
+        Creates an empty export, replacing any export in the directory.
+        :param directory: string representing the directory to write to
+        :param names: list of strings representing player names in seating order
+        :param spaces: int representing the number of spaces, GO included
+        :param typecode: "q" for int balances or "d" for float balances
+        :param chunk_rows: int representing the number of rows held in
+                           memory before they are written
+        """
+        os.makedirs(directory, exist_ok=True)
+        players = len(names)
+        balance_type = np.float64 if typecode == "d" else np.int64
+
+        self._directory = directory
+        self._names = list(names)
+        self._columns = {"game": (np.int64, 1),
+                         "turn": (np.int64, 1),
+                         "positions": (np.int32, players),
+                         "balances": (balance_type, players),
+                         "owners": (np.int32, spaces)}
+        self._buffers = {column: np.empty((chunk_rows, width), dtype=dtype)
+                         for column, (dtype, width) in self._columns.items()}
+        self._files = {column: open(os.path.join(directory, column + ".bin"), "wb")
+                       for column in self._columns}
+        self._integers = balance_type is np.int64
+        self._chunk_rows = chunk_rows
+        self._fill = 0                  # Rows buffered
+        self._rows = 0                  # Rows written
+        self._write_manifest()
+
+    @classmethod
+    def from_game(cls, directory, game, chunk_rows=65536):
+        """
+        Creates an empty export for games with the board and players of an
+        existing RealEstateGame object. Balances are stored as floats if any
+        of the game's money values or group multipliers is a float.
+        :param directory: string representing the directory to write to
+        :param game: RealEstateGame class object with a board
+        :param chunk_rows: int representing the number of rows held in memory
+        :return: HistoryWriter class object
+        """
+        snapshot = game.snapshot()
+        payout, rents, names, groups = snapshot.layout
+        values = ([payout] + list(rents) + [multiplier for indices, multiplier in groups]
+                  + list(snapshot.balances))
+        typecode = "d" if any(isinstance(value, float) for value in values) else "q"
+
+        return cls(directory, names, len(snapshot.owners), typecode, chunk_rows)
+
+    def get_rows(self):
+        """
+        Getter for rows
+        :return: int representing the number of rows recorded
+        """
+        return self._rows + self._fill
+
+    def record(self, game_id, turn, game):
+        """
+        Records the current state of a RealEstateGame object.
+        :param game_id: int identifying the game
+        :param turn: int representing the turns the game has played
+        :param game: RealEstateGame class object
+        :return: True if the row was recorded, False if the game's players,
+                 board, or balance type don't match the export
+        """
+        return self.record_snapshot(game_id, turn, game.snapshot())
+
+    def record_snapshot(self, game_id, turn, snapshot):
+        """
+        Records a game state taken with RealEstateGame.snapshot.
+        :param game_id: int identifying the game
+        :param turn: int representing the turns the game had played
+        :param snapshot: GameSnapshot namedtuple
+        :return: True if the row was recorded, False if the snapshot's
+                 players (by name, in seating order) or board don't match
+                 the export, or it has a float balance and the export
+                 stores ints
+        """
+        if (list(snapshot.layout[2]) != self._names
+                or len(snapshot.owners) != self._columns["owners"][1]):
+            return False
+
+        if self._integers and any(isinstance(balance, float) for balance in snapshot.balances):
+            return False                # Would be truncated
+
+        row = self._fill
+        buffers = self._buffers
+        buffers["game"][row, 0] = game_id
+        buffers["turn"][row, 0] = turn
+        buffers["positions"][row] = snapshot.positions
+        buffers["balances"][row] = snapshot.balances
+        buffers["owners"][row] = snapshot.owners
+        self._fill += 1
+
+        if self._fill == self._chunk_rows:
+            self.flush()
+
+        return True
+
+    def record_arrays(self, game_ids, turn, positions, balances, owners):
+        """
+        Records many games at once from arrays, such as those of a
+        BatchSimulator or SharedStateStore.arrays.
+        :param game_ids: array of ints identifying each game
+        :param turn: int, or array of ints, representing turns played
+        :param positions: (games, players) array of board indices
+        :param balances: (games, players) array of balances
+        :param owners: (games, spaces) array of owning seat indices
+        :return: True if the rows were recorded, False if the arrays' widths
+                 don't match the export, or balances are floats and the
+                 export stores ints
+        """
+        positions = np.asarray(positions)
+        owners = np.asarray(owners)
+        balances = np.asarray(balances)
+
+        if (positions.shape[1:] != (self._columns["positions"][1],)
+                or owners.shape[1:] != (self._columns["owners"][1],)
+                or self._integers and balances.dtype.kind == "f"):
+            return False
+
+        game_ids = np.asarray(game_ids)
+        turns = np.broadcast_to(np.asarray(turn), game_ids.shape)
+        buffers = self._buffers
+        start = 0
+
+        while start < len(game_ids):    # Copy into the buffer a chunk at a time
+            row = self._fill
+            count = min(len(game_ids) - start, self._chunk_rows - row)
+            stop = start + count
+
+            buffers["game"][row:row + count, 0] = game_ids[start:stop]
+            buffers["turn"][row:row + count, 0] = turns[start:stop]
+            buffers["positions"][row:row + count] = positions[start:stop]
+            buffers["balances"][row:row + count] = balances[start:stop]
+            buffers["owners"][row:row + count] = owners[start:stop]
+            self._fill += count
+            start = stop
+
+            if self._fill == self._chunk_rows:
+                self.flush()
+
+        return True
+
+    def record_batch(self, simulator, game_ids=None):
+        """
+        Records every game of a BatchSimulator at its current turn.
+        :param simulator: BatchSimulator class object
+        :param game_ids: array of ints identifying each game (defaults to
+                         0, 1, 2, ...)
+        :return: True if the rows were recorded, False otherwise
+        """
+        if game_ids is None:
+            game_ids = np.arange(len(simulator.balances))
+
+        return self.record_arrays(game_ids, simulator.get_turn(), simulator.positions,
+                                  simulator.balances, simulator.owners)
+
+    def flush(self):
+        """
+        Appends buffered rows to the column files and updates the manifest,
+        so the rows written so far can be loaded.
+        :return: None
+        """
+        if self._fill > 0:
+            for column, file in self._files.items():
+                self._buffers[column][:self._fill].tofile(file)
+                file.flush()
+
+            self._rows += self._fill
+            self._fill = 0
+            self._write_manifest()
+
+    def _write_manifest(self):
+        """
+        Helper for __init__ and flush. Replaces the manifest in one step, so
+        a reader never sees a partly written one.
+        """
+        manifest = {"version": VERSION,
+                    "rows": self._rows,
+                    "names": self._names,
+                    "columns": {column: {"dtype": np.dtype(dtype).str, "width": width}
+                                for column, (dtype, width) in self._columns.items()}}
+        path = os.path.join(self._directory, MANIFEST)
+
+        with open(path + ".tmp", "w") as file:
+            json.dump(manifest, file)
+
+        os.replace(path + ".tmp", path)
+
+    def close(self):
+        """
+        Writes buffered rows and closes the column files.
+        :return: None
+        """
+        self.flush()
+
+        for file in self._files.values():
+            file.close()
+
+
+def load_history(directory):
+    """
+    Memory-maps an export. Columns are read-only NumPy arrays backed by the
+    files, so only the pages used are read from disk. Rows written after the
+    manifest's last update are not included.
+    :param directory: string representing the export's directory
+    :return: History namedtuple
+    """
+    with open(os.path.join(directory, MANIFEST)) as file:
+        manifest = json.load(file)
+
+    rows = manifest["rows"]
+    columns = {}
+
+    for column, spec in manifest["columns"].items():
+        dtype = np.dtype(spec["dtype"])
+        shape = (rows, spec["width"])
+
+        if rows == 0:                   # A file can't map 0 bytes
+            array = np.empty(shape, dtype=dtype)
+        else:
+            array = np.memmap(os.path.join(directory, column + ".bin"), dtype=dtype,
+                              mode="r", shape=shape)
+
+        columns[column] = array[:, 0] if column in ("game", "turn") else array
+
+    return History(manifest["names"], columns["game"], columns["turn"], columns["positions"],
+                   columns["balances"], columns["owners"])
@@ -0,0 +1,130 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for HistoryExport.py. Exports played games in
+#                   small chunks, loads the export back, and checks every
+#                   row against the recorded game states.
+
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from BatchSimulator import BatchSimulator
+from GameDriver import play_game
+from HistoryExport import HistoryWriter, load_history
+from RealEstateGame import RealEstateGame
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+PLAYERS = [("Player 1", 1500), ("Player 2", 1500)]
+
+
+def new_game(balances=(1500, 1500)):
+    """Creates a game on the standard board with PLAYERS' names"""
+    game = RealEstateGame()
+    game.create_spaces(50, RENTS)
+
+    for (name, unused), balance in zip(PLAYERS, balances):
+        game.create_player(name, balance)
+
+    return game
+
+
+class Recorder:
+    """Stands in for a HistoryWriter, keeping every snapshot recorded"""
+
+    def __init__(self, writer):
+        """Wraps a HistoryWriter"""
+        self.writer = writer
+        self.rows = []
+
+    def record(self, game_id, turn, game):
+        """Keeps the game's snapshot and records it with the writer"""
+        self.rows.append((game_id, turn, game.snapshot()))
+        return self.writer.record(game_id, turn, game)
+
+
+class TestHistoryExport(unittest.TestCase):
+    """Contains export and load tests for HistoryExport"""
+
+    def setUp(self):
+        """Creates a directory for exports"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "history")
+
+    def tearDown(self):
+        """Removes the exports"""
+        self.directory.cleanup()
+
+    def test_load_export(self):
+        """A loaded export has every recorded row, across chunk boundaries"""
+        writer = HistoryWriter.from_game(self.path, new_game(), chunk_rows=7)
+        recorder = Recorder(writer)
+
+        for game_id in range(3):
+            play_game(RENTS, 50, PLAYERS, game_id, history=recorder, game_id=game_id)
+
+        self.assertEqual(load_history(self.path).game.shape, (writer.get_rows() // 7 * 7,))
+        writer.close()
+        history = load_history(self.path)
+
+        self.assertEqual(history.names, ["Player 1", "Player 2"])
+        self.assertEqual(len(history.game), len(recorder.rows))
+        self.assertEqual(history.balances.dtype, np.int64)
+
+        for row, (game_id, turn, snapshot) in enumerate(recorder.rows):
+            self.assertEqual((history.game[row], history.turn[row]), (game_id, turn))
+            self.assertEqual(tuple(history.positions[row]), snapshot.positions)
+            self.assertEqual(tuple(history.balances[row]), snapshot.balances)
+            self.assertEqual(tuple(history.owners[row]), snapshot.owners)
+
+    def test_record_arrays(self):
+        """Rows recorded from a BatchSimulator load back as its arrays"""
+        batch = BatchSimulator.from_game(new_game(), 10)
+        batch.run(40, seed=1)
+        writer = HistoryWriter.from_game(self.path, new_game(), chunk_rows=4)
+
+        self.assertTrue(writer.record_batch(batch))
+        writer.close()
+        history = load_history(self.path)
+
+        self.assertTrue((history.game == np.arange(10)).all())
+        self.assertTrue((history.turn == 40).all())
+        self.assertTrue((history.balances == batch.balances).all())
+        self.assertTrue((history.owners == batch.owners).all())
+
+    def test_mismatches_are_rejected(self):
+        """Other players, other boards, and float balances in an int export"""
+        writer = HistoryWriter.from_game(self.path, new_game())
+        renamed = RealEstateGame()
+        renamed.create_spaces(50, RENTS)
+        renamed.create_player("Player 2", 1500)
+        renamed.create_player("Player 1", 1500)
+        small = RealEstateGame()
+        small.create_spaces(50, RENTS[:6])
+
+        for name, unused in PLAYERS:
+            small.create_player(name, 1500)
+
+        self.assertFalse(writer.record(0, 0, renamed))
+        self.assertFalse(writer.record(0, 0, small))
+        self.assertFalse(writer.record(0, 0, new_game((1500, 1500.5))))
+        self.assertFalse(writer.record_arrays([0], 0, [[0, 0]], [[1500.5, 1500]],
+                                              [[-1] * (len(RENTS) + 1)]))
+        self.assertTrue(writer.record(0, 0, new_game()))
+        self.assertEqual(writer.get_rows(), 1)
+        writer.close()
+
+        floats = HistoryWriter.from_game(self.path, new_game((1500, 1500.5)))
+        self.assertTrue(floats.record(0, 0, new_game((1500, 1500.5))))
+        floats.close()
+        self.assertEqual(load_history(self.path).balances[0, 1], 1500.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,259 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Opt-in metrics for RealEstateGame. A GameMetrics object
+#                   attached with RealEstateGame.set_metrics times calls to
+#                   move_player, buy_space, create_player, check_game_over,
+#                   and display, and counts GO payouts, rent transfers,
+#                   bankruptcies, and property releases. Latencies are kept
+#                   in fixed histograms so memory does not grow with calls.
+#                   Metrics export as Prometheus text or a JSON snapshot.
+#                   Games without metrics are not wrapped at all.
+
+import json
+import time
+from array import array
+from bisect import bisect_left
+
+
+OPERATIONS = ("move_player", "buy_space", "award_space", "create_player", "check_game_over",
+              "display")
+
+COUNTERS = ("go_payouts", "go_payout_amount", "rent_transfers", "rent_amount",
+            "bankruptcies", "property_releases")
+
+# Upper bounds of the latency buckets in nanoseconds: 64 ns, 128 ns, ... ~1 s.
+# Slower calls fall in a last bucket with no upper bound.
+BUCKET_BOUNDS = tuple(2 ** power for power in range(6, 31))
+
+
+class Histogram:
+    """
+    Represents a latency distribution as counts per bucket. Memory is fixed
+    by the number of buckets.
+    """
+    __slots__ = ("_counts", "_total")
+
+    def __init__(self):
+        """
+        Creates an empty histogram.
+        """
+        self._counts = array("Q", bytes(8 * (len(BUCKET_BOUNDS) + 1)))
+        self._total = 0                 # Sum of observed nanoseconds
+
+    def observe(self, nanoseconds):
+        """
+        Adds one observation.
+        :param nanoseconds: int representing a call's latency
+        :return: None
+        """
+        self._counts[bisect_left(BUCKET_BOUNDS, nanoseconds)] += 1
+        self._total += nanoseconds
+
+    def get_count(self):
+        """
+        Getter for count
+        :return: int representing the number of observations
+        """
+        return sum(self._counts)
+
+    def get_total(self):
+        """
+        Getter for total
+        :return: int representing the sum of observations in nanoseconds
+        """
+        return self._total
+
+    def get_counts(self):
+        """
+        Getter for counts
+        :return: array of ints, one per bucket, the last without upper bound
+        """
+        return self._counts
+
+    def quantile(self, fraction):
+        """
+        Estimates a quantile as the upper bound of the bucket holding it.
+        :param fraction: float in range [0..1]
+        :return: int nanoseconds, None if empty or above the last bound
+        """
+        count = self.get_count()
+
+        if count == 0:
+            return None
+
+        rank = fraction * count
+        seen = 0
+
+        for index, bucket in enumerate(self._counts):
+            seen += bucket
+
+            if seen >= rank and bucket > 0:
+                return BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else None
+
+        return None
+
+
+class GameMetrics:
+    """
+    Represents the metrics of one game. Attach it with
+    RealEstateGame.set_metrics. Labels, such as a table name, are added to
+    every exported Prometheus sample.
+    """
+    def __init__(self, labels=None):
+        """
+        :param labels: dictionary of label names to string values, or None
+        """
+        self._labels = dict(labels or {})
+        self._histograms = {operation: Histogram() for operation in OPERATIONS}
+        self._counters = dict.fromkeys(COUNTERS, 0)
+
+    def attach(self, game):
+        """
+        Replaces the game's instrumented methods with timed wrappers. Called
+        by RealEstateGame.set_metrics.
+        :param game: RealEstateGame class object
+        :return: None
+        """
+        for operation in OPERATIONS:
+            method = getattr(type(game), operation).__get__(game)
+            setattr(game, operation, self._timed(method, self._histograms[operation]))
+
+    def detach(self, game):
+        """
+        Restores the game's methods. Called by RealEstateGame.set_metrics.
+        :param game: RealEstateGame class object
+        :return: None
+        """
+        for operation in OPERATIONS:
+            game.__dict__.pop(operation, None)
+
+    @staticmethod
+    def _timed(method, histogram):
+        """
+        Wraps a bound method so each call's latency is observed.
+        """
+        clock = time.perf_counter_ns
+        observe = histogram.observe
+
+        def timed(*args, **kwargs):
+            start = clock()
+
+            try:
+                return method(*args, **kwargs)
+            finally:
+                observe(clock() - start)
+
+        return timed
+
+    def observe(self, operation, nanoseconds):
+        """
+        Adds a latency timed by the caller, such as RealEstateGame.play_turns,
+        which plays turns through helpers instead of the wrapped methods.
+        :param operation: string, one of OPERATIONS
+        :param nanoseconds: int representing the call's latency
+        :return: None
+        """
+        self._histograms[operation].observe(nanoseconds)
+
+    def count(self, counter, amount=1):
+        """
+        Increases a domain counter.
+        :param counter: string, one of COUNTERS
+        :param amount: int or float to add
+        :return: None
+        """
+        self._counters[counter] += amount
+
+    def get_counter(self, counter):
+        """
+        Getter for counter
+        :param counter: string, one of COUNTERS
+        :return: int or float
+        """
+        return self._counters[counter]
+
+    def get_histogram(self, operation):
+        """
+        Getter for histogram
+        :param operation: string, one of OPERATIONS
+        :return: Histogram class object
+        """
+        return self._histograms[operation]
+
+    def snapshot(self):
+        """
+        Creates a JSON-serializable copy of the metrics. Latencies are in
+        seconds; quantiles are bucket upper bounds (None past the last one).
+        :return: dictionary
+        """
+        operations = {}
+
+        for operation, histogram in self._histograms.items():
+            p50 = histogram.quantile(0.5)
+            p99 = histogram.quantile(0.99)
+            operations[operation] = {
+                "calls": histogram.get_count(),
+                "total_seconds": histogram.get_total() / 1e9,
+                "p50_seconds": None if p50 is None else p50 / 1e9,
+                "p99_seconds": None if p99 is None else p99 / 1e9,
+                "buckets": [[bound / 1e9, count] for bound, count
+                            in zip(BUCKET_BOUNDS, histogram.get_counts())
+                            if count > 0]}
+
+        return {"labels": dict(self._labels),
+                "operations": operations,
+                "counters": dict(self._counters)}
+
+    def to_json(self):
+        """
+        :return: string of the snapshot as JSON
+        """
+        return json.dumps(self.snapshot(), sort_keys=True)
+
+    def _label_text(self, extra=()):
+        """
+        Helper for to_prometheus. Formats labels as {name="value",...}.
+        """
+        pairs = list(self._labels.items()) + list(extra)
+
+        if len(pairs) == 0:
+            return ""
+
+        text = ",".join('{}="{}"'.format(name, str(value).replace("\\", "\\\\")
+                                         .replace('"', '\\"').replace("\n", "\\n"))
+                        for name, value in pairs)
+
+        return "{" + text + "}"
+
+    def to_prometheus(self, prefix="realestate"):
+        """
+        Formats the metrics in the Prometheus text exposition format. Each
+        operation is a histogram labelled with its name; each domain counter
+        is a counter.
+        :param prefix: string prepended to every metric name
+        :return: string
+        """
+        name = f"{prefix}_operation_seconds"
+        lines = [f"# HELP {name} Latency of RealEstateGame operations.",
+                 f"# TYPE {name} histogram"]
+
+        for operation, histogram in self._histograms.items():
+            label = ("operation", operation)
+            cumulative = 0
+
+            for bound, count in zip(BUCKET_BOUNDS, histogram.get_counts()):
+                cumulative += count
+                labels = self._label_text([label, ("le", repr(bound / 1e9))])
+                lines.append(f"{name}_bucket{labels} {cumulative}")
+
+            labels = self._label_text([label, ("le", "+Inf")])
+            lines.append(f"{name}_bucket{labels} {histogram.get_count()}")
+            lines.append(f"{name}_sum{self._label_text([label])} {histogram.get_total() / 1e9!r}")
+            lines.append(f"{name}_count{self._label_text([label])} {histogram.get_count()}")
+
+        for counter, value in self._counters.items():
+            lines.append(f"# TYPE {prefix}_{counter}_total counter")
+            lines.append(f"{prefix}_{counter}_total{self._label_text()} {value}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,274 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Computes how often each space of a RealEstateGame board
+#                   is landed on and the rent it is expected to earn, without
+#                   playing games. Movement in move_player is a walk around
+#                   the board with rolls in range [1..6], so a player's
+#                   position is a Markov chain. Results are cached by board
+#                   configuration so repeated queries return immediately.
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+
+# Results of analyze_board. Arrays have one entry per space, GO at index 0.
+# landing: probability of landing on each space on a turn (long run), or the
+#          expected number of landings within horizon turns from GO
+# rent_yield: expected rent paid to the owner of each property per turn of
+#             one opposing player (per horizon if horizon is set)
+# roi: rent_yield divided by the property's price (0 for GO)
+# go_payout: expected GO payout collected per turn (per horizon if set)
+BoardAnalysis = namedtuple("BoardAnalysis", ["landing", "rent_yield", "roi", "go_payout"])
+
+
+def transition_matrix(board_size, die_sides=6):
+    """
+    Creates the matrix of probabilities of moving from one space to another
+    in one turn. Row i holds the probabilities of ending the turn on each
+    space when starting from space i.
+    :param board_size: int representing the number of spaces including GO
+    :param die_sides: int representing the largest roll
+    :return: (board_size, board_size) array
+    """
+    matrix = np.zeros((board_size, board_size))
+
+    for roll in range(1, die_sides + 1):
+        matrix[np.arange(board_size), (np.arange(board_size) + roll) % board_size] += 1 / die_sides
+
+    return matrix
+
+
+def stationary_distribution(matrix):
+    """
+    Solves for the long run probability of being on each space, the vector
+    pi with pi P = pi whose entries sum to 1.
+    :param matrix: (n, n) transition matrix
+    :return: array of n probabilities
+    """
+    size = matrix.shape[0]
+    system = np.vstack([matrix.T - np.eye(size), np.ones(size)])
+    target = np.zeros(size + 1)
+    target[-1] = 1
+
+    return np.linalg.lstsq(system, target, rcond=None)[0]
+
+
+def expected_landings(matrix, horizon):
+    """
+    Computes the expected number of times each space is landed on during
+    the first horizon turns of a player starting on GO.
+    :param matrix: (n, n) transition matrix
+    :param horizon: int representing the number of turns
+    :return: array of n expected landing counts
+    """
+    position = np.zeros(matrix.shape[0])
+    position[0] = 1
+    total = np.zeros(matrix.shape[0])
+
+    for _ in range(horizon):                # Sum of rows of P, P^2, ..., P^horizon
+        position = position @ matrix
+        total += position
+
+    return total
+
+
+@lru_cache(maxsize=64)
+def landings_from(board_size, horizon, die_sides=6):
+    """
+    Computes the expected number of times each space is landed on during
+    the next horizon turns of a player, for every space the player could
+    start on. Results are cached by (board_size, horizon, die_sides).
+    :param board_size: int representing the number of spaces including GO
+    :param horizon: int representing the number of turns
+    :param die_sides: int representing the largest roll
+    :return: read-only (board_size, board_size) array whose row i holds the
+             expected landing counts of a player starting on space i
+    """
+    matrix = transition_matrix(board_size, die_sides)
+    step = np.eye(board_size)
+    total = np.zeros((board_size, board_size))
+
+    for _ in range(horizon):                # Sum of P, P^2, ..., P^horizon
+        step = step @ matrix
+        total += step
+
+    total.setflags(write=False)             # Cached results are shared
+
+    return total
+
+
+@lru_cache(maxsize=64)
+def landings_ahead(horizon, die_sides=6):
+    """
+    Computes the probability that a player lands exactly k spaces ahead of
+    where it stands, counting laps, during its next horizon turns. Every
+    roll moves the player forward, so it lands k spaces ahead at most once,
+    and the probability is also the expected number of such landings. The
+    result doesn't depend on the board size, so one cached array serves
+    boards of any size (see expected_landings_at).
+    :param horizon: int representing the number of turns
+    :param die_sides: int representing the largest roll
+    :return: read-only array of horizon * die_sides + 1 probabilities,
+             indexed by k (entry 0 is 0)
+    """
+    distance = np.zeros(horizon * die_sides + 1)
+    distance[0] = 1
+    total = np.zeros_like(distance)
+
+    for _ in range(horizon):                # Distribution of distance after each turn
+        moved = np.zeros_like(distance)
+
+        for roll in range(1, die_sides + 1):
+            moved[roll:] += distance[:-roll] / die_sides
+
+        distance = moved
+        total += moved
+
+    total.setflags(write=False)             # Cached results are shared
+
+    return total
+
+
+def expected_landings_at(board_size, distance, horizon, die_sides=6):
+    """
+    Computes the expected number of times a player lands on the space a
+    given distance ahead of it during its next horizon turns: entry
+    landings_from(board_size, horizon)[start, (start + distance) %
+    board_size] without building the board's transition matrix. Takes
+    time proportional to 1 + horizon * die_sides / board_size, so it suits
+    boards of any size.
+    :param board_size: int representing the number of spaces including GO
+    :param distance: int representing how many spaces ahead the space is
+                     (taken modulo board_size)
+    :param horizon: int representing the number of turns
+    :param die_sides: int representing the largest roll
+    :return: float expected number of landings
+    """
+    ahead = landings_ahead(horizon, die_sides)
+
+    return float(ahead[distance % board_size::board_size].sum())
+
+
+def pass_go_probability(board_size, die_sides=6):
+    """
+    Computes the long run probability of passing or landing on GO in one
+    turn, which is when move_player pays the GO payout.
+    :param board_size: int representing the number of spaces including GO
+    :param die_sides: int representing the largest roll
+    :return: float probability
+    """
+    return (die_sides + 1) / 2 / board_size
+
+
+@lru_cache(maxsize=256)
+def _analyze(payout, rents, horizon, charged=None):
+    """
+    Cached body of analyze_board. Takes hashable arguments only. Prices
+    come from the base rents, rent yields from the rents charged (the base
+    rents unless passed).
+    """
+    board_size = len(rents) + 1
+    matrix = transition_matrix(board_size)
+
+    if horizon is None:
+        landing = stationary_distribution(matrix)
+        go_payout = pass_go_probability(board_size) * payout
+    else:
+        landing = expected_landings(matrix, horizon)
+        go_payout = expected_go_passes(board_size, horizon) * payout
+
+    price = np.array((0,) + rents, dtype=float) * 5
+    rent_yield = landing * np.array((0,) + (rents if charged is None else charged), dtype=float)
+    roi = np.divide(rent_yield, price, out=np.zeros(board_size), where=price != 0)
+
+    for values in (landing, rent_yield, roi):
+        values.setflags(write=False)            # Cached results are shared
+
+    return BoardAnalysis(landing, rent_yield, roi, go_payout)
+
+
+def expected_go_passes(board_size, horizon, die_sides=6):
+    """
+    Computes the expected number of GO payouts in the first horizon turns of
+    a player starting on GO. A payout happens when the total distance moved
+    crosses a multiple of board_size.
+    :param board_size: int representing the number of spaces including GO
+    :param horizon: int representing the number of turns
+    :param die_sides: int representing the largest roll
+    :return: float expected number of payouts
+    """
+    # Distribution of total distance moved, truncated to what can be reached
+    distance = np.zeros(horizon * die_sides + 1)
+    distance[0] = 1
+    passes = 0.0
+
+    for turn in range(horizon):
+        moved = np.zeros_like(distance)
+
+        for roll in range(1, die_sides + 1):
+            moved[roll:] += distance[:-roll] / die_sides
+
+        laps_before = np.arange(len(distance)) // board_size
+
+        for roll in range(1, die_sides + 1):   # Add chance this roll crosses GO
+            crossed = (np.arange(len(distance)) + roll) // board_size > laps_before
+            passes += (distance * crossed).sum() / die_sides
+
+        distance = moved
+
+    return passes
+
+
+def analyze_board(payout, rents, horizon=None):
+    """
+    Computes landing frequencies and rent yields for a board. Results are
+    cached by (payout, rents, horizon).
+    :param payout: int or float representing payout amount for GO space
+    :param rents: list of ints or floats representing space rent values
+    :param horizon: int representing a number of turns from GO, or None for
+                    long run per-turn rates
+    :return: BoardAnalysis namedtuple
+    """
+    return _analyze(payout, tuple(rents), horizon)
+
+
+def analyze_game(game, horizon=None):
+    """
+    Computes landing frequencies and rent yields for the board of a game.
+    Rents are the rents currently charged, so the properties of a color
+    group with a full owner yield their multiplied rent.
+    :param game: RealEstateGame class object with a board
+    :param horizon: int representing a number of turns from GO, or None for
+                    long run per-turn rates
+    :return: BoardAnalysis namedtuple
+    """
+    payout, rents, names, groups = game.get_layout()
+
+    if len(groups) == 0:
+        return _analyze(payout, rents, horizon)
+
+    charged = list(rents)
+
+    for indices, multiplier in groups:
+        for index in indices:
+            charged[index - 1] = game.get_space(index).get_rent()
+
+    charged = tuple(charged)
+
+    if charged == rents:                    # Share results while no set is full
+        return _analyze(payout, rents, horizon)
+
+    return _analyze(payout, rents, horizon, charged)
+
+
+def clear_cache():
+    """
+    Empties the cache of board analyses.
+    :return: None
+    """
+    _analyze.cache_clear()
+    landings_from.cache_clear()
+    landings_ahead.cache_clear()
@@ -0,0 +1,99 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for MarkovAnalyzer.py. Compares expected
+#                   landings and GO payouts with exact counts over every
+#                   sequence of rolls on small boards.
+
+
+import itertools
+import unittest
+
+import numpy as np
+
+from MarkovAnalyzer import (analyze_board, analyze_game, expected_go_passes, expected_landings,
+                            expected_landings_at, landings_from, pass_go_probability, stationary_distribution,
+                            transition_matrix)
+from RealEstateGame import RealEstateGame
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+
+def enumerate_walks(board_size, start, horizon):
+    """
+    Walks every sequence of rolls the way move_player moves.
+    :return: tuple of (array of average landings per space, average GO payouts)
+    """
+    landings = np.zeros(board_size)
+    payouts = 0
+
+    for rolls in itertools.product(range(1, 7), repeat=horizon):
+        pos = start
+
+        for roll in rolls:
+            pos += roll
+
+            if pos > board_size - 1:
+                pos -= board_size
+                payouts += 1
+
+            landings[pos] += 1
+
+    walks = 6 ** horizon
+
+    return landings / walks, payouts / walks
+
+
+class TestMarkovAnalyzer(unittest.TestCase):
+    """Contains exact comparisons for MarkovAnalyzer"""
+
+    def test_matches_every_walk(self):
+        """Expected landings and GO payouts equal counts over all roll sequences"""
+        for board_size in (7, 11):
+            matrix = transition_matrix(board_size)
+            rows = landings_from(board_size, 4)
+
+            for start in range(board_size):
+                landings, payouts = enumerate_walks(board_size, start, 4)
+                self.assertTrue(np.allclose(rows[start], landings))
+                self.assertTrue(np.allclose([expected_landings_at(board_size, index - start, 4)
+                                             for index in range(board_size)], landings))
+
+                if start == 0:
+                    self.assertTrue(np.allclose(expected_landings(matrix, 4), landings))
+                    self.assertAlmostEqual(expected_go_passes(board_size, 4), payouts)
+
+    def test_long_run(self):
+        """The long run walk is uniform and passes GO at the mean roll over the size"""
+        for board_size in (7, 25):
+            matrix = transition_matrix(board_size)
+
+            self.assertTrue(np.allclose(matrix.sum(axis=1), 1))
+            self.assertTrue(np.allclose(stationary_distribution(matrix), 1 / board_size))
+            self.assertAlmostEqual(pass_go_probability(board_size), 3.5 / board_size)
+
+    def test_analyze_game(self):
+        """Results are cached by board, and full color groups yield more rent"""
+        game = RealEstateGame()
+        game.create_spaces(50, RENTS, groups=[([1, 2], 3)])
+        game.create_player("Player 1", 1000)
+        board = analyze_board(50, RENTS)
+
+        self.assertIs(analyze_game(game), board)
+        self.assertFalse(board.roi.flags.writeable)
+
+        for _ in range(2):
+            game.move_player("Player 1", 1)
+            game.buy_space("Player 1")
+
+        analysis = analyze_game(game)
+
+        self.assertAlmostEqual(analysis.rent_yield[1], board.rent_yield[1] * 3)
+        self.assertAlmostEqual(analysis.roi[2], board.roi[2] * 3)
+        self.assertEqual(analysis.rent_yield[3], board.rent_yield[3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,261 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Measures the memory used by one 25 space, 4 player game.
+#                   Compares the original object model (a __dict__ per
+#                   instance holding only the original classes' fields), the
+#                   current fields in a __dict__ per instance, the current
+#                   fields in __slots__, and a column-oriented BoardState
+#                   copy. Instances are measured by allocating real copies
+#                   under tracemalloc.
+#                   __slots__ are always on; there is no switch back to a
+#                   __dict__ per instance. Every game pays the compact
+#                   layout's price: board and player instances can't be
+#                   given attributes their classes don't declare, and can't
+#                   be weakly referenced.
+
+import sys
+import tracemalloc
+from array import array
+
+from RealEstateGame import RealEstateGame
+from BoardState import BoardState
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+BASELINE_FIELDS = {                         # Fields of the original classes
+    "GO": ("_name", "_value"),
+    "Property": ("_name", "_value", "_price", "_owner"),
+    "Player": ("_name", "_balance", "_pos"),
+}
+
+
+def slot_names(obj):
+    """
+    Collects the names of every slot defined on an object's classes.
+    :param obj: any object
+    :return: list of strings representing slot names
+    """
+    names = []
+
+    for cls in type(obj).__mro__:
+        names.extend(cls.__dict__.get("__slots__", ()))
+
+    return names
+
+
+def deep_size(obj, seen, instances):
+    """
+    Adds up the size of an object and everything it references. Each object
+    is counted once. Instances of slotted classes are not sized here but
+    collected, to be measured with measure_instances.
+    :param obj: object to measure
+    :param seen: set of ids of objects already counted
+    :param instances: list that slotted instances are appended to
+    :return: int representing size in bytes, without slotted instances
+    """
+    if id(obj) in seen:
+        return 0
+
+    seen.add(id(obj))
+
+    if isinstance(obj, (str, bytes, int, float, array)) or obj is None:
+        return sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(deep_size(key, seen, instances)
+                                        + deep_size(value, seen, instances)
+                                        for key, value in obj.items())
+
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(deep_size(item, seen, instances) for item in obj)
+
+    names = slot_names(obj)
+    values = {name: getattr(obj, name) for name in names if hasattr(obj, name)}
+
+    if hasattr(obj, "__dict__"):
+        values.update(vars(obj))
+        size = sys.getsizeof(obj) + sys.getsizeof(vars(obj))
+    else:
+        instances.append(obj)
+        size = 0
+
+    return size + sum(deep_size(value, seen, instances) for value in values.values())
+
+
+def measure_instances(instances, slotted):
+    """
+    Measures slotted instances by allocating a copy of each under
+    tracemalloc. Copies either use the instance's own class, or a class of
+    the same name without __slots__, so the current attributes go in a real
+    per-instance __dict__. Copies share the originals' attribute values, so
+    only the instances are measured.
+    :param instances: list of instances of slotted classes
+    :param slotted: True to copy with __slots__, False with a __dict__
+    :return: int representing bytes allocated for the copies
+    """
+    classes = {}
+
+    for obj in instances:                   # Create classes and their shared
+        cls = type(obj)                     # key tables before measuring
+
+        if cls not in classes:
+            classes[cls] = cls if slotted else type(cls.__name__, (), {})
+            copy_instance(obj, classes[cls])
+
+    copies = [None] * len(instances)
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    for index, obj in enumerate(instances):
+        copies[index] = copy_instance(obj, classes[type(obj)])
+
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    return size
+
+
+def copy_instance(obj, cls):
+    """
+    Helper for measure_instances. Creates an instance of cls with the slot
+    values of obj, set in slot order as __init__ would.
+    :param obj: instance of a slotted class
+    :param cls: class to instantiate
+    :return: instance of cls
+    """
+    copy = object.__new__(cls)
+
+    for name in slot_names(obj):
+        if hasattr(obj, name):
+            setattr(copy, name, getattr(obj, name))
+
+    return copy
+
+
+def copy_fields(obj, cls, names):
+    """
+    Helper for build_baseline. Creates an instance of cls with some of the
+    attribute values of obj, set in the passed order.
+    :param obj: instance to copy from
+    :param cls: class to instantiate
+    :param names: sequence of strings representing attribute names
+    :return: instance of cls
+    """
+    copy = object.__new__(cls)
+
+    for name in names:
+        setattr(copy, name, getattr(obj, name))
+
+    return copy
+
+
+def build_baseline(game, classes):
+    """
+    Helper for measure_baseline. Copies a game into the original object
+    layout: spaces and players with only the original classes' fields, a
+    plain list of players, and a game holding just the board and that list.
+    :param game: RealEstateGame class object with a list board
+    :param classes: dictionary mapping class names to classes without
+                    __slots__
+    :return: instance of classes["RealEstateGame"]
+    """
+    players = {}
+
+    for player in game._players:
+        players[player] = copy_fields(player, classes["Player"], BASELINE_FIELDS["Player"])
+
+    board = []
+
+    for space in game._board:
+        name = type(space).__name__
+        copy = copy_fields(space, classes[name], BASELINE_FIELDS[name])
+
+        if getattr(copy, "_owner", None) is not None:
+            copy._owner = players[copy._owner]
+
+        board.append(copy)
+
+    copy = object.__new__(classes["RealEstateGame"])
+    copy._board = board
+    copy._players = list(players.values())
+
+    return copy
+
+
+def measure_baseline(game):
+    """
+    Measures a game as the original object model stored it. The copy is
+    allocated under tracemalloc; the attribute values it shares with the
+    passed game, like names and balances, are added once each.
+    :param game: RealEstateGame class object with a list board
+    :return: int representing size in bytes
+    """
+    classes = {name: type(name, (), {})
+               for name in ("GO", "Property", "Player", "RealEstateGame")}
+    build_baseline(game, classes)           # Create shared key tables first
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    copy = build_baseline(game, classes)
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    seen = set()
+
+    for obj in copy._players + copy._board:
+        for value in vars(obj).values():
+            if type(value) not in classes.values():
+                size += deep_size(value, seen, [])
+
+    return size
+
+
+def build_game():
+    """
+    Creates a standard 25 space, 4 player game with some properties owned.
+    :return: RealEstateGame class object
+    """
+    game = RealEstateGame()
+    game.create_spaces(50, RENTS)
+
+    for number in range(1, 5):
+        game.create_player(f"Player {number}", 1500)
+
+    for number, roll in zip([1, 2, 3, 4] * 3, [3, 5, 6, 1, 2, 4, 6, 6, 3, 1, 5, 2]):
+        game.move_player(f"Player {number}", roll)
+        game.buy_space(f"Player {number}")
+
+    return game
+
+
+def main():
+    """
+    Prints bytes per game for each representation.
+    :return: None
+    """
+    game = build_game()
+    board_state = BoardState.from_game(game)
+    baseline = measure_baseline(game)
+
+    instances = []
+    shared = deep_size(game, set(), instances)
+    before = shared + measure_instances(instances, False)
+    slots = shared + measure_instances(instances, True)
+
+    instances = []
+    columns = deep_size(board_state, set(), instances)
+    columns += measure_instances(instances, True)
+
+    print(f"Original classes, __dict__ : {baseline:6} bytes per game")
+    print(f"Current fields, __dict__   : {before:6} bytes per game "
+          f"({before / baseline:.0%})")
+    print(f"Current fields, __slots__  : {slots:6} bytes per game ({slots / baseline:.0%})")
+    print(f"BoardState columns         : {columns:6} bytes per game "
+          f"({columns / baseline:.0%})")
+
+
+if __name__ == "__main__":
+    main()
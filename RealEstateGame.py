@@ -7,6 +7,67 @@
 #                   Property rent values, number of players, player names,
 #                   player starting balances, and GO space payout are set by
 #                   the user. Property purchase values are 5x rent.
+#                   Board and player classes always define __slots__ so that
+#                   keeping many games in memory stays compact. There is no
+#                   __dict__ mode: their instances can't take attributes the
+#                   classes don't declare, and can't be weakly referenced.
+
+
+import time
+from array import array
+from collections import namedtuple
+from itertools import repeat
+from operator import itemgetter
+
+import numpy as np
+
+from GameEvents import Bankrupt, GoPayout, Moved, PlayerCreated, Purchased, RentPaid, Won
+
+
+# Flat, immutable copy of a game's state created by RealEstateGame.snapshot.
+# layout is a tuple of (payout, tuple of rents, tuple of player names) shared
+# between snapshots of the same game. balances and positions hold one entry
+# per player in creation order. owners holds one player index per space
+# (-1 for GO and for spaces without an owner).
+GameSnapshot = namedtuple("GameSnapshot", ["layout", "balances", "positions", "owners"])
+
+# Results of RealEstateGame.play_turns, one array entry per turn. positions
+# is -1 for players that don't exist. rents holds the amount actually taken
+# from the player. purchases and eliminations hold 1 or 0.
+TurnResults = namedtuple("TurnResults", ["positions", "rents", "purchases", "eliminations"])
+
+PLAY_TURNS_BATCH = 256                  # Turns play_turns first tries as an array batch
+PLAY_TURNS_MAX_BATCH = 1 << 14          # Largest array batch
+PLAY_TURNS_MAX_LOOP = 1 << 10           # Most turns looped over between batches
+PLAY_TURNS_LIMIT = 1 << 62              # Money that int64 batches can hold safely
+
+
+def _running_totals(values, firsts, lengths):
+    """
+    Helper for RealEstateGame._play_batch. Adds up values that are grouped
+    by seat, restarting at the start of each seat's group.
+    :param values: NumPy int array of values grouped by seat
+    :param firsts: NumPy array of the indices where a seat's group starts
+    :param lengths: NumPy array of the length of each seat's group
+    :return: NumPy int array holding, for each value, the sum of its
+             group's values up to and including it
+    """
+    totals = np.cumsum(values)
+    totals -= np.repeat(totals[firsts] - values[firsts], lengths)
+
+    return totals
+
+
+def property_name(index):
+    """
+    Creates the name of the property space at index, e.g. "Prop_07".
+    :param index: int representing the index of a property space
+    :return: string representing the property's name
+    """
+    if index < 10:
+        return f"Prop_0{index}"
+
+    return f"Prop_{index}"
 
 
 class Space:
@@ -14,6 +75,8 @@ class Space:
     Represents a space on a game board with a unique name
     and value.
     """
+    __slots__ = ("_name", "_value")
+
     def __init__(self, name, value):
         """
         Creates a new space of specified name and value.
@@ -37,6 +100,8 @@ class GO(Space):
     a user defined payout value. Cannot be owned and does not
     have ownership functionality.
     """
+    __slots__ = ()
+
     def __init__(self, payout):
         """
         Creates a new GO space with the name "GO" and specified
@@ -58,8 +123,14 @@ class Property(Space):
     Represents a property type of Space class object with a unique name,
     a user defined rent value, and a purchase price of 5x rent. Has an
     owner that is initialized to None, can be set to a Player class object,
-    and can be reverted to None.
+    and can be reverted to None. Changing the owner keeps the portfolios
+    of the previous and new owner up to date.
+    A property may belong to a PropertyGroup. Its effective rent is kept
+    in _rent and is updated by the group when a full set changes hands, so
+    reading the rent never looks at the rest of the group.
     """
+    __slots__ = ("_price", "_owner", "_rent", "_group")
+
     def __init__(self, name, rent):
         """
         Creates a new Property space of specified name and rent,
@@ -70,14 +141,31 @@ class Property(Space):
         super().__init__(name, rent)
         self._price = self._value * 5
         self._owner = None
+        self._rent = rent
+        self._group = None
 
     def get_rent(self):
         """
-        Getter for value, the property space's rent
+        Getter for the property space's effective rent: its value, times
+        its group's multiplier while one player owns the whole group
         :return: int or float representing space's rent value
         """
+        return self._rent
+
+    def get_base_rent(self):
+        """
+        Getter for value, the rent the property was created with
+        :return: int or float representing space's base rent value
+        """
         return self._value
 
+    def get_group(self):
+        """
+        Getter for group
+        :return: PropertyGroup class object (None if not in a group)
+        """
+        return self._group
+
     def get_price(self):
         """
         Getter for price, which is a function of the property
@@ -95,18 +183,129 @@ class Property(Space):
 
     def set_owner(self, buyer):
         """
-        Setter for owner
+        Setter for owner. Removes the property from the previous owner's
+        portfolio and adds it to the buyer's portfolio.
         :param buyer: Player class object or None
         :return: None
         """
+        previous = self._owner
+
+        if previous is not None:
+            previous.remove_property(self)
+
         self._owner = buyer
 
+        if buyer is not None:
+            buyer.add_property(self)
+
+        if self._group is not None:
+            self._group.owner_changed(previous, buyer)
+
+
+class PropertyGroup:
+    """
+    Represents a color group of properties. Owning every property of the
+    group multiplies their rent. Keeps a count of properties per owner, so
+    a change of owner is an O(1) update, and only rewrites the effective
+    rents of its members when a full set is completed or broken.
+    """
+    __slots__ = ("_size", "_multiplier", "_members", "_counts")
+
+    def __init__(self, size, multiplier):
+        """
+        Creates an empty group.
+        :param size: int representing the number of properties in the group
+        :param multiplier: int or float applied to rent for a full set
+        """
+        self._size = size
+        self._multiplier = multiplier
+        self._members = []              # Created Property objects of the group
+        self._counts = {}               # Player to number of members owned
+
+    def get_multiplier(self):
+        """
+        Getter for multiplier
+        :return: int or float applied to rent for a full set
+        """
+        return self._multiplier
+
+    def get_members(self):
+        """
+        Getter for members
+        :return: list of Property class objects in the group
+        """
+        return list(self._members)
+
+    def get_full_owner(self):
+        """
+        :return: Player object owning every property of the group (None if
+                 no player does)
+        """
+        for owner, count in self._counts.items():
+            if count == self._size:
+                return owner
+
+        return None
+
+    def add(self, prop):
+        """
+        Adds an unowned property to the group.
+        :param prop: Property class object
+        :return: None
+        """
+        prop._group = self
+        self._members.append(prop)
+
+    def owner_changed(self, previous, buyer):
+        """
+        Updates the owner counts after a member changes owner, and the
+        effective rents if a full set was completed or broken. Called by
+        Property.set_owner.
+        :param previous: Player object that owned the member, or None
+        :param buyer: Player object that owns the member now, or None
+        :return: None
+        """
+        counts = self._counts
+        size = self._size
+        changed = False
+
+        if previous is not None:
+            count = counts[previous]
+            changed = count == size         # Full set broken
+
+            if count == 1:
+                del counts[previous]
+            else:
+                counts[previous] = count - 1
+
+        if buyer is not None:
+            count = counts.get(buyer, 0) + 1
+            counts[buyer] = count
+            changed = changed or count == size  # Full set completed
+
+        if changed:
+            self._update_rents()
+
+    def _update_rents(self):
+        """
+        Rewrites the effective rent of every member.
+        :return: None
+        """
+        multiplier = self._multiplier if self.get_full_owner() is not None else 1
+
+        for prop in self._members:
+            prop._rent = prop._value * multiplier
+
 
 class Player:
     """
-    Represents a player with a name, a balance, and a position on the
-    game board
+    Represents a player with a name, a balance, a position on the
+    game board, and a portfolio of the Property objects the player owns.
+    The portfolio is maintained by Property.set_owner. A player belonging
+    to a PlayerRegistry tells it when its balance crosses 0.
     """
+    __slots__ = ("_name", "_balance", "_pos", "_properties", "_registry")
+
     def __init__(self, name, balance):
         """
         Creates a new player positioned at GO (index 0) with the specified
@@ -117,6 +316,8 @@ class Player:
         self._name = name
         self._balance = balance
         self._pos = 0
+        self._properties = {}           # Ordered set of owned properties
+        self._registry = None           # Set by PlayerRegistry.add
 
     def get_name(self):
         """
@@ -125,6 +326,15 @@ class Player:
         """
         return self._name
 
+    def set_name(self, name):
+        """
+        Setter for name. Should only be called by PlayerRegistry so the
+        registry's name index stays in sync with the player's name.
+        :param name: string representing the player's new name
+        :return: None
+        """
+        self._name = name
+
     def get_balance(self):
         """
         Getter for balance
@@ -132,6 +342,18 @@ class Player:
         """
         return self._balance
 
+    def set_balance(self, balance):
+        """
+        Setter for balance. Used to restore a saved game state; play should
+        change balances through update_balance.
+        :param balance: int or float representing the player's new balance
+        :return: None
+        """
+        self._balance = balance
+
+        if self._registry is not None:      # Keep solvent players in sync
+            self._registry.track(self)      # without firing callbacks
+
     def get_pos(self):
         """
         Getter for pos
@@ -147,6 +369,45 @@ class Player:
         """
         self._pos = pos
 
+    def get_properties(self):
+        """
+        Getter for the player's portfolio
+        :return: list of Property class objects owned by the player
+                 in order of acquisition
+        """
+        return list(self._properties)
+
+    def add_property(self, prop):
+        """
+        Adds a property to the player's portfolio. Should only be called
+        by Property.set_owner.
+        :param prop: Property class object
+        :return: None
+        """
+        self._properties[prop] = None
+
+    def remove_property(self, prop):
+        """
+        Removes a property from the player's portfolio. Should only be
+        called by Property.set_owner.
+        :param prop: Property class object
+        :return: None
+        """
+        self._properties.pop(prop, None)
+
+    def release_properties(self):
+        """
+        Returns every property in the player's portfolio to the bank by
+        setting its owner to None.
+        :return: list of Property class objects that were released
+        """
+        released = self.get_properties()
+
+        for prop in released:
+            prop.set_owner(None)
+
+        return released
+
     def update_balance(self, amount):
         """
         Alters player's balance by amount. Amount can be either positive
@@ -154,11 +415,492 @@ class Player:
         :param amount: int or float representing a monetary value
         :return: None
         """
+        solvent = self._balance > 0
+
         if amount < -self._balance:     # Disallow balance below 0
             self._balance = 0
         else:
             self._balance += amount
 
+        if (self._balance > 0) != solvent and self._registry is not None:
+            self._registry.solvency_changed(self)   # Balance crossed 0
+
+
+class PlayerRegistry:
+    """
+    Represents the collection of players in a game. Players are stored in
+    a dictionary keyed by name, so lookups by name take constant time and
+    iteration follows the order in which players were added. Iterating
+    over the registry yields Player class objects. Has methods to add,
+    retrieve, remove, and rename players. Renaming goes through the
+    registry so the name index never drifts from the players' names.
+    Also keeps the set of solvent players (balance greater than 0), updated
+    by the players when their balance crosses 0, so the winner can be found
+    without checking every balance. Callbacks can be registered to run when
+    a player is eliminated and when a single solvent player remains.
+    """
+    __slots__ = ("_index", "_solvent", "_elimination_callbacks", "_victory_callbacks")
+
+    def __init__(self):
+        """
+        Creates a new empty registry.
+        """
+        self._index = {}
+        self._solvent = {}              # Ordered set of solvent players
+        self._elimination_callbacks = []
+        self._victory_callbacks = []
+
+    def __len__(self):
+        """
+        :return: int representing the number of registered players
+        """
+        return len(self._index)
+
+    def __iter__(self):
+        """
+        :return: iterator over Player class objects in insertion order
+        """
+        return iter(self._index.values())
+
+    def __contains__(self, name):
+        """
+        :param name: string representing player name
+        :return: True if a player with the passed name is registered
+        """
+        return name in self._index
+
+    def __repr__(self):
+        """
+        :return: string representing the registered players as a list
+        """
+        return repr(list(self._index.values()))
+
+    def add(self, player):
+        """
+        Registers a Player class object. Does not allow players with
+        duplicate names.
+        :param player: Player class object
+        :return: True if the player was added, False otherwise
+        """
+        name = player.get_name()
+
+        if name in self._index:             # Reject duplicate names
+            return False
+
+        self._index[name] = player
+        player._registry = self
+        self.track(player)
+
+        return True
+
+    def get(self, name):
+        """
+        Getter for Player class objects in the registry
+        :param name: string representing player name
+        :return: Player class object with the passed name
+                 None if player doesn't exist
+        """
+        return self._index.get(name)
+
+    def remove(self, name):
+        """
+        Removes the player with the passed name from the registry.
+        :param name: string representing player name
+        :return: Player class object that was removed
+                 None if player doesn't exist
+        """
+        player = self._index.pop(name, None)
+
+        if player is not None:
+            player._registry = None
+
+            if player in self._solvent:     # Removing a solvent player can
+                del self._solvent[player]   # leave a single one standing
+
+                if len(self._solvent) == 1:
+                    self._notify(self._victory_callbacks, self.get_winner())
+
+        return player
+
+    def clear(self):
+        """
+        Removes every player without running callbacks. Registered callbacks
+        are kept.
+        :return: None
+        """
+        for player in self._index.values():
+            player._registry = None
+
+        self._index = {}
+        self._solvent = {}
+
+    def rename(self, name, new_name):
+        """
+        Renames the player with the passed name. The player keeps its
+        position in the iteration order. Does not allow renaming to a name
+        already in use.
+        :param name: string representing current player name
+        :param new_name: string representing new player name
+        :return: True if the player was renamed, False otherwise
+        """
+        player = self._index.get(name)
+
+        if player is None or new_name in self._index:
+            return False
+
+        # Rebuild index with the new key in the same slot to preserve order
+        self._index = {(new_name if key == name else key): value
+                       for key, value in self._index.items()}
+        player.set_name(new_name)
+
+        return True
+
+    def track(self, player):
+        """
+        Adds a player to or removes it from the solvent players based on its
+        balance. Does not run callbacks.
+        :param player: Player class object in the registry
+        :return: None
+        """
+        if player.get_balance() > 0:
+            self._solvent[player] = None
+        else:
+            self._solvent.pop(player, None)
+
+    def solvency_changed(self, player):
+        """
+        Called by a player whose balance crossed 0. Updates the solvent
+        players and runs elimination and victory callbacks. Callbacks run
+        as soon as the balance changes, e.g. before a bankrupt player's
+        properties are released by move_player.
+        :param player: Player class object in the registry
+        :return: None
+        """
+        count = len(self._solvent)
+        self.track(player)
+
+        if player not in self._solvent:
+            self._notify(self._elimination_callbacks, player.get_name())
+
+        if len(self._solvent) == 1 and count != 1:
+            self._notify(self._victory_callbacks, self.get_winner())
+
+    def _notify(self, callbacks, name):
+        """
+        Runs callbacks with a player name.
+        :param callbacks: list of callables taking a string
+        :param name: string representing player name
+        :return: None
+        """
+        for callback in callbacks:
+            callback(name)
+
+    def get_solvent(self):
+        """
+        Getter for solvent players. Takes time proportional to the number
+        of solvent players, not of every player.
+        :return: list of Player class objects with a balance greater than 0,
+                 in the order they became solvent
+        """
+        return list(self._solvent)
+
+    def get_winner(self):
+        """
+        :return: string representing the name of the only solvent player
+                 (empty string if there is not exactly one)
+        """
+        if len(self._solvent) == 1:
+            return next(iter(self._solvent)).get_name()
+
+        return ""
+
+    def add_elimination_callback(self, callback):
+        """
+        Registers a function to run when a player's balance drops to 0.
+        :param callback: callable taking the eliminated player's name
+        :return: None
+        """
+        self._elimination_callbacks.append(callback)
+
+    def add_victory_callback(self, callback):
+        """
+        Registers a function to run when exactly one solvent player remains.
+        :param callback: callable taking the winning player's name
+        :return: None
+        """
+        self._victory_callbacks.append(callback)
+
+
+class LazyBoard:
+    """
+    Represents a game board whose Property objects are only created when a
+    space is first accessed. Rents are kept in a compact array, so a space
+    nobody has landed on costs only its rent entry. Behaves like the list
+    created by create_spaces: indexing returns the Space object at that
+    index (creating it if needed) and len returns the number of spaces.
+    """
+    __slots__ = ("_go", "_rents", "_spaces", "_groups")
+
+    def __init__(self, payout, rents, groups=None):
+        """
+        Creates a board with a GO space and one property per rent.
+        :param payout: int or float representing payout amount for GO space
+        :param rents: list of ints or floats representing space rent values
+        :param groups: dictionary mapping property indices to PropertyGroup
+                       class objects, or None
+        """
+        self._go = GO(payout)
+        self._rents = rent_array(rents)
+        self._spaces = {}               # Index to Property for created spaces
+        self._groups = groups or {}     # Members join their group when created
+
+    def __len__(self):
+        """
+        :return: int representing the number of spaces including GO
+        """
+        return len(self._rents) + 1
+
+    def __getitem__(self, index):
+        """
+        Getter for spaces. Creates the Property object on first access.
+        :param index: int representing index of space, or a slice
+        :return: Space class object, or list of Space objects for a slice
+        """
+        if isinstance(index, slice):
+            return [self[pos] for pos in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if index == 0:
+            return self._go
+
+        space = self._spaces.get(index)
+
+        if space is None:
+            if not 0 < index < len(self):
+                raise IndexError("board index out of range")
+
+            space = Property(property_name(index), self._rents[index - 1])
+            self._spaces[index] = space
+            group = self._groups.get(index)
+
+            if group is not None:
+                group.add(space)
+
+        return space
+
+    def __iter__(self):
+        """
+        :return: iterator over every space, creating any not yet accessed
+        """
+        return (self[index] for index in range(len(self)))
+
+    def get_rents(self):
+        """
+        Getter for the rent of every property without creating any
+        :return: tuple of ints or floats in board order
+        """
+        return tuple(self._rents)
+
+    def created(self):
+        """
+        Getter for the properties that have been accessed
+        :return: list of (index, Property) tuples
+        """
+        return list(self._spaces.items())
+
+    def is_created(self, index):
+        """
+        :param index: int representing index of a property space
+        :return: True if the Property object at index exists
+        """
+        return index in self._spaces
+
+
+def rent_array(rents):
+    """
+    Stores rents compactly. Uses a typed array if every rent is an int or
+    every rent is a float, so rents are read back with the same type.
+    Otherwise keeps a tuple.
+    :param rents: list of ints or floats
+    :return: array or tuple of rents
+    """
+    if all(type(rent) is int for rent in rents):
+        return array("q", rents)
+
+    if all(type(rent) is float for rent in rents):
+        return array("d", rents)
+
+    return tuple(rents)
+
+
+class BoardRenderer:
+    """
+    Creates the text depiction of a RealEstateGame used by display. The
+    whole frame is built in a single pass over the board with the players
+    grouped by position once per frame, and returned as one string.
+    The space name and value columns only depend on the board, so they and
+    their widths are cached until the board is replaced. Also has an
+    incremental mode that returns only the rows whose owner or players
+    changed since the previous frame, for logs and dashboards that follow
+    a game.
+    """
+    def __init__(self, game):
+        """
+        Creates a renderer for a game.
+        :param game: RealEstateGame class object
+        """
+        self._game = game
+        self._board = None              # Board the cached columns belong to
+        self._names = []
+        self._values = []
+        self._name_width = 0
+        self._value_width = 0
+        self._last_rows = None          # (owner, players) of each space in the
+        self._last_balances = None      # previous frame, and player balances
+
+    def _static_columns(self):
+        """
+        Creates the space name and value columns if the board has changed
+        since they were cached.
+        :return: None
+        """
+        board = self._game._board
+
+        if board is self._board and len(self._names) == len(board) + 1:
+            return
+
+        names = ["Space"]
+        values = ["Value"]
+
+        for pos in range(len(board)):
+            space = board[pos]
+            names.append(space.get_name())
+
+            if pos == 0:
+                values.append(f"${space.get_payout()}")
+            else:
+                values.append(f"${space.get_base_rent()}/${space.get_price()}")
+
+        self._board = board
+        self._names = names
+        self._values = values
+        self._name_width = max(map(len, names))
+        self._value_width = max(map(len, values))
+        self._last_rows = None
+
+    def _dynamic_columns(self):
+        """
+        Creates the owner and players columns, grouping players by position
+        in one pass over the players.
+        :return: tuple of (list of owner strings, list of player strings)
+        """
+        board = self._game._board
+        present = {}
+
+        for player in self._game._players:
+            present.setdefault(player.get_pos(), []).append(player.get_name())
+
+        owners = ["Owner", "NA"]
+        players_present = ["Players", ", ".join(present.get(0, ["None"]))]
+
+        for pos in range(1, len(board)):
+            owner = board[pos].get_owner()
+            owners.append("None" if owner is None else owner.get_name())
+            players_present.append(", ".join(present.get(pos, ["None"])))
+
+        return owners, players_present
+
+    def _format(self, rows, owners, players_present):
+        """
+        Formats rows of the board with aligned columns.
+        :param rows: iterable of ints representing row indices (0 is the header)
+        :param owners: list of owner strings
+        :param players_present: list of player strings
+        :return: list of strings, one per row
+        """
+        names = self._names
+        values = self._values
+        name_width = self._name_width
+        value_width = self._value_width
+        owner_width = max(map(len, owners))
+        players_width = max(map(len, players_present))
+
+        return [f"[{names[row].ljust(name_width)}]  [{values[row].ljust(value_width)}]  "
+                f"[{owners[row].ljust(owner_width)}]  [{players_present[row].ljust(players_width)}]"
+                for row in rows]
+
+    def _balances(self):
+        """
+        :return: list of strings representing each player's balance
+        """
+        return [f"{player.get_name()}: ${player.get_balance()}"
+                for player in self._game._players]
+
+    def render(self):
+        """
+        Creates the full text of the board and player balances.
+        :return: string depicting the game (empty string if board has not
+                 been created)
+        """
+        if len(self._game._board) == 0:         # Do nothing if board has not been created
+            return ""
+
+        self._static_columns()
+        owners, players_present = self._dynamic_columns()
+        lines = self._format(range(len(owners)), owners, players_present)
+        lines.append("")
+        lines.extend(self._balances())
+
+        return "\n".join(lines)
+
+    def write(self, stream):
+        """
+        Writes the full text of the board and player balances to a stream.
+        :param stream: file-like object with a write method
+        :return: None
+        """
+        text = self.render()
+
+        if len(text) > 0:
+            stream.write(text + "\n")
+
+    def render_changes(self):
+        """
+        Creates text for only the rows whose owner or players changed since
+        the previous call, followed by the balances that changed. The first
+        call, and the first call after the board is replaced, returns every
+        row and balance.
+        :return: string of changed rows (empty string if nothing changed)
+        """
+        if len(self._game._board) == 0:
+            return ""
+
+        self._static_columns()
+        owners, players_present = self._dynamic_columns()
+        rows = list(zip(owners, players_present))
+        balances = self._balances()
+        last_rows = self._last_rows
+        last_balances = self._last_balances
+
+        if last_rows is None:
+            changed = range(1, len(rows))
+            changed_balances = balances
+        else:
+            changed = [row for row in range(1, len(rows)) if rows[row] != last_rows[row]]
+            changed_balances = [line for line in balances if line not in last_balances]
+
+        self._last_rows = rows
+        self._last_balances = set(balances)
+        lines = self._format(changed, owners, players_present)
+
+        if len(changed_balances) > 0:
+            lines.append("")
+            lines.extend(changed_balances)
+
+        return "\n".join(lines)
+
 
 class RealEstateGame:
     """
@@ -167,7 +909,9 @@ class RealEstateGame:
     with no players.
     Has a method to create a list of 1 GO class object and 24 Property class
     objects (subclasses of Space) representing the game board.
-    Has a method to create a new Player class object.
+    Has a method to create a new Player class object, and methods to remove
+    or rename an existing one. Players are kept in a PlayerRegistry so
+    lookups by name do not scan the player list.
     Has methods to query Player objects for balance and position to track
     state of play.
     Has a method that allows a player to buy a property space, updating the
@@ -177,35 +921,157 @@ class RealEstateGame:
     of relevant Space objects.
     Has a method to check for a win condition and return the winning Player
     object's name.
+    Has methods to save the game state to a GameSnapshot, restore it, and
+    clone the game from a snapshot.
+    Can record its calls to an attached GameJournal (see GameJournal.py).
+    Can report call latencies and domain counters to attached GameMetrics
+    (see Instrumentation.py), and publish its changes as events to an
+    attached EventPublisher (see GameEvents.py).
+    Has a method to display the game, using a BoardRenderer.
     """
     def __init__(self):
         """
         Creates a new game with no board and no players.
         """
         self._board = []
-        self._players = []
+        self._players = PlayerRegistry()
+        self._layout = None             # Cached snapshot layout and seating
+        self._seating = ()              # order, cleared when board or players change
+        self._journal = None
+        self._metrics = None
+        self._events = None
+        self._groups = ()
+        self._renderer = BoardRenderer(self)
+
+    def set_journal(self, journal):
+        """
+        Attaches a GameJournal that records every call to create_spaces,
+        create_player, buy_space, and move_player. Pass None to stop recording.
+        :param journal: GameJournal class object or None
+        :return: None
+        """
+        self._journal = journal
+
+        if journal is not None:
+            journal.attach(self)
+
+    def set_metrics(self, metrics):
+        """
+        Attaches a GameMetrics that times move_player, buy_space,
+        create_player, check_game_over, and display, and counts GO payouts,
+        rent transfers, bankruptcies, and property releases. Pass None to
+        stop collecting; a game without metrics runs its methods unwrapped.
+        :param metrics: GameMetrics class object or None
+        :return: None
+        """
+        if self._metrics is not None:
+            self._metrics.detach(self)
+
+        self._metrics = metrics
+
+        if metrics is not None:
+            metrics.attach(self)
+
+    def set_publisher(self, publisher):
+        """
+        Attaches an EventPublisher that receives an event for every player
+        created, move, GO payout, rent transfer, purchase, bankruptcy, and
+        win. Pass None to stop publishing.
+        :param publisher: EventPublisher class object or None
+        :return: None
+        """
+        self._events = publisher
 
-    def create_spaces(self, payout, rents):
+    def create_spaces(self, payout, rents, lazy=False, groups=None):
         """
         Creates 1 GO class object and 24 uniquely named Property class
         objects based on the parameters and stores them in a list
         representing the game board. Will replace existing board if
-        called again.
+        called again. With lazy set, the board is a LazyBoard that only
+        creates a Property object when its space is first accessed, for
+        very large boards. Groups define color groups: while one player
+        owns every property of a group, their rent is multiplied.
         :param payout: int or float representing payout amount for GO space
         :param rents: list of 24 ints or floats representing space rent values
+        :param lazy: True to create Property objects on first access
+        :param groups: list of (list of property indices, multiplier) tuples,
+                       or None. Each property may belong to one group only
         :return: None
+        :raises ValueError: if a group is empty, or contains GO, an index
+                            that is not an int or is outside the board, the
+                            same property twice, or a property already in
+                            another group. The board is unchanged then
         """
-        self._board = []                # Reinitialize board
+        members = {}                                # Property index to group
+        checked = []
 
-        self._board.append(GO(payout))  # Create GO space
+        for indices, multiplier in groups or ():    # Validate every group
+            indices = tuple(indices)                # before changing the board
+            group = PropertyGroup(len(indices), multiplier)
 
-        prop_num = 1
-        for rent in rents:              # Create property spaces
-            if prop_num < 10:
-                self._board.append(Property(f"Prop_0{prop_num}", rent))
-            else:
-                self._board.append(Property(f"Prop_{prop_num}", rent))
-            prop_num += 1
+            if len(indices) == 0:
+                raise ValueError("group has no properties")
+
+            for index in indices:
+                if (not isinstance(index, int) or isinstance(index, bool)
+                        or not 0 < index <= len(rents)):
+                    raise ValueError(f"group index {index!r} is not a property")
+
+                if members.get(index) is group:
+                    raise ValueError(f"property {index} is listed twice in one group")
+
+                if index in members:
+                    raise ValueError(f"property {index} is in more than one group")
+
+                members[index] = group
+
+            checked.append((tuple(sorted(indices)), multiplier))
+
+        groups = tuple(checked)
+
+        for index, space in self._properties():     # Return old board's properties
+            space.set_owner(None)                   # so portfolios stay in sync
+
+        self._layout = None
+        self._groups = groups
+
+        if lazy:
+            self._board = LazyBoard(payout, rents, members)
+        else:
+            self._board = []                # Reinitialize board
+
+            self._board.append(GO(payout))  # Create GO space
+
+            prop_num = 1
+            for rent in rents:              # Create property spaces
+                self._board.append(Property(property_name(prop_num), rent))
+                prop_num += 1
+
+            for index, group in members.items():
+                group.add(self._board[index])
+
+        if self._journal is not None:
+            self._journal.record_spaces(payout, rents, lazy, self._groups)
+
+    def get_groups(self):
+        """
+        Getter for the color group definitions passed to create_spaces
+        :return: tuple of (sorted tuple of property indices, multiplier) tuples
+        """
+        return self._groups
+
+    def _properties(self):
+        """
+        Helper for methods that visit every property. Skips the spaces of a
+        LazyBoard that have not been created.
+        :return: iterable of (index, Property) tuples
+        """
+        board = self._board
+
+        if isinstance(board, LazyBoard):
+            return board.created()
+
+        return enumerate(board[1:], 1)
 
     def create_player(self, name, balance):
         """
@@ -215,14 +1081,55 @@ class RealEstateGame:
         :param balance: int or float representing player starting balance
         :return: None
         """
-        found = False
+        if self._players.add(Player(name, balance)):    # Registry rejects duplicates
+            self._layout = None
+
+            if self._journal is not None:
+                self._journal.record_player(name, balance)
+
+            if self._events is not None:
+                self._events.publish(PlayerCreated, name, balance)
+
+    def remove_player(self, name):
+        """
+        Removes the Player object with the passed name from the game. Any
+        spaces the player owns are returned to the bank.
+        :param name: string representing player name
+        :return: True if the player was removed, False otherwise
+        """
+        player = self._players.remove(name)
+
+        if player is None:                  # Ignore nonexistent players
+            return False
 
-        for player in self._players:        # Check if player with name
-            if player.get_name() == name:   # already exists
-                found = True
+        released = player.release_properties()  # Relinquish removed player's properties
+        self._layout = None
 
-        if not found:
-            self._players.append(Player(name, balance))
+        if self._metrics is not None:
+            self._metrics.count("property_releases", len(released))
+
+        if self._journal is not None:       # Journal has no remove record, so
+            self._journal.checkpoint()      # save the new state instead
+
+        return True
+
+    def rename_player(self, name, new_name):
+        """
+        Changes the name of the Player object with the passed name. Does not
+        allow players with duplicate names.
+        :param name: string representing current player name
+        :param new_name: string representing new player name
+        :return: True if the player was renamed, False otherwise
+        """
+        if self._players.rename(name, new_name):
+            self._layout = None
+
+            if self._journal is not None:   # Journal has no rename record, so
+                self._journal.checkpoint()  # save the new state instead
+
+            return True
+
+        return False
 
     def get_space(self, index):
         """
@@ -237,10 +1144,21 @@ class RealEstateGame:
         Getter for Player class objects in player list
         :param name: string representing player name
         :return: Player class object with the passed name
+                 None if player doesn't exist
+        """
+        return self._players.get(name)
+
+    def get_player_properties(self, name):
         """
-        for player in self._players:
-            if player.get_name() == name:
-                return player
+        Retrieves the properties owned by the Player object with the passed name
+        :param name: string representing player name
+        :return: list of Property class objects owned by the player
+                 None if player doesn't exist
+        """
+        player = self.get_player(name)
+
+        if player is not None:
+            return player.get_properties()
 
     def get_player_account_balance(self, name):
         """
@@ -281,27 +1199,112 @@ class RealEstateGame:
         player = self.get_player(name)
 
         if player is not None:              # Ignore nonexistent players
-            pos = self.get_player_current_position(name)
+            return self._buy(player)
 
-            if pos == 0:                    # Ignore players that have lost
-                return False
+    def _buy(self, player):
+        """
+        Helper for buy_space and play_turns. Purchases the space the player
+        is on if possible, then journals the call. Journaling after the
+        purchase means a checkpoint the call triggers includes its effects.
+        :param player: Player class object
+        :return: True if purchase is successful, False otherwise
+        """
+        bought = self._purchase(player)
 
-            space = self.get_space(pos)
-            owner = space.get_owner()
+        if self._journal is not None:
+            self._journal.record_buy(player.get_name())
 
-            if owner is not None:           # Ignore requests to purchase
-                return False                # owned space
+        return bought
 
-            balance = self.get_player_account_balance(name)
-            price = space.get_price()
+    def _purchase(self, player):
+        """
+        Helper for _buy. Purchases the space the player is on if possible.
+        :param player: Player class object
+        :return: True if purchase is successful, False otherwise
+        """
+        pos = player.get_pos()
 
-            if price > balance:             # Ignore request to purchase
-                return False                # space out of budget
+        if pos == 0:                        # Ignore players that have lost
+            return False
 
-            player.update_balance(-price)   # Purchase space
-            space.set_owner(player)
+        space = self._board[pos]
+        owner = space.get_owner()
 
-            return True
+        if owner is not None:               # Ignore requests to purchase
+            return False                    # owned space
+
+        balance = player.get_balance()
+        price = space.get_price()
+
+        if price > balance:                 # Ignore request to purchase
+            return False                    # space out of budget
+
+        player.update_balance(-price)       # Purchase space
+        space.set_owner(player)
+
+        if self._events is not None:
+            self._events.publish(Purchased, player.get_name(), pos, price, player.get_balance())
+
+            if player.get_balance() == 0:   # Spending everything loses the game
+                self._publish_bankrupt(player.get_name(), ())
+
+        return True
+
+    def award_space(self, name, index, price):
+        """
+        Sells an unowned Property space to a player for a price other than
+        its purchase price, for example the winning bid of an auction. The
+        same checks as buy_space apply: the space must not be GO or owned,
+        and the price must not exceed the player's balance. The price must
+        be greater than 0, so players that have lost can't be awarded spaces.
+        :param name: string representing player name
+        :param index: int representing the space's index on the board
+        :param price: int or float representing the amount paid
+        :return: True if the sale is successful, False otherwise
+        """
+        player = self.get_player(name)
+
+        if player is None:                  # Ignore nonexistent players
+            return False
+
+        awarded = self._award(player, index, price)
+
+        if self._journal is not None:       # Journal after the sale, like _buy
+            self._journal.record_award(name, index, price)
+
+        return awarded
+
+    def _award(self, player, index, price):
+        """
+        Helper for award_space. Sells the space if possible.
+        :param player: Player class object
+        :param index: int representing the space's index on the board
+        :param price: int or float representing the amount paid
+        :return: True if the sale is successful, False otherwise
+        """
+        name = player.get_name()
+
+        if not 0 < index < len(self._board):    # Ignore GO and spaces
+            return False                        # off the board
+
+        space = self._board[index]
+
+        if space.get_owner() is not None:   # Ignore requests to purchase
+            return False                    # owned space
+
+        if not 0 < price <= player.get_balance():   # Ignore prices out
+            return False                            # of budget
+
+        player.update_balance(-price)
+        space.set_owner(player)
+
+        if self._events is not None:
+            self._events.publish(Purchased, name, index, price, player.get_balance())
+
+            if player.get_balance() == 0:   # Spending everything loses the game
+                self._publish_bankrupt(name, ())
+
+        return True
 
     def move_player(self, name, spaces):
         """
@@ -319,63 +1322,649 @@ class RealEstateGame:
         :return: None
         """
         player = self.get_player(name)
-        balance = 0
-        pos = 0
-        board_size = len(self._board)
 
         if player is not None:                  # Ignore nonexistent players
-            balance = self.get_player_account_balance(name)
-            pos = self.get_player_current_position(name)
+            self._move(player, spaces)
+
+    def _move(self, player, spaces):
+        """
+        Helper for move_player and play_turns. Moves the player and settles
+        GO payout, rent, and bankruptcy, then journals the call, like _buy.
+        :param player: Player class object
+        :param spaces: int in range [1..6] representing spaces to move
+        :return: tuple of (amount of rent taken from the player,
+                 True if the player lost on this move)
+        """
+        result = self._settle_move(player, spaces)
+
+        if self._journal is not None:
+            self._journal.record_move(player.get_name(), spaces)
+
+        return result
+
+    def _settle_move(self, player, spaces):
+        """
+        Helper for _move. Moves the player and settles GO payout, rent, and
+        bankruptcy.
+        :param player: Player class object
+        :param spaces: int in range [1..6] representing spaces to move
+        :return: tuple of (amount of rent taken from the player,
+                 True if the player lost on this move)
+        """
+        balance = player.get_balance()
+        pos = player.get_pos()
+        board = self._board
+        board_size = len(board)
+        charged = 0
+        metrics = self._metrics
+        events = self._events
 
         if balance != 0:                        # Ignore players that have lost
+            start = pos
             pos += spaces                       # Perform initial move
 
             if pos > board_size - 1:            # If end of board passed, loop to
                 pos -= board_size               # start of board and payout from GO
 
-                payout = self._board[0].get_payout()
+                payout = board[0].get_payout()
                 player.update_balance(payout)
 
+                if metrics is not None:
+                    metrics.count("go_payouts")
+                    metrics.count("go_payout_amount", payout)
+
             player.set_pos(pos)                 # Update position
 
+            if events is not None:
+                events.publish(Moved, player.get_name(), start, pos)
+
+                if start + spaces > board_size - 1:
+                    events.publish(GoPayout, player.get_name(), board[0].get_payout(),
+                                   player.get_balance())
+
             if pos != 0:                        # Skip rent check on GO
-                prop = self.get_space(pos)
+                prop = board[pos]
                 owner = prop.get_owner()
 
                 if owner is not None:           # Skip rent check on space without owner
                     rent = prop.get_rent()
+                    charged = player.get_balance()
                     player.update_balance(-rent)    # Charge player
                     balance = player.get_balance()
+                    charged -= balance
                     owner.update_balance(rent)      # Pay owner
 
+                    if metrics is not None:
+                        metrics.count("rent_transfers")
+                        metrics.count("rent_amount", rent)
+
+                    if events is not None:
+                        events.publish(RentPaid, player.get_name(), owner.get_name(), pos,
+                                       charged, rent, balance, owner.get_balance())
+
                 if balance == 0:                    # Check for player loss
-                    for prop in self._board[1:]:
-                        owner = prop.get_owner()
+                    released = player.release_properties()  # Relinquish losing player's properties
+
+                    if metrics is not None:
+                        metrics.count("bankruptcies")
+                        metrics.count("property_releases", len(released))
+
+                    if events is not None:
+                        self._publish_bankrupt(player.get_name(),
+                                               tuple(space.get_name() for space in released))
+
+                    return charged, True
+
+        return charged, False
+
+    def play_turns(self, turns, rolls=None, buys=None):
+        """
+        Plays many turns in one call. Each turn moves a player as move_player
+        does and then, if requested, tries to buy the space as buy_space does.
+        Each player name is looked up once per call. If a journal, metrics, or
+        a publisher are attached, turns go through move_player's and
+        buy_space's helpers so every call is recorded, counted, and
+        published, and attached metrics time each move and buy as they would
+        calls to those methods. Otherwise runs of turns that can't change
+        ownership or solvency are played with array operations, as
+        BatchSimulator plays its games, and the turns between runs are played
+        by a loop that reads player and space fields directly.
+        Turns can be passed as an iterable of (name, roll, buy) tuples, or as
+        three parallel sequences: play_turns(names, rolls, buys).
+        :param turns: iterable of (string, int, bool) tuples, or a sequence
+                      of player names if rolls is passed
+        :param rolls: sequence of ints in range [1..6], parallel to turns
+        :param buys: sequence of bools parallel to turns (defaults to all True)
+        :return: TurnResults namedtuple of arrays with one entry per turn
+        """
+        columns = None
+
+        if rolls is not None:
+            columns = (turns, rolls, buys if buys is not None else [True] * len(rolls))
+            turns = zip(*columns)
+
+        registry = self._players
+
+        # Record, count, and publish every call
+        if self._journal is not None or self._metrics is not None or self._events is not None:
+            results = TurnResults(array("q"), array("d"), array("b"), array("b"))
+            positions, rents, purchases, eliminations = results
+            metrics = self._metrics
+            clock = time.perf_counter_ns
+
+            for name, spaces, wants_to_buy in turns:
+                player = registry.get(name)
+
+                if player is None:              # Ignore nonexistent players
+                    positions.append(-1)
+                    rents.append(0)
+                    purchases.append(0)
+                    eliminations.append(0)
+                    continue
+
+                if metrics is None:
+                    charged, lost = self._move(player, spaces)
+                    bought = wants_to_buy and self._buy(player)
+                else:                           # Time each move and buy like
+                    start = clock()             # the wrapped methods
+                    charged, lost = self._move(player, spaces)
+                    moved = clock()
+                    metrics.observe("move_player", moved - start)
+                    bought = False
+
+                    if wants_to_buy:
+                        bought = self._buy(player)
+                        metrics.observe("buy_space", clock() - moved)
+
+                positions.append(player.get_pos())
+                rents.append(charged)
+                purchases.append(1 if bought else 0)
+                eliminations.append(1 if lost else 0)
+
+            return results
+
+        # Otherwise alternate array batches with the loop, writing results
+        # in place
+        if columns is None:
+            turns = turns if type(turns) is list else list(turns)
+            count = len(turns)
+            names, rolls, buys = (list(map(itemgetter(column), turns)) for column in range(3))
+        else:
+            count = min(len(column) for column in columns)
+            names, rolls, buys = columns = [column[:count] if len(column) > count else column
+                                            for column in columns]
+
+        results = TurnResults(array("q", [0]) * count, array("d", [0]) * count,
+                              array("b", [0]) * count, array("b", [0]) * count)
+        everyone = list(registry)
+        resolved = {player.get_name(): player for player in everyone}
+
+        if count < PLAY_TURNS_BATCH or len(self._board) < 2:
+            self._play_loop(resolved, turns, results, 0)
+            return results
+
+        # Seats index everyone; nonexistent players get the seat after the
+        # last. NumPy rolls and buys are used as they are. Rolls that aren't
+        # ints, or are out of range for the board, leave every turn to the
+        # loop.
+        seat_of_name = {name: seat for seat, name in enumerate(resolved)}
+        seat_type = np.int16 if len(everyone) < 1 << 15 else np.int64  # Radix sorted
+        seats = np.fromiter(map(seat_of_name.get, names, repeat(len(everyone))), seat_type, count)
+        buys = buys != 0 if isinstance(buys, np.ndarray) else np.fromiter(buys, bool, count)
+
+        try:
+            if isinstance(rolls, np.ndarray) and rolls.dtype.kind in "iu":
+                whole = rolls.astype(np.int64, copy=False)
+            else:
+                whole = np.frombuffer(array("q", rolls), dtype=np.int64)
+        except (TypeError, OverflowError):
+            whole = None
+
+        if whole is None or whole.min() < 0 or whole.max() > len(self._board):
+            self._play_loop(resolved, turns if columns is None else zip(*columns), results, 0)
+            return results
+
+        seat_of = {player: seat for seat, player in enumerate(everyone)}
+        views = (np.frombuffer(results.positions, dtype=np.int64),
+                 np.frombuffer(results.rents, dtype=np.float64))
+        batch = PLAY_TURNS_BATCH
+        loop = 1
+        start = 0
+
+        # The loop plays the turn that ends each batch. Short batches aren't
+        # worth their fixed cost, so each one doubles the turns the loop
+        # plays before the next batch.
+        while start < count:
+            stop = self._play_batch(everyone, seat_of, seats, whole, buys,
+                                    start, min(count, start + batch), views)
+
+            if stop - start >= PLAY_TURNS_BATCH // 2:
+                batch = min(2 * (stop - start), PLAY_TURNS_MAX_BATCH)
+                loop = 1
+            else:
+                batch = PLAY_TURNS_BATCH
+                loop = min(2 * loop, PLAY_TURNS_MAX_LOOP)
+
+            start = min(count, stop + loop)
+
+            if columns is None:
+                self._play_loop(resolved, turns[stop:start], results, stop)
+            else:
+                self._play_loop(resolved, zip(columns[0][stop:start], whole[stop:start].tolist(),
+                                              buys[stop:start].tolist()), results, stop)
+
+        np.copyto(views[0], -1, where=seats == len(everyone))
+
+        return results
+
+    def _play_batch(self, everyone, seat_of, seats, rolls, buys, start, stop, views):
+        """
+        Helper for play_turns. Plays turns with array operations up to the
+        first turn that could change ownership or solvency: a buy attempt on
+        an unowned space, or a payment that _play_loop might not apply
+        directly. Until then rents don't change, so every position, GO
+        payout, and rent follows from the rolls. Turns are worked on grouped
+        by seat, so each seat's moves and payments add up in turn order.
+        Nothing is played if a balance, rent, or the GO payout isn't an int.
+        :param everyone: list of Player class objects in the registry
+        :param seat_of: dictionary mapping Player class objects to their
+                        indices in everyone
+        :param seats: NumPy int array of indices into everyone, one per
+                      turn (len(everyone) for nonexistent players)
+        :param rolls: NumPy int array of rolls in range [0..board size], one
+                      per turn
+        :param buys: NumPy bool array, one buy decision per turn
+        :param start: int representing the index of the first turn to play
+        :param stop: int representing the index of the turn to stop before
+        :param views: tuple of NumPy views of the positions and rents
+                      result arrays, written in place
+        :return: int representing the index of the first turn not played
+        """
+        board = self._board
+        board_size = len(board)
+        payout = board[0].get_payout()
+        balances = [player._balance for player in everyone] + [0]
+        origins = [player._pos for player in everyone] + [0]
+        count = stop - start
+
+        if (type(payout) is not int or payout < 0
+                or any(type(balance) is not int for balance in balances)
+                or min(origins) < 0 or max(origins) >= board_size):
+            return start
+
+        largest = max(abs(balance) for balance in balances)
+
+        if largest >= PLAY_TURNS_LIMIT:
+            return start
+
+        balance = np.array(balances, dtype=np.int64)
+        origin = np.array(origins, dtype=np.int64)
+
+        # Group turns by seat, in turn order within each seat. Players that
+        # have lost don't move, and nonexistent players sit in the last seat
+        # with a balance of 0.
+        order = np.argsort(seats[start:stop], kind="stable")
+        seat = seats[start:stop][order]
+        firsts = np.concatenate(([0], np.flatnonzero(seat[1:] != seat[:-1]) + 1))
+        lengths = np.diff(np.append(firsts, count))
+        moving = balance[seat] != 0
+        step = rolls[start:stop][order] * moving
+        travel = step.copy()
+        travel[firsts] += origin[seat[firsts]]
+        pos = _running_totals(travel, firsts, lengths) % board_size
+        passed = pos < step                     # Rolls never exceed board_size
+
+        # Owner seat (-1 for none) and rent of each space landed on, and
+        # whether its owner is at or below 0
+        if board_size <= PLAY_TURNS_BATCH * count:
+            landed = np.flatnonzero(np.bincount(pos, minlength=board_size))
+        else:
+            landed = np.unique(pos)
+
+        owner_table = np.full(board_size, -1, dtype=np.int64)
+        rent_table = np.zeros(board_size, dtype=np.int64)
+        unowned_table = np.zeros(board_size, dtype=bool)
+        broke_table = np.zeros(board_size, dtype=bool)
+        highest = 0
+
+        for index in landed.tolist():
+            if index == 0:                      # GO
+                continue
+
+            prop = board[index]
+            owner = prop._owner
+
+            if owner is None:
+                unowned_table[index] = True
+                continue
+
+            rent = prop._rent
+
+            if type(rent) is not int or rent < 0 or owner not in seat_of:
+                return start
+
+            owner_table[index] = seat_of[owner]
+            rent_table[index] = rent
+            broke_table[index] = owner._balance <= 0
+            highest = max(highest, rent)
+
+        if largest + count * (payout + highest) >= PLAY_TURNS_LIMIT:
+            return start
+
+        owner = owner_table[pos]
+        rented = moving & (owner >= 0)
+        charged = rent_table[pos] * rented
+        change = payout * passed - charged
+        change[firsts] += balance[seat[firsts]]
+        lowest = _running_totals(change, firsts, lengths)   # Balances before any rent received
+
+        # Stop before the first buy attempt on an unowned space, or the first
+        # payment _play_loop might not apply directly: one to an owner at or
+        # below 0, or one by a player whose balance could reach 0 even
+        # without the rent they receive in the meantime.
+        stops = order[buys[start:stop][order] & unowned_table[pos]
+                      | moving & (broke_table[pos] | (lowest <= 0))]
+        cut = int(stops.min()) if len(stops) else count
+
+        if cut == 0:
+            return start
+
+        # Each seat's turns before the cut are the start of its group
+        if cut < count:
+            kept = order < cut
+            rented &= kept
+            lengths = np.add.reduceat(kept, firsts, dtype=np.int64)
+            firsts = firsts[lengths > 0]
+            lengths = lengths[lengths > 0]
+
+        lasts = firsts + lengths - 1
+        final = balance.copy()
+        final[seat[lasts]] = lowest[lasts]
+        np.add.at(final, owner[rented], charged[rented])
+        ends = origin.copy()
+        ends[seat[lasts]] = pos[lasts]
+
+        for index in np.flatnonzero((final != balance) | (ends != origin)).tolist():
+            everyone[index]._balance = int(final[index])
+            everyone[index]._pos = int(ends[index])
+
+        views[0][start:stop][order] = pos
+        views[1][start:stop][order] = charged
+
+        return start + cut
+
+    def _play_loop(self, resolved, turns, results, start):
+        """
+        Helper for play_turns. Plays turns one at a time, reading player and
+        space fields directly instead of through a chain of method calls.
+        :param resolved: dictionary mapping player names to Player class
+                         objects
+        :param turns: iterable of (string, int, bool) tuples
+        :param results: TurnResults namedtuple of arrays long enough for
+                        every turn, written in place
+        :param start: int representing the index of the first turn
+        :return: None
+        """
+        board = self._board
+        board_size = len(board)
+        payout = board[0].get_payout() if board_size > 0 else 0
+        positions, rents, purchases, eliminations = results
 
-                        if owner == player:         # Relinquish losing player's properties
-                            prop.set_owner(None)
+        for index, (name, spaces, wants_to_buy) in enumerate(turns, start):
+            player = resolved.get(name)
+
+            if player is None:                  # Ignore nonexistent players
+                positions[index] = -1
+                continue
+
+            # Same rules as _move and _buy. Balance changes that cannot
+            # cross 0 are applied directly; any that might go through
+            # update_balance so solvency tracking and callbacks still run.
+            balance = player._balance
+            charged = 0
+            lost = 0
+            bought = 0
+
+            if balance != 0:                    # Ignore players that have lost
+                pos = player._pos + spaces
+
+                if pos > board_size - 1:        # Payout from GO
+                    pos -= board_size
+
+                    if balance > 0 and payout >= 0:
+                        player._balance = balance + payout
+                    else:
+                        player.update_balance(payout)
+
+                player._pos = pos
+
+                if pos != 0:                    # Skip rent check on GO
+                    prop = board[pos]
+                    owner = prop._owner
+
+                    if owner is not None:       # Charge player, pay owner
+                        rent = prop.get_rent()
+                        charged = player._balance
+
+                        if 0 <= rent < charged:
+                            player._balance = charged - rent
+                        else:
+                            player.update_balance(-rent)
+
+                        balance = player._balance
+                        charged -= balance
+
+                        if owner._balance > 0 and rent >= 0:
+                            owner._balance += rent
+                        else:
+                            owner.update_balance(rent)
+
+                    if balance == 0:            # Check for player loss
+                        player.release_properties()
+                        lost = 1
+            else:
+                pos = player._pos
+
+            if wants_to_buy and pos != 0:       # Purchase space
+                prop = board[pos]
+
+                if prop._owner is None:
+                    price = prop._price
+                    balance = player._balance
+
+                    if not price > balance:
+                        if 0 <= price < balance:
+                            player._balance = balance - price
+                        else:
+                            player.update_balance(-price)
+
+                        prop.set_owner(player)
+                        bought = 1
+
+            positions[index] = pos
+            rents[index] = charged
+            purchases[index] = bought
+            eliminations[index] = lost
+
+    def _publish_bankrupt(self, name, released):
+        """
+        Helper for _settle_move, _purchase, and _award. Publishes a Bankrupt
+        event for a player whose balance reached 0, then a Won event if one
+        player is left.
+        :param name: string representing the player's name
+        :param released: tuple of strings representing the names of the
+                         properties the player gave up
+        :return: None
+        """
+        self._events.publish(Bankrupt, name, released)
+        self._publish_win()
+
+    def _publish_win(self):
+        """
+        Helper for _publish_bankrupt. Publishes a Won event if one player is
+        left.
+        :return: None
+        """
+        winner = self._players.get_winner()
+
+        if winner != "":
+            self._events.publish(Won, winner)
 
     def check_game_over(self):
         """
-        Checks all player balances. If only 1 player has a balance greater than 0, that
-        player is the winner.
+        Checks whether only 1 player has a balance greater than 0, in which case that
+        player is the winner. The registry keeps a live set of solvent players, so
+        this does not check every balance.
         :return: string representing winning player's name (empty string if game is not over)
         """
-        winner = ""
-        player_count = 0
+        return self._players.get_winner()
 
-        for player in self._players:
-            name = player.get_name()
-            balance = self.get_player_account_balance(name)
+    def add_elimination_callback(self, callback):
+        """
+        Registers a function to run when a player's balance drops to 0.
+        :param callback: callable taking the eliminated player's name
+        :return: None
+        """
+        self._players.add_elimination_callback(callback)
+
+    def add_victory_callback(self, callback):
+        """
+        Registers a function to run when exactly one player with a balance
+        greater than 0 remains.
+        :param callback: callable taking the winning player's name
+        :return: None
+        """
+        self._players.add_victory_callback(callback)
+
+    def get_layout(self):
+        """
+        Getter for the game's layout: the GO payout, base rents, player
+        names, and color groups. The layout is cached until the board or the
+        set of players changes, so snapshots of the same game share one
+        layout object.
+        :return: tuple of (payout, tuple of rents, tuple of player names,
+                 tuple of groups as returned by get_groups)
+        """
+        if self._layout is None:
+            board = self._board
+            payout = board[0].get_payout() if len(board) > 0 else None
+
+            if isinstance(board, LazyBoard):
+                rents = board.get_rents()
+            else:
+                rents = tuple(space.get_base_rent() for space in board[1:])
+
+            self._seating = tuple(self._players)
+            self._layout = (payout, rents,
+                            tuple(player.get_name() for player in self._seating),
+                            self._groups)
+
+        return self._layout
+
+    def snapshot(self):
+        """
+        Saves the current balances, positions, and ownership of the game.
+        :return: GameSnapshot namedtuple
+        """
+        layout = self.get_layout()
+        seats = {player: seat for seat, player in enumerate(self._seating)}
+        owners = [-1] * len(self._board)
+
+        for index, space in self._properties():
+            owner = space.get_owner()
+
+            if owner is not None:
+                owners[index] = seats[owner]
+
+        return GameSnapshot(layout,
+                            tuple(player.get_balance() for player in self._seating),
+                            tuple(player.get_pos() for player in self._seating),
+                            tuple(owners))
+
+    def restore(self, snapshot):
+        """
+        Returns the game to a saved state. If the snapshot was taken from a
+        game with the same layout, balances, positions, and owners are
+        written in place and only spaces whose owner differs are updated.
+        Otherwise the board and players are recreated from the snapshot.
+        An attached journal records the restored state as a checkpoint.
+        :param snapshot: GameSnapshot namedtuple returned by snapshot
+        :return: None
+        """
+        layout = snapshot.layout
+        journal = self._journal
+        events = self._events
+        self._journal = None                        # Don't journal or publish
+        self._events = None                         # the rebuild
+
+        if layout is not self.get_layout() and layout != self._layout:
+            payout, rents, names, groups = layout   # Recreate board and players
+
+            if payout is None:                      # Snapshot taken before
+                for index, space in self._properties():     # create_spaces
+                    space.set_owner(None)                   # was called
+
+                self._board = []
+                self._groups = ()
+            elif (layout[:2] != self._layout[:2]    # Keep the board if only
+                  or groups != self._groups):       # the players differ
+                self.create_spaces(payout, rents, groups=groups)
+
+            self._players.clear()
+            self._layout = None                     # Rebuild seating, even with
+                                                    # no players
+
+            for name in names:
+                self.create_player(name, 0)
+
+            self.get_layout()
+            self._layout = layout                   # Share layout with snapshot
+
+        seating = self._seating
+        board = self._board
 
-            if balance > 0:
-                winner = name
-                player_count += 1
+        for seat in range(len(seating)):
+            player = seating[seat]
+            player.set_balance(snapshot.balances[seat])
+            player.set_pos(snapshot.positions[seat])
 
-                if player_count > 1:        # Return "" if more than one active
-                    return ""               # player found
+        owners = snapshot.owners
 
-        return winner                       # Return name of only active player
+        for index, space in self._properties():
+            seat = owners[index]
+            owner = None if seat < 0 else seating[seat]
+
+            if space.get_owner() is not owner:      # Only touch changed spaces
+                space.set_owner(owner)
+
+        if isinstance(board, LazyBoard):            # Create owned spaces that
+            for index in range(1, len(owners)):     # were never accessed
+                if owners[index] >= 0 and not board.is_created(index):
+                    board[index].set_owner(seating[owners[index]])
+
+        self._journal = journal
+        self._events = events
+
+        if journal is not None:
+            journal.checkpoint()
+
+    def clone(self):
+        """
+        Creates an independent copy of the game from a snapshot.
+        :return: object of the game's class (RealEstateGame or a subclass)
+        """
+        game = type(self)()
+        snapshot = self.snapshot()
+
+        lazy = isinstance(self._board, LazyBoard)
+
+        if lazy:                                    # Keep the clone's board lazy
+            payout, rents, names, groups = snapshot.layout
+            game.create_spaces(payout, rents, True, groups)
+
+        game.restore(snapshot)
+
+        return game
 
     def print_players(self, index):
         """
@@ -384,26 +1973,13 @@ class RealEstateGame:
         :param index: int [0..24] representing the index of a space in self._board
         :return: a string representing the names of players
         """
-        players = []
-
-        for player in self._players:
-            name = player.get_name()
-            pos = self.get_player_current_position(name)
-
-            if pos == index:                        # Add any player on space
-                players.append(name)
+        players = [player.get_name() for player in self._players
+                   if player.get_pos() == index]   # Add any player on space
 
         if len(players) == 0:                       # If no players
             return str(None)
 
-        print_players = ""
-
-        for name in players[:len(players) - 1]:     # Add all but last player to string
-            print_players += name + ", "            # with formatting
-
-        print_players += players[len(players) - 1]  # Add last player to string
-
-        return print_players
+        return ", ".join(players)
 
     def spacer(self, string_list):
         """
@@ -411,94 +1987,32 @@ class RealEstateGame:
         :param string_list: a list of strings the size of self._board + 1
         :return: a list of strings containing spaces for formatting
         """
-        largest = 0
-        str_spaces = []
-
-        for str in string_list:                 # Get length of largest string in column
-            if len(str) > largest:
-                largest = len(str)
-
-        for str in string_list:                 # Calculate spaces needed for alignment
-            spaces = ""
-            num_spaces = largest - len(str)
-
-            for count in range(num_spaces):     # Create space string
-                spaces += " "
+        largest = max(map(len, string_list), default=0)
 
-            str_spaces.append(spaces)
+        return [" " * (largest - len(string)) for string in string_list]
 
-        return str_spaces
+    def render(self):
+        """
+        Creates the text printed by display as one string.
+        :return: string depicting the board and player balances
+                 (empty string if board has not been created)
+        """
+        return self._renderer.render()
 
     def display(self):
         """
         Prints a simple depiction of the current state of the game to the console. Represents
         the board as a vertical line with GO at the top. Data on spaces are separated into
-        multiple columns for readability. Does not align columns.
+        multiple columns for readability. Columns are aligned.
         Column 1: Space names
         Column 2: GO payout and property rents/prices
         Column 3: Owner
         Column 4: Player positions
         After the board display, each player's balance is printed.
+        The text is built by a BoardRenderer in a single pass and printed at once.
         :return: None
         """
-        board = self._board
-        size = len(board)
-
-        # Do nothing if board has not been created
-        if size > 0:
-            names = ["Space"]
-            values = ["Value"]
-            owners = ["Owner"]
-            players_present = ["Players"]
-
-            # Create strings from Space data
-            for space in board:
-                name = space.get_name()
-                names.append(name)
-
-                pos = board.index(space)
-
-                if pos == 0:
-                    value = f"${space.get_payout()}"
-                    owner = "NA"
-                else:
-                    rent = space.get_rent()
-                    price = space.get_price()
-                    value = f"${rent}/${price}"
-                    owner = space.get_owner()
-
-                    if owner is None:
-                        owner = str(owner)
-                    else:
-                        owner = owner.get_name()
-
-                values.append(value)
-                owners.append(owner)
-
-                players = self.print_players(pos)
-                players_present.append(players)
-
-            # Create lists of spaces for alignment
-            n_spaces = self.spacer(names)
-            v_spaces = self.spacer(values)
-            o_spaces = self.spacer(owners)
-            p_spaces = self.spacer(players_present)
-
-            # Write header and strings for each space
-            for index in range(size + 1):
-                name = names[index] + n_spaces[index]
-                value = values[index] + v_spaces[index]
-                owner = owners[index] + o_spaces[index]
-                players = players_present[index] + p_spaces[index]
-
-                print(f"[{name}]  [{value}]  [{owner}]  [{players}]")
-
-            # Write Player balances
-            print()
-            players = self._players
-
-            for player in players:
-                name = player.get_name()
-                balance = self.get_player_account_balance(name)
+        text = self._renderer.render()
 
-                print(f"{name}: ${balance}")
+        if len(text) > 0:                       # Do nothing if board has not been created
+            print(text)
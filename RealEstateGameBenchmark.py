@@ -0,0 +1,202 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Benchmarks for the hot paths of RealEstateGame.py. Times
+#                   create_player, move_player, buy_space, play_turns,
+#                   check_game_over, and display for several player counts
+#                   and board sizes, and writes the time per call (per turn
+#                   for play_turns) to a JSON file. A previous
+#                   results file can be passed to fail the run if any case
+#                   got slower by more than a threshold.
+#
+#                   python RealEstateGameBenchmark.py --output new.json
+#                   python RealEstateGameBenchmark.py --compare old.json
+
+import argparse
+import io
+import json
+import platform
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+
+from RealEstateGame import RealEstateGame
+
+
+PLAYER_COUNTS = [2, 10, 100, 1000]
+BOARD_SIZES = [25, 100, 1000]
+
+
+def build_game(players, board_size, seed=0):
+    """
+    Creates a game with generous balances so nobody goes bankrupt while
+    being timed, and buys some spaces so rent is paid.
+    :param players: int representing the number of players
+    :param board_size: int representing the number of spaces including GO
+    :param seed: int used to seed rents and rolls
+    :return: tuple of (RealEstateGame, list of player names)
+    """
+    rng = random.Random(seed)
+    game = RealEstateGame()
+    game.create_spaces(50, [rng.randint(1, 50) for _ in range(board_size - 1)])
+    names = [f"Player {number}" for number in range(players)]
+
+    for name in names:
+        game.create_player(name, 10 ** 9)
+
+    for name in names:
+        game.move_player(name, rng.randint(1, 6))
+        game.buy_space(name)
+
+    return game, names
+
+
+def time_per_call(function, calls, repeats, setup=None):
+    """
+    Times a function that makes a number of calls, keeping the best repeat.
+    :param function: callable taking the result of setup (or no arguments)
+    :param calls: int representing how many calls function makes
+    :param repeats: int representing how many times function is timed
+    :param setup: callable with no arguments run untimed before each repeat
+    :return: float representing nanoseconds per call
+    """
+    best = None
+
+    for _ in range(repeats):
+        arguments = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        function(*arguments)
+        elapsed = time.perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best / calls * 1e9
+
+
+def bench_case(players, board_size, calls, repeats):
+    """
+    Times every operation for one player count and board size.
+    :return: dictionary mapping operation names to nanoseconds per call
+    """
+    game, names = build_game(players, board_size)
+    rng = random.Random(1)
+    turns = [(names[turn % players], rng.randint(1, 6)) for turn in range(calls)]
+    names_column = [name for name, spaces in turns]
+    rolls_column = [spaces for name, spaces in turns]
+    buys_column = [True] * calls
+    results = {}
+
+    def empty_game():
+        fresh = RealEstateGame()
+        fresh.create_spaces(50, [10] * (board_size - 1))
+        return fresh
+
+    def create_players(fresh):
+        for name in names:
+            fresh.create_player(name, 1000)
+
+    def move_players():
+        for name, spaces in turns:
+            game.move_player(name, spaces)
+
+    def buy_spaces():
+        for name, spaces in turns:
+            game.buy_space(name)
+
+    def play_turns():
+        game.play_turns(names_column, rolls_column, buys_column)
+
+    def check_game_overs():
+        for _ in range(calls):
+            game.check_game_over()
+
+    def displays():
+        with redirect_stdout(io.StringIO()):
+            for _ in range(10):
+                game.display()
+
+    results["create_player"] = time_per_call(create_players, players, repeats, empty_game)
+    results["move_player"] = time_per_call(move_players, calls, repeats)
+    results["buy_space"] = time_per_call(buy_spaces, calls, repeats)
+    results["play_turns"] = time_per_call(play_turns, calls, repeats)
+    results["check_game_over"] = time_per_call(check_game_overs, calls, repeats)
+    results["display"] = time_per_call(displays, 10, repeats)
+
+    return results
+
+
+def run(calls=20000, repeats=3, player_counts=PLAYER_COUNTS, board_sizes=BOARD_SIZES):
+    """
+    Runs every benchmark case.
+    :return: dictionary of results keyed by "operation/players=P/board=B"
+    """
+    cases = {}
+
+    for players in player_counts:
+        for board_size in board_sizes:
+            for operation, nanoseconds in bench_case(players, board_size, calls, repeats).items():
+                cases[f"{operation}/players={players}/board={board_size}"] = nanoseconds
+
+    return {"python": platform.python_version(), "calls": calls, "ns_per_call": cases}
+
+
+def compare(baseline, results, threshold):
+    """
+    Finds cases that got slower than the baseline by more than threshold.
+    :param baseline: dictionary loaded from a previous results file
+    :param results: dictionary returned by run
+    :param threshold: float representing the allowed slowdown (0.25 is 25%)
+    :return: list of (case, baseline ns, new ns) tuples that regressed
+    """
+    regressions = []
+
+    for case, nanoseconds in results["ns_per_call"].items():
+        old = baseline["ns_per_call"].get(case)
+
+        if old is not None and nanoseconds > old * (1 + threshold):
+            regressions.append((case, old, nanoseconds))
+
+    return regressions
+
+
+def main():
+    """
+    Command line entry point. Runs the benchmarks, writes the results, and
+    exits with status 1 if a case regressed past the threshold.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Benchmark RealEstateGame hot paths")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", default=None, help="previous results file")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--quick", action="store_true", help="only 2 and 100 players on 25 spaces")
+    args = parser.parse_args()
+
+    if args.quick:
+        results = run(args.calls, args.repeats, [2, 100], [25])
+    else:
+        results = run(args.calls, args.repeats)
+
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2, sort_keys=True)
+
+    for case, nanoseconds in sorted(results["ns_per_call"].items()):
+        print(f"{case:45} {nanoseconds:12.0f} ns")
+
+    if args.compare is not None:
+        with open(args.compare) as previous:
+            regressions = compare(json.load(previous), results, args.threshold)
+
+        for case, old, new in regressions:
+            print(f"REGRESSION {case}: {old:.0f} ns -> {new:.0f} ns")
+
+        if len(regressions) > 0:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,186 +4,612 @@
 # Description:      A tester for RealEstateGame.py
 
 
-# import unittest
-from RealEstateGame import Space, GO, Property, Player, RealEstateGame
-
-
-# class TestSpace(unittest.TestCase):
-#     """Contains unit tests for the Space class"""
-#     def test_space(self):
-#         """ """
-#         pass
-
-
-space = Space("test space", 200)
-print(space.get_name())
-print()
+import asyncio
+import io
+import random
+import unittest
+from contextlib import redirect_stdout
 
-go = GO(200)
-print(go.get_name())
-print(go.get_payout())
-print()
+import numpy as np
 
-prop = Property("test prop", 200)
-print(prop.get_name())
-print(prop.get_rent())
-print(prop.get_price())
-print(prop.get_owner())
-print()
-
-player = Player("p1", 2000)
-print(player.get_name())
-print(player.get_balance())
-print(player.get_pos())
-print()
+from Auctions import AuctionHouse, Sale
+from GameEvents import BLOCK, COALESCE, EventPublisher, Moved
+from Instrumentation import GameMetrics
+from RealEstateGame import Space, GO, Property, Player, RealEstateGame
 
-prop.set_owner(player)
-print(prop.get_owner().get_name())
-print()
 
-player.set_pos(1)
-print(player.get_pos())
-player.update_balance(-1000)
-print(player.get_balance())
-player.update_balance(-1200)
-print(player.get_balance())
-print()
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
 
-game = RealEstateGame()
-print(game._board)
-print(game._players)
-print()
 
-game.display()
+def new_game(*players):
+    """Creates a game on the standard board with (name, balance) players"""
+    game = RealEstateGame()
+    game.create_spaces(50, RENTS)
 
-rents = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
-         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
-game.create_spaces(50, rents)
-print(f"{game._board[0].get_name()}      : {game._board[0].get_payout()}")
-for prop in game._board[1:]:
-    print(f"{prop.get_name()} : {prop.get_rent()} / {prop.get_price()} : {prop.get_owner()}")
-print()
-
-game.create_spaces(50, rents)
-
-game.display()
-print()
-
-game.create_player("Player 1", 1100)
-game.create_player("Player 1", 1200)
-game.create_player("Player 2", 1200)
-game.create_player("Player 3", 1300)
-for player in game._players:
-    print(f"{player.get_name()} : {player.get_balance()}")
-print()
-
-game.display()
-print()
-
-print(game.get_space(1).get_name())
-print(game.get_space(1).get_rent())
-print(game.get_space(1).get_price())
-print(game.get_space(1).get_owner())
-print()
-
-print(game.get_player("Player 0"))
-print(game.get_player("Player 1").get_name())
-print()
-
-print(game.get_player_account_balance("Player 0"))
-print(game.get_player_account_balance("Player 1"))
-print(game.get_player_current_position("Player 0"))
-print(game.get_player_current_position("Player 1"))
-print()
-
-game.buy_space("Player 1")
-
-game.display()
-print()
-
-game.move_player("Player 1", 6)
-print(game.get_player_current_position("Player 1"))
-game.move_player("Player 1", 6)
-print(game.get_player_current_position("Player 1"))
-game.move_player("Player 1", 6)
-print(game.get_player_current_position("Player 1"))
-game.move_player("Player 1", 3)
-print(game.get_player_current_position("Player 1"))
-print(game.get_player_account_balance("Player 1"))
-game.move_player("Player 1", 6)
-print(game.get_player_current_position("Player 1"))
-print(game.get_player_account_balance("Player 1"))
-print()
-
-game.display()
-print()
-
-game.buy_space("Player 1")
-print(game.get_player_account_balance("Player 1"))
-print(game.get_space(2).get_owner().get_name())
-print()
-
-game.display()
-print()
-
-print(game.get_player_account_balance("Player 2"))
-game.move_player("Player 2", 2)
-print(game.get_player_account_balance("Player 2"))
-print()
-
-game.display()
-print()
-
-print(game.get_player_account_balance("Player 3"))
-game.move_player("Player 3", 5)
-print(game.get_player_current_position("Player 3"))
-print(game.get_player_account_balance("Player 3"))
-game.buy_space("Player 3")
-print(game.get_player_account_balance("Player 3"))
-print(game.get_space(5).get_owner().get_name())
-print()
-
-game.display()
-print()
-
-print(game.get_player_account_balance("Player 1"))
-game.get_player("Player 1").update_balance(-900)
-print(game.get_player_account_balance("Player 1"))
-print(game.get_player_current_position("Player 1"))
-game.move_player("Player 1", 3)
-print(game.get_player_current_position("Player 1"))
-print(game.get_player_account_balance("Player 1"))
-game.move_player("Player 1", 3)
-print(game.get_player_current_position("Player 1"))
-print()
-
-game.display()
-print()
-
-print(f'Game Over: "{game.check_game_over()}"')
-game.get_player("Player 2").update_balance(-1150)
-print(game.get_player_account_balance("Player 2"))
-print(f'Game Over: "{game.check_game_over()}"')
-print()
-
-game.create_player("Player 4", 1000)
-game.create_player("Player 5", 1000)
-
-game.display()
-print()
-
-print(f'Game Over: "{game.check_game_over()}"')
-print()
-
-game.move_player("Player 2", 3)
-game.move_player("Player 4", 5)
-game.move_player("Player 5", 5)
-
-game.display()
-print()
-
-game.create_player("Player 6", 1000)
-game.move_player("Player 6", 5)
-
-game.display()
-print()
+    for name, balance in players:
+        game.create_player(name, balance)
+
+    return game
+
+
+class TestSpace(unittest.TestCase):
+    """Contains unit tests for the Space class"""
+    def test_space(self):
+        """A space has a name"""
+        space = Space("test space", 200)
+        self.assertEqual(space.get_name(), "test space")
+
+
+class TestGO(unittest.TestCase):
+    """Contains unit tests for the GO class"""
+    def test_go(self):
+        """GO is named GO and has a payout"""
+        go = GO(200)
+        self.assertEqual(go.get_name(), "GO")
+        self.assertEqual(go.get_payout(), 200)
+
+
+class TestProperty(unittest.TestCase):
+    """Contains unit tests for the Property class"""
+    def test_property(self):
+        """A property has a rent, a price of 5x rent, and no owner"""
+        prop = Property("test prop", 200)
+        self.assertEqual(prop.get_name(), "test prop")
+        self.assertEqual(prop.get_rent(), 200)
+        self.assertEqual(prop.get_price(), 1000)
+        self.assertIsNone(prop.get_owner())
+
+    def test_set_owner(self):
+        """Setting the owner moves the property between portfolios"""
+        prop = Property("test prop", 200)
+        first = Player("p1", 2000)
+        second = Player("p2", 2000)
+
+        prop.set_owner(first)
+        self.assertEqual(prop.get_owner().get_name(), "p1")
+        self.assertEqual(first.get_properties(), [prop])
+
+        prop.set_owner(second)
+        self.assertEqual(first.get_properties(), [])
+        self.assertEqual(second.get_properties(), [prop])
+
+        prop.set_owner(None)
+        self.assertIsNone(prop.get_owner())
+        self.assertEqual(second.get_properties(), [])
+
+
+class TestPlayer(unittest.TestCase):
+    """Contains unit tests for the Player class"""
+    def test_player(self):
+        """A player starts on GO with its starting balance"""
+        player = Player("p1", 2000)
+        self.assertEqual(player.get_name(), "p1")
+        self.assertEqual(player.get_balance(), 2000)
+        self.assertEqual(player.get_pos(), 0)
+
+        player.set_pos(1)
+        self.assertEqual(player.get_pos(), 1)
+
+    def test_update_balance(self):
+        """Charges larger than the balance leave a balance of 0"""
+        player = Player("p1", 2000)
+        player.update_balance(-1000)
+        self.assertEqual(player.get_balance(), 1000)
+        player.update_balance(-1200)
+        self.assertEqual(player.get_balance(), 0)
+
+
+class TestRealEstateGame(unittest.TestCase):
+    """Contains unit tests for the RealEstateGame class"""
+    def test_empty_game(self):
+        """A new game has no board or players and displays nothing"""
+        game = RealEstateGame()
+        self.assertEqual(game._board, [])
+        self.assertEqual(len(game._players), 0)
+
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            game.display()
+
+        self.assertEqual(output.getvalue(), "")
+
+    def test_create_spaces(self):
+        """The board has GO and 24 numbered properties, and can be replaced"""
+        game = RealEstateGame()
+        game.create_spaces(50, RENTS)
+        game.create_spaces(50, RENTS)
+
+        self.assertEqual(len(game._board), 25)
+        self.assertEqual(game.get_space(0).get_name(), "GO")
+        self.assertEqual(game.get_space(0).get_payout(), 50)
+
+        for index in range(1, 25):
+            space = game.get_space(index)
+            self.assertEqual(space.get_name(), f"Prop_{index:02}")
+            self.assertEqual(space.get_rent(), RENTS[index - 1])
+            self.assertEqual(space.get_price(), RENTS[index - 1] * 5)
+            self.assertIsNone(space.get_owner())
+
+    def test_create_player(self):
+        """Duplicate names are ignored and players keep creation order"""
+        game = new_game(("Player 1", 1100), ("Player 1", 1200),
+                        ("Player 2", 1200), ("Player 3", 1300))
+
+        self.assertEqual([(player.get_name(), player.get_balance()) for player in game._players],
+                         [("Player 1", 1100), ("Player 2", 1200), ("Player 3", 1300)])
+        self.assertIsNone(game.get_player("Player 0"))
+        self.assertEqual(game.get_player("Player 1").get_name(), "Player 1")
+        self.assertIsNone(game.get_player_account_balance("Player 0"))
+        self.assertEqual(game.get_player_account_balance("Player 1"), 1100)
+        self.assertIsNone(game.get_player_current_position("Player 0"))
+        self.assertEqual(game.get_player_current_position("Player 1"), 0)
+
+    def test_remove_and_rename_player(self):
+        """Removing or renaming a player keeps the name index in sync"""
+        game = new_game(("a", 1000), ("b", 1000), ("c", 1000))
+        game.move_player("a", 3)
+        game.buy_space("a")
+
+        self.assertTrue(game.rename_player("b", "z"))
+        self.assertFalse(game.rename_player("z", "a"))
+        self.assertIsNone(game.get_player("b"))
+        self.assertEqual([player.get_name() for player in game._players], ["a", "z", "c"])
+
+        self.assertTrue(game.remove_player("a"))
+        self.assertFalse(game.remove_player("a"))
+        self.assertIsNone(game.get_space(3).get_owner())
+        self.assertEqual([player.get_name() for player in game._players], ["z", "c"])
+
+    def test_scenario(self):
+        """Plays the sequence of moves from the original print-based tester"""
+        game = new_game(("Player 1", 1100), ("Player 2", 1200), ("Player 3", 1300))
+
+        self.assertFalse(game.buy_space("Player 1"))          # Can't buy GO
+
+        for spaces, pos in [(6, 6), (6, 12), (6, 18), (3, 21)]:
+            game.move_player("Player 1", spaces)
+            self.assertEqual(game.get_player_current_position("Player 1"), pos)
+
+        self.assertEqual(game.get_player_account_balance("Player 1"), 1100)
+        game.move_player("Player 1", 6)                         # Pass GO
+        self.assertEqual(game.get_player_current_position("Player 1"), 2)
+        self.assertEqual(game.get_player_account_balance("Player 1"), 1150)
+
+        self.assertTrue(game.buy_space("Player 1"))
+        self.assertEqual(game.get_player_account_balance("Player 1"), 900)
+        self.assertEqual(game.get_space(2).get_owner().get_name(), "Player 1")
+        self.assertEqual(game.get_player_properties("Player 1"), [game.get_space(2)])
+
+        game.move_player("Player 2", 2)                         # Pay rent
+        self.assertEqual(game.get_player_account_balance("Player 2"), 1150)
+        self.assertEqual(game.get_player_account_balance("Player 1"), 950)
+
+        game.move_player("Player 3", 5)
+        self.assertEqual(game.get_player_current_position("Player 3"), 5)
+        self.assertTrue(game.buy_space("Player 3"))
+        self.assertEqual(game.get_player_account_balance("Player 3"), 925)
+        self.assertEqual(game.get_space(5).get_owner().get_name(), "Player 3")
+
+        game.get_player("Player 1").update_balance(-900)
+        self.assertEqual(game.get_player_account_balance("Player 1"), 50)
+        game.move_player("Player 1", 3)                         # Rent clamped at 0
+        self.assertEqual(game.get_player_current_position("Player 1"), 5)
+        self.assertEqual(game.get_player_account_balance("Player 1"), 0)
+        self.assertEqual(game.get_player_account_balance("Player 3"), 1000)
+        self.assertIsNone(game.get_space(2).get_owner())        # Properties released
+        self.assertEqual(game.get_player_properties("Player 1"), [])
+
+        game.move_player("Player 1", 3)                         # Bankrupt can't move
+        self.assertEqual(game.get_player_current_position("Player 1"), 5)
+
+        self.assertEqual(game.check_game_over(), "")
+        game.get_player("Player 2").update_balance(-1150)
+        self.assertEqual(game.get_player_account_balance("Player 2"), 0)
+        self.assertEqual(game.check_game_over(), "Player 3")
+
+        game.create_player("Player 4", 1000)
+        game.create_player("Player 5", 1000)
+        self.assertEqual(game.check_game_over(), "")
+
+        game.move_player("Player 2", 3)
+        game.move_player("Player 4", 5)
+        game.move_player("Player 5", 5)
+        self.assertEqual(game.get_player_account_balance("Player 3"), 1150)
+        self.assertEqual(game.get_player_account_balance("Player 4"), 925)
+
+    def test_display(self):
+        """display prints aligned columns followed by player balances"""
+        game = RealEstateGame()
+        game.create_spaces(50, [50, 75])
+        game.create_player("Player 1", 1100)
+        game.create_player("Player 2", 1200)
+        game.move_player("Player 1", 1)
+        game.buy_space("Player 1")
+
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            game.display()
+
+        self.assertEqual(output.getvalue(),
+                         "[Space  ]  [Value   ]  [Owner   ]  [Players ]\n"
+                         "[GO     ]  [$50     ]  [NA      ]  [Player 2]\n"
+                         "[Prop_01]  [$50/$250]  [Player 1]  [Player 1]\n"
+                         "[Prop_02]  [$75/$375]  [None    ]  [None    ]\n"
+                         "\n"
+                         "Player 1: $850\n"
+                         "Player 2: $1200\n")
+
+    def test_render_changes(self):
+        """Incremental rendering returns only changed rows"""
+        game = new_game(("Player 1", 1000), ("Player 2", 1000))
+        renderer = game._renderer
+
+        self.assertEqual(len(renderer.render_changes().splitlines()), 25 + 1 + 2)
+        self.assertEqual(renderer.render_changes(), "")
+
+        game.move_player("Player 1", 3)
+        lines = renderer.render_changes().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("[GO"))
+        self.assertTrue(lines[1].startswith("[Prop_03"))
+
+    def test_snapshot_restore(self):
+        """Restoring a snapshot returns balances, positions, and owners"""
+        game = new_game(("Player 1", 1000), ("Player 2", 1000))
+        game.move_player("Player 1", 3)
+        game.buy_space("Player 1")
+        snapshot = game.snapshot()
+        clone = game.clone()
+
+        game.move_player("Player 2", 3)
+        game.move_player("Player 1", 2)
+        game.buy_space("Player 1")
+        game.restore(snapshot)
+
+        self.assertEqual(game.snapshot(), snapshot)
+        self.assertEqual(clone.snapshot(), snapshot)
+        self.assertEqual(game.get_player_properties("Player 1"), [game.get_space(3)])
+        self.assertEqual(game.get_player_account_balance("Player 2"), 1000)
+
+    def test_restore_without_players(self):
+        """Restoring a snapshot with no players removes every player"""
+        game = new_game()
+        snapshot = game.snapshot()
+        game.create_player("Player 1", 1000)
+        game.move_player("Player 1", 3)
+        game.buy_space("Player 1")
+        game.restore(snapshot)
+
+        self.assertEqual(game.snapshot(), snapshot)
+        self.assertIsNone(game.get_space(3).get_owner())
+        self.assertIsNone(game.get_player("Player 1"))
+
+    def test_lazy_board(self):
+        """A lazy board only creates properties that are accessed"""
+        eager = new_game(("Player 1", 1000), ("Player 2", 1000))
+        lazy = RealEstateGame()
+        lazy.create_spaces(50, RENTS, lazy=True)
+        lazy.create_player("Player 1", 1000)
+        lazy.create_player("Player 2", 1000)
+
+        self.assertEqual(len(lazy._board), 25)
+        self.assertEqual(lazy._board.created(), [])
+
+        for game in (eager, lazy):
+            game.move_player("Player 1", 3)
+            game.buy_space("Player 1")
+            game.move_player("Player 2", 3)
+
+        self.assertEqual([index for index, space in lazy._board.created()], [3])
+        self.assertEqual(lazy.get_space(3).get_name(), "Prop_03")
+        self.assertEqual(lazy.snapshot(), eager.snapshot())
+
+    def test_color_groups(self):
+        """Owning a full group multiplies its rent until the set is broken"""
+        for lazy in (False, True):
+            game = RealEstateGame()
+            game.create_spaces(50, RENTS, lazy, [([1, 2, 3], 2), ([4, 5, 6], 3)])
+            game.create_player("Player 1", 1000)
+            game.create_player("Player 2", 1000)
+
+            for _ in range(3):
+                game.move_player("Player 2", 1)
+                game.buy_space("Player 2")
+
+            self.assertEqual(game.get_space(2).get_rent(), 100)
+            self.assertEqual(game.get_space(2).get_base_rent(), 50)
+            self.assertEqual(game.get_space(4).get_rent(), 75)
+            self.assertEqual(game.get_layout()[1], tuple(RENTS))
+            self.assertEqual(game.clone().get_space(1).get_rent(), 100)
+
+            game.move_player("Player 1", 2)     # Pays the full set rent
+            self.assertEqual(game.get_player_account_balance("Player 1"), 900)
+
+            game.move_player("Player 1", 2)
+            game.buy_space("Player 1")
+            game.get_player("Player 2").update_balance(-300)
+            game.move_player("Player 2", 1)     # Bankrupt, releasing the set
+
+            self.assertEqual(game.get_player_properties("Player 2"), [])
+            self.assertEqual([game.get_space(index).get_rent() for index in (1, 2, 3)],
+                             [50, 50, 50])
+            self.assertIsNone(game.get_space(1).get_group().get_full_owner())
+
+    def test_restore_groups(self):
+        """Restoring a snapshot across layouts carries the color groups"""
+        game = RealEstateGame()
+        game.create_spaces(50, RENTS, groups=[([2, 1], 2)])
+        game.create_player("Player 1", 1000)
+
+        for _ in range(2):
+            game.move_player("Player 1", 1)
+            game.buy_space("Player 1")
+
+        copy = RealEstateGame()
+        copy.create_spaces(50, RENTS)
+        copy.restore(game.snapshot())
+
+        self.assertEqual(copy.get_groups(), (((1, 2), 2),))
+        self.assertEqual(copy.get_space(1).get_rent(), 100)
+        self.assertEqual(copy.snapshot(), game.snapshot())
+
+        copy.restore(RealEstateGame().snapshot())   # And drops them again
+        self.assertEqual(copy.get_groups(), ())
+
+    def test_invalid_groups(self):
+        """Groups with GO, indices that aren't properties, or repeats are rejected"""
+        game = RealEstateGame()
+        game.create_spaces(50, RENTS, groups=[([1, 2], 2)])
+        game.create_player("Player 1", 1000)
+        game.move_player("Player 1", 1)
+        game.buy_space("Player 1")
+
+        for groups in ([([0, 1], 2)], [([24, 25], 2)], [([1, 2, 1], 2)], [([], 2)],
+                       [([1, 2], 2), ([2, 3], 2)], [([1.5, 2], 2)], [([True, 2], 2)],
+                       [([3, 4], 2), ([5, 6.0], 2)], [([3, 4], 2), (["5"], 2)]):
+            with self.assertRaises(ValueError):
+                game.create_spaces(50, RENTS, groups=groups)
+
+        with self.assertRaisesRegex(ValueError, "listed twice in one group"):
+            game.create_spaces(50, RENTS, groups=[([1, 2, 1], 2)])
+
+        with self.assertRaisesRegex(ValueError, "in more than one group"):
+            game.create_spaces(50, RENTS, groups=[([1, 2], 2), ([2, 3], 2)])
+
+        self.assertEqual(game.get_groups(), (((1, 2), 2),))     # Board unchanged
+        self.assertEqual(game.get_space(1).get_owner(), game.get_player("Player 1"))
+
+    def test_auctions(self):
+        """The highest affordable bid wins each space, paid via award_space"""
+        game = new_game(("Player 1", 400), ("Player 2", 1000), ("Player 3", 0))
+        house = AuctionHouse(game)
+        house.set_bidder("Player 1", lambda game, name, spaces: {1: 300, 2: 350})
+        house.set_bidder("Player 2", lambda game, name, spaces: {1: 200, 2: 100, 0: 10})
+        house.set_bidder("Player 3", lambda game, name, spaces: {1: 1000})
+
+        self.assertTrue(house.open(1))
+        self.assertTrue(house.open(2))
+        self.assertFalse(house.open(0))
+        self.assertFalse(house.open(2))
+        self.assertEqual(house.clear(), [Sale(2, "Player 1", 350), Sale(1, "Player 2", 200)])
+        self.assertEqual(house.get_pending(), [])
+        self.assertEqual(game.get_player_account_balance("Player 1"), 50)
+        self.assertEqual(game.get_player_account_balance("Player 2"), 800)
+        self.assertEqual(game.get_space(1).get_owner().get_name(), "Player 2")
+
+        self.assertFalse(house.open(1))                 # Owned
+        self.assertFalse(game.award_space("Player 1", 3, 51))
+        self.assertFalse(game.award_space("Player 3", 3, 0))
+        self.assertTrue(game.award_space("Player 1", 3, 50))
+
+    def test_play_turns(self):
+        """play_turns matches the same calls to move_player and buy_space"""
+        rolls = [3, 5, 6, 1, 2, 4, 6, 6, 3, 1, 5, 2] * 20
+        turns = [(f"Player {turn % 3}", roll, turn % 2 == 0) for turn, roll in enumerate(rolls)]
+        players = [("Player 0", 600), ("Player 1", 800), ("Player 2", 1000)]
+        expected = new_game(*players)
+        bulk = new_game(*players)
+        parallel = new_game(*players)
+
+        for name, roll, buy in turns:
+            expected.move_player(name, roll)
+
+            if buy:
+                expected.buy_space(name)
+
+        results = bulk.play_turns(turns + [("Nobody", 1, True)])
+        parallel.play_turns([turn[0] for turn in turns], [turn[1] for turn in turns],
+                            [turn[2] for turn in turns])
+
+        self.assertEqual(bulk.snapshot(), expected.snapshot())
+        self.assertEqual(parallel.snapshot(), expected.snapshot())
+        self.assertEqual(len(results.positions), len(turns) + 1)
+        self.assertEqual(results.positions[-1], -1)
+        self.assertEqual(sum(results.eliminations),
+                         sum(1 for name, balance in players
+                             if expected.get_player_account_balance(name) == 0))
+
+    def test_play_turns_batches(self):
+        """Long calls played in array batches match the journaled path"""
+        rng = random.Random(5)
+        names = ["Player 0", "Player 1", "Player 2", "Player 3", "Nobody"]
+        turns = [(rng.choice(names), rng.randint(0, 6), rng.random() < 0.02)
+                 for _ in range(6000)]
+        columns = [[turn[column] for turn in turns] for column in range(3)]
+        calls = [(turns,), columns, (columns[0], np.array(columns[1]), np.array(columns[2]))]
+        expected = new_game(*[(name, 2000) for name in names[:-1]])
+        expected.set_metrics(GameMetrics())             # Plays through _move and _buy
+        expected_results = expected.play_turns(turns)
+
+        for arguments in calls:
+            game = new_game(*[(name, 2000) for name in names[:-1]])
+            results = game.play_turns(*arguments)
+
+            self.assertEqual(results, expected_results)
+            self.assertEqual(game.snapshot(), expected.snapshot())
+            self.assertEqual(game.check_game_over(), expected.check_game_over())
+
+        self.assertGreater(sum(expected_results.eliminations), 0)
+        self.assertGreater(sum(expected_results.purchases), 0)
+
+    def test_game_over_callbacks(self):
+        """Elimination and victory callbacks run when balances cross 0"""
+        game = new_game(("Player 1", 100), ("Player 2", 1000))
+        events = []
+        game.add_elimination_callback(lambda name: events.append(("eliminated", name)))
+        game.add_victory_callback(lambda name: events.append(("won", name)))
+
+        game.move_player("Player 2", 3)
+        game.buy_space("Player 2")
+        game.get_player("Player 1").update_balance(-60)
+        game.move_player("Player 1", 3)
+
+        self.assertEqual(events, [("eliminated", "Player 1"), ("won", "Player 2")])
+        self.assertEqual(game.check_game_over(), "Player 2")
+
+    def test_metrics(self):
+        """Attached metrics count calls and domain events, detached ones don't"""
+        game = new_game(("Player 1", 300), ("Player 2", 1000))
+        metrics = GameMetrics({"table": "t1"})
+        game.set_metrics(metrics)
+
+        game.move_player("Player 1", 1)
+        game.buy_space("Player 1")
+        game.move_player("Player 2", 3)
+        game.buy_space("Player 2")
+        game.play_turns([("Player 2", 6, False)] * 4)  # Passes GO once
+        game.move_player("Player 1", 2)                # Lands on Player 2's space
+        game.check_game_over()
+
+        self.assertEqual(metrics.get_histogram("move_player").get_count(), 7)
+        self.assertEqual(metrics.get_histogram("buy_space").get_count(), 2)
+        self.assertEqual(metrics.get_histogram("check_game_over").get_count(), 1)
+        self.assertEqual(metrics.get_counter("go_payouts"), 1)
+        self.assertEqual(metrics.get_counter("go_payout_amount"), 50)
+        self.assertEqual(metrics.get_counter("rent_transfers"), 1)
+        self.assertEqual(metrics.get_counter("rent_amount"), 50)
+        self.assertEqual(metrics.get_counter("bankruptcies"), 1)
+        self.assertEqual(metrics.get_counter("property_releases"), 1)
+        self.assertIn('realestate_bankruptcies_total{table="t1"} 1', metrics.to_prometheus())
+        self.assertIn('le="+Inf"} 7', metrics.to_prometheus())
+        self.assertEqual(metrics.snapshot()["operations"]["buy_space"]["calls"], 2)
+
+        game.set_metrics(None)
+        game.move_player("Player 2", 1)
+
+        self.assertNotIn("move_player", vars(game))
+        self.assertEqual(metrics.get_histogram("move_player").get_count(), 7)
+
+    def test_play_turns_metrics(self):
+        """play_turns times every move and every requested buy"""
+        game = new_game(("Player 1", 1000), ("Player 2", 1000))
+        metrics = GameMetrics()
+        game.set_metrics(metrics)
+        turns = [(f"Player {turn % 2 + 1}", turn % 6 + 1, turn % 3 == 0) for turn in range(30)]
+        game.play_turns(turns + [("Nobody", 1, True)])
+        game.play_turns(["Player 1", "Player 2"], [1, 2], [True, False])
+
+        self.assertEqual(metrics.get_histogram("move_player").get_count(), 32)
+        self.assertEqual(metrics.get_histogram("buy_space").get_count(), 11)
+        self.assertGreater(metrics.get_histogram("move_player").get_total(), 0)
+        self.assertEqual(metrics.snapshot()["operations"]["buy_space"]["calls"], 11)
+
+    def test_events(self):
+        """A publisher receives typed events for every change, in order"""
+        game = new_game()
+        publisher = EventPublisher()
+        game.set_publisher(publisher)
+        subscription = publisher.subscribe()
+
+        game.create_player("Player 1", 300)
+        game.create_player("Player 2", 1000)
+        game.move_player("Player 1", 1)
+        game.buy_space("Player 1")
+        game.move_player("Player 2", 3)
+        game.buy_space("Player 2")
+        game.play_turns([("Player 2", 6, False)] * 4)  # Passes GO once
+        game.move_player("Player 1", 2)                # Lands on Player 2's space
+
+        events = subscription.drain()
+
+        self.assertEqual([type(event).__name__ for event in events],
+                         ["PlayerCreated", "PlayerCreated", "Moved", "Purchased", "Moved",
+                          "Purchased", "Moved", "Moved", "Moved", "Moved", "GoPayout",
+                          "Moved", "RentPaid", "Bankrupt", "Won"])
+        self.assertEqual([event.sequence for event in events], list(range(1, 16)))
+        self.assertEqual(events[12][1:], ("Player 1", "Player 2", 3, 50, 50, 0, 850))
+        self.assertEqual(events[13].released, ("Prop_01",))
+        self.assertEqual(events[14].name, "Player 2")
+
+    def test_restore_and_purchase_events(self):
+        """Restores publish nothing, and spending a balance to 0 is a bankruptcy"""
+        game = new_game(("Player 1", 250), ("Player 2", 1000))
+        saved = game.snapshot()
+        publisher = EventPublisher()
+        game.set_publisher(publisher)
+        subscription = publisher.subscribe()
+
+        game.restore(new_game(("Player 3", 500)).snapshot())
+        game.restore(saved)
+        self.assertEqual(subscription.drain(), [])
+
+        game.move_player("Player 1", 1)
+        game.buy_space("Player 1")              # Spends all 250
+
+        self.assertEqual([type(event).__name__ for event in subscription.drain()],
+                         ["Moved", "Purchased", "Bankrupt", "Won"])
+
+    def test_event_overflow(self):
+        """Full buffers drop the oldest events or merge moves"""
+        game = new_game(("Player 1", 10 ** 6), ("Player 2", 10 ** 6))
+        publisher = EventPublisher()
+        game.set_publisher(publisher)
+        dropping = publisher.subscribe(3)
+        merging = publisher.subscribe(2, COALESCE)
+
+        for _ in range(10):
+            game.move_player("Player 1", 1)
+            game.move_player("Player 2", 2)
+
+        self.assertEqual([event.sequence for event in dropping.drain()], [18, 19, 20])
+        self.assertEqual(dropping.get_dropped(), 17)
+        self.assertEqual(merging.drain(), [Moved(19, "Player 1", 0, 10),
+                                           Moved(20, "Player 2", 0, 20)])
+
+    def test_block_on_reader_thread(self):
+        """BLOCK drops the oldest events when the game runs on the reader's loop"""
+        game = new_game(("Player 1", 10 ** 6))
+        publisher = EventPublisher()
+        game.set_publisher(publisher)
+        subscription = publisher.subscribe(2, BLOCK)
+
+        async def play():
+            game.move_player("Player 1", 1)
+            await subscription.get_async()      # Reader on this thread
+
+            for _ in range(5):
+                game.move_player("Player 1", 1)
+
+        asyncio.run(play())
+
+        self.assertEqual([event.sequence for event in subscription.drain()], [5, 6])
+        self.assertEqual(subscription.get_dropped(), 3)
+
+    def test_invalid_subscriptions(self):
+        """Unknown policies and empty buffers are rejected"""
+        publisher = EventPublisher()
+
+        with self.assertRaises(ValueError):
+            publisher.subscribe(policy="drop_newest")
+
+        with self.assertRaises(ValueError):
+            publisher.subscribe(0)
+
+        self.assertEqual(publisher.get_subscriber_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,376 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A memory-mapped file holding the positions, balances,
+#                   and owners of many games that share a board and a
+#                   seating of players. The file has a fixed layout, so
+#                   worker processes can map it and update disjoint ranges
+#                   of games in place instead of rebuilding RealEstateGame
+#                   objects and pickling results back. Any game can be read
+#                   through a BoardState view with the getters of
+#                   RealEstateGame, Player, and Property.
+
+import json
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from BatchSimulator import BatchSimulator
+from BoardState import BoardState
+from RealEstateGame import GameSnapshot, RealEstateGame
+from TournamentRunner import shard_seed
+
+
+MAGIC = b"REGSTATE"
+VERSION = 1
+
+# magic, version, games, players, spaces, length of the JSON board metadata
+HEADER = struct.Struct("<8sIIIII")
+
+ALIGNMENT = 64                          # Columns start on cache line boundaries
+
+
+def _align(offset):
+    """
+    :return: int representing offset rounded up to a multiple of ALIGNMENT
+    """
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class SharedStateStore:
+    """
+    Represents a memory-mapped state file for a number of games. Columns,
+    each a contiguous block after the header, hold one row per game:
+        positions: (games, players) int64 board indices
+        balances:  (games, players) int64 or float64 balances
+        owners:    (games, spaces) int64 owning seat indices (-1 if none)
+        turns:     (games,) int64 turns played, which decides whose turn it is
+    The board (payout, rents, and color groups) and player names are stored
+    once, as JSON after the header. Changes made by one process are seen by every process
+    that maps the same file.
+    """
+    def __init__(self, path):
+        """
+        Maps an existing state file. Use create or from_game for a new one.
+        :param path: string representing the state file
+        :raises ValueError: if the file is not a state file of this version,
+                            or is shorter than its header says
+        """
+        self._path = path
+
+        with open(path, "r+b") as file:
+            self._map = mmap.mmap(file.fileno(), 0)
+
+        if len(self._map) < HEADER.size:
+            self._map.close()
+            raise ValueError(f"{path} is too short to be a state file")
+
+        magic, version, games, players, spaces, meta_length = HEADER.unpack_from(self._map)
+
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} state file")
+
+        if len(self._map) < self.layout_size(games, players, spaces, meta_length):
+            self._map.close()
+            raise ValueError(f"{path} is shorter than its header says")
+
+        meta = json.loads(self._map[HEADER.size:HEADER.size + meta_length])
+
+        self._games = games
+        self._payout = meta["payout"]
+        self._rents = meta["rents"]
+        self._prices = meta["prices"]
+        self._names = tuple(meta["names"])
+        self._typecode = meta["typecode"]
+        self._groups = tuple((tuple(indices), multiplier)
+                             for indices, multiplier in meta.get("groups", ()))
+
+        offset = _align(HEADER.size + meta_length)
+        columns = {}
+
+        for column, typecode, width in (("positions", "q", players),
+                                        ("balances", self._typecode, players),
+                                        ("owners", "q", spaces),
+                                        ("turns", "q", 1)):
+            size = games * width * 8
+            columns[column] = (offset, typecode, width)
+            offset = _align(offset + size)
+
+        self._columns = columns
+        self._views = {column: memoryview(self._map)[start:start + games * width * 8].cast(typecode)
+                       for column, (start, typecode, width) in columns.items()}
+
+    @staticmethod
+    def layout_size(games, players, spaces, meta_length):
+        """
+        :return: int representing the size of a state file in bytes
+        """
+        offset = _align(HEADER.size + meta_length)
+
+        for width in (players, players, spaces, 1):
+            offset = _align(offset + games * width * 8)
+
+        return offset
+
+    @classmethod
+    def create(cls, path, games, payout, rents, names, balances, groups=None):
+        """
+        Creates a state file with every game at its starting state, as if
+        create_spaces and create_player had been called on each.
+        :param path: string representing the state file to create
+        :param games: int representing the number of games
+        :param payout: int or float representing payout amount for GO space
+        :param rents: list of ints or floats representing space rent values
+        :param names: list of strings representing player names in seating order
+        :param balances: list of ints or floats representing starting balances
+        :param groups: list of (list of property indices, multiplier) tuples,
+                       or None, as passed to create_spaces
+        :return: SharedStateStore class object
+        """
+        batch = BatchSimulator(1, payout, rents, balances, groups)  # Derive prices
+        typecode = "d" if batch.balances.dtype.kind == "f" else "q"  # and balance type
+        meta = json.dumps({"payout": payout,
+                           "rents": list(rents),
+                           "groups": [[sorted(indices), multiplier]
+                                      for indices, multiplier in groups or ()],
+                           "prices": [0] + [price.item() for price in batch._prices[1:]],
+                           "names": list(names),
+                           "typecode": typecode}).encode()
+        spaces = len(rents) + 1
+        size = cls.layout_size(games, len(names), spaces, len(meta))
+
+        with open(path, "wb") as file:
+            file.truncate(size)
+            file.write(HEADER.pack(MAGIC, VERSION, games, len(names), spaces, len(meta)))
+            file.write(meta)
+
+        store = cls(path)
+        positions, starting, owners = store.arrays(0, games)
+        starting[:] = balances
+        owners[:] = -1
+        store.flush()
+
+        return store
+
+    @classmethod
+    def from_game(cls, path, game, games):
+        """
+        Creates a state file in which every game starts as a copy of an
+        existing RealEstateGame object.
+        :param path: string representing the state file to create
+        :param game: RealEstateGame class object with a board
+        :param games: int representing the number of games
+        :return: SharedStateStore class object
+        """
+        payout, rents, names, groups = game.get_layout()
+        snapshot = game.snapshot()
+        store = cls.create(path, games, payout, rents, names, snapshot.balances, groups)
+        positions, balances, owners = store.arrays(0, games)
+        positions[:] = snapshot.positions
+        owners[:] = snapshot.owners
+
+        return store
+
+    def __len__(self):
+        """
+        :return: int representing the number of games in the store
+        """
+        return self._games
+
+    def get_names(self):
+        """
+        Getter for names
+        :return: tuple of strings representing player names in seating order
+        """
+        return self._names
+
+    def _column(self, column, start, stop):
+        """
+        Helper for arrays. Creates a NumPy view of a column's rows.
+        """
+        offset, typecode, width = self._columns[column]
+        dtype = np.float64 if typecode == "d" else np.int64
+        array = np.ndarray((stop - start, width), dtype=dtype, buffer=self._map,
+                           offset=offset + start * width * 8)
+
+        return array if width > 1 else array[:, 0]
+
+    def arrays(self, start, stop):
+        """
+        Creates writable NumPy views of a range of games without copying.
+        :param start: int representing the first game
+        :param stop: int representing one past the last game
+        :return: tuple of (positions, balances, owners) arrays with one row
+                 per game
+        """
+        return (self._column("positions", start, stop),
+                self._column("balances", start, stop),
+                self._column("owners", start, stop))
+
+    def get_turns(self, start, stop):
+        """
+        Getter for turns
+        :return: writable NumPy view of the turns played by a range of games
+        """
+        return self._column("turns", start, stop)
+
+    def get_view(self, game):
+        """
+        Creates a live, read-only view of one game with the getters of
+        RealEstateGame: get_player_account_balance,
+        get_player_current_position, and get_space(index).get_owner().
+        :param game: int representing the game's index
+        :return: BoardState class object backed by the mapped file
+        """
+        players = len(self._names)
+        spaces = len(self._rents) + 1
+        views = self._views
+
+        return BoardState(self._payout, [0] + self._rents, self._prices,
+                          views["owners"][game * spaces:(game + 1) * spaces],
+                          self._names,
+                          views["balances"][game * players:(game + 1) * players],
+                          views["positions"][game * players:(game + 1) * players],
+                          self._groups)
+
+    def _layout(self):
+        """
+        Helper for load_game and store_game.
+        :return: tuple of the store's board and players in the form of
+                 RealEstateGame.get_layout
+        """
+        return self._payout, tuple(self._rents), self._names, self._groups
+
+    def load_game(self, game):
+        """
+        Copies one game into a RealEstateGame object.
+        :param game: int representing the game's index
+        :return: RealEstateGame class object
+        """
+        view = self.get_view(game)
+        copy = RealEstateGame()
+        copy.restore(GameSnapshot(self._layout(),
+                                  tuple(view._balances), tuple(view._positions),
+                                  tuple(view._owners)))
+
+        return copy
+
+    def store_game(self, game, source):
+        """
+        Writes the state of a RealEstateGame object into one game's slot.
+        The source must have the store's board and players.
+        :param game: int representing the game's index
+        :param source: RealEstateGame class object
+        :return: True if the state was written, False if the layout differs
+        """
+        snapshot = source.snapshot()
+
+        if snapshot.layout != self._layout():
+            return False
+
+        positions, balances, owners = self.arrays(game, game + 1)
+        positions[0] = snapshot.positions
+        balances[0] = snapshot.balances
+        owners[0] = snapshot.owners
+
+        return True
+
+    def simulator(self, start, stop):
+        """
+        Creates a BatchSimulator whose arrays are views of a range of games,
+        so stepping it updates the mapped file in place. Every game in the
+        range must have played the same number of turns; add the turns
+        played to get_turns(start, stop) afterwards, or use play.
+        :param start: int representing the first game
+        :param stop: int representing one past the last game
+        :return: BatchSimulator class object
+        """
+        zero = 0.0 if self._typecode == "d" else 0
+        batch = BatchSimulator(0, self._payout, self._rents, [zero] * len(self._names),
+                               self._groups)
+        batch._games = np.arange(stop - start)
+        batch._turn = int(self.get_turns(start, stop)[0]) if stop > start else 0
+        batch.positions, batch.balances, batch.owners = self.arrays(start, stop)
+
+        return batch
+
+    def play(self, start, stop, turns, seed=None):
+        """
+        Plays a number of turns in a range of games in place, every player
+        always buying.
+        :param start: int representing the first game
+        :param stop: int representing one past the last game
+        :param turns: int representing the number of turns to play
+        :param seed: int or None used to seed the dice
+        :return: int representing the number of games in the range that are over
+        """
+        winners = self.simulator(start, stop).run(turns, seed)
+        self.get_turns(start, stop)[:] += turns
+
+        return int((winners >= 0).sum())
+
+    def flush(self):
+        """
+        Writes changes in the mapped file to disk.
+        :return: None
+        """
+        self._map.flush()
+
+    def close(self):
+        """
+        Unmaps the file. NumPy arrays and views created by this store must
+        be dropped first, since a mapping can't be closed while exported.
+        :return: None
+        """
+        for view in self._views.values():
+            view.release()
+
+        self._map.close()
+
+
+def play_slice(path, start, stop, turns, seed):
+    """
+    Worker process body for run_parallel. Maps the state file and plays its
+    range of games. Only the count of finished games is sent back.
+    :return: int representing the number of finished games in the range
+    """
+    store = SharedStateStore(path)
+    finished = store.play(start, stop, turns, seed)
+    store.flush()
+
+    return finished
+
+
+def run_parallel(path, turns, workers=None, slices=None, seed=0):
+    """
+    Plays a number of turns in every game of a state file, split into
+    disjoint ranges of games across a process pool.
+    :param path: string representing the state file
+    :param turns: int representing the number of turns to play
+    :param workers: int representing the number of processes (None for one
+                    per core, 0 to play every range in this process)
+    :param slices: int representing the number of ranges (defaults to one
+                   per worker or per core)
+    :param seed: int representing the seed of the run
+    :return: int representing the number of finished games
+    """
+    with open(path, "rb") as file:
+        games = HEADER.unpack(file.read(HEADER.size))[2]
+
+    if slices is None:
+        slices = workers or os.cpu_count() or 1
+
+    slices = max(1, min(slices, games))
+    bounds = [games * index // slices for index in range(slices + 1)]
+    jobs = [(path, bounds[index], bounds[index + 1], turns, shard_seed(seed, index))
+            for index in range(slices)]
+
+    if workers == 0:
+        return sum(play_slice(*job) for job in jobs)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(play_slice, *zip(*jobs)))
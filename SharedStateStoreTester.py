@@ -0,0 +1,118 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for SharedStateStore.py. Copies games into a
+#                   state file, maps it again as another process would,
+#                   plays games in place, and checks the state round trips
+#                   through RealEstateGame objects.
+
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from BatchSimulator import BatchSimulator
+from RealEstateGame import RealEstateGame
+from SharedStateStore import HEADER, SharedStateStore, run_parallel
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+
+def new_game():
+    """Creates a game with a color group, Player 1 owning it"""
+    game = RealEstateGame()
+    game.create_spaces(50, RENTS, groups=[([1, 2], 2)])
+    game.create_player("Player 1", 1500)
+    game.create_player("Player 2", 1200)
+
+    for _ in range(2):
+        game.move_player("Player 1", 1)
+        game.buy_space("Player 1")
+
+    return game
+
+
+class TestSharedStateStore(unittest.TestCase):
+    """Contains round trip tests for SharedStateStore"""
+
+    def setUp(self):
+        """Creates a directory for state files"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.state")
+
+    def tearDown(self):
+        """Removes the state files"""
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """Games copied in load back identically, seen by every mapping"""
+        game = new_game()
+        store = SharedStateStore.from_game(self.path, game, 4)
+        other = SharedStateStore(self.path)         # As another process
+
+        self.assertEqual(other.load_game(3).snapshot(), game.snapshot())
+        self.assertEqual(other.get_view(0).get_space(1).get_rent(), 100)
+
+        game.move_player("Player 2", 2)             # Pays the full set rent
+        self.assertTrue(store.store_game(2, game))
+        self.assertEqual(other.load_game(2).snapshot(), game.snapshot())
+        self.assertEqual(other.get_view(2).get_player_account_balance("Player 2"), 1100)
+        self.assertFalse(store.store_game(1, RealEstateGame()))
+
+        store.close()
+        other.close()
+
+    def test_play_in_place(self):
+        """Playing a range in place matches a BatchSimulator on the same seed"""
+        game = new_game()
+        store = SharedStateStore.from_game(self.path, game, 6)
+        expected = BatchSimulator.from_game(game, 4)
+        expected.run(30, seed=5)
+
+        store.play(1, 5, 30, seed=5)
+        positions, balances, owners = store.arrays(1, 5)
+
+        self.assertTrue((positions == expected.positions).all())
+        self.assertTrue((balances == expected.balances).all())
+        self.assertTrue((owners == expected.owners).all())
+        self.assertEqual(list(store.get_turns(0, 6)), [0, 30, 30, 30, 30, 0])
+        self.assertEqual(store.load_game(0).snapshot(), game.snapshot())
+
+        del positions, balances, owners
+        store.close()
+
+    def test_run_parallel(self):
+        """Every game is played, in worker processes or in this one"""
+        for workers in (0, 2):
+            SharedStateStore.from_game(self.path, new_game(), 8).close()
+            run_parallel(self.path, 500, workers=workers, slices=3)
+            store = SharedStateStore(self.path)
+
+            self.assertTrue((store.get_turns(0, 8) == 500).all())
+            self.assertFalse(np.array_equal(store.arrays(0, 1)[1], store.arrays(7, 8)[1]))
+            store.close()
+
+    def test_header_is_checked(self):
+        """Files that aren't state files of this version are rejected"""
+        SharedStateStore.from_game(self.path, new_game(), 2).close()
+
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        for corrupt in (b"NOTSTATE" + data[8:],
+                        data[:8] + (2).to_bytes(4, "little") + data[12:],
+                        data[:HEADER.size + 10],
+                        data[:4]):
+            with open(self.path, "wb") as file:
+                file.write(corrupt)
+
+            with self.assertRaises(ValueError):
+                SharedStateStore(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
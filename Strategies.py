@@ -0,0 +1,221 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Buying strategies for players driven by GameDriver.py.
+#                   RealEstateGame leaves the decision of when to call
+#                   buy_space to its caller; a strategy makes that decision
+#                   for one player.
+
+import random
+
+from MarkovAnalyzer import expected_landings_at, landings_ahead
+
+
+class BuyStrategy:
+    """
+    Represents a rule for deciding whether a player buys the unowned
+    property it landed on. Subclasses override should_buy.
+    """
+    def get_name(self):
+        """
+        Getter for name
+        :return: string describing the strategy
+        """
+        return type(self).__name__
+
+    def set_seed(self, seed):
+        """
+        Reseeds any randomness the strategy uses. Tournaments call this
+        before each game so games played in different processes differ.
+        :param seed: int
+        :return: None
+        """
+        pass
+
+    def should_buy(self, game, name, space):
+        """
+        Decides whether to call buy_space.
+        :param game: RealEstateGame class object
+        :param name: string representing the deciding player's name
+        :param space: unowned Property class object the player is on
+        :return: True to buy, False otherwise
+        """
+        return True
+
+    def bid(self, game, name, spaces):
+        """
+        Bids in a batch of auctions run by an AuctionHouse (see Auctions.py).
+        Bids are sealed, and the highest bid the bidder can still afford wins
+        each space. By default bids each property's price on the spaces
+        should_buy accepts.
+        :param game: RealEstateGame class object
+        :param name: string representing the bidding player's name
+        :param spaces: list of (index, Property class object) tuples up for
+                       auction, cheapest first
+        :return: dictionary mapping space indices to bids (no entry for no bid)
+        """
+        balance = game.get_player_account_balance(name)
+        bids = {}
+
+        for index, space in spaces:
+            price = space.get_price()
+
+            if price > balance:             # The rest cost even more
+                break
+
+            if self.should_buy(game, name, space):
+                bids[index] = price
+
+        return bids
+
+
+class AlwaysBuy(BuyStrategy):
+    """
+    Represents a strategy that buys every property it can afford.
+    """
+
+
+class ThresholdBuy(BuyStrategy):
+    """
+    Represents a strategy that only buys if the player's balance after the
+    purchase stays at or above a reserve.
+    """
+    def __init__(self, reserve):
+        """
+        :param reserve: int or float representing the balance to keep
+        """
+        self._reserve = reserve
+
+    def get_name(self):
+        """
+        :return: string describing the strategy
+        """
+        return f"ThresholdBuy({self._reserve})"
+
+    def should_buy(self, game, name, space):
+        """
+        :return: True if the balance after buying is at least the reserve
+        """
+        return game.get_player_account_balance(name) - space.get_price() >= self._reserve
+
+
+class ROIBuy(BuyStrategy):
+    """
+    Represents a strategy that buys a property if the rent its solvent
+    opponents are expected to pay within a number of turns repays the price.
+    Expected landings come from the walk of move_player (see
+    MarkovAnalyzer.landings_ahead), starting from each opponent's current
+    position, and rent is the property's current rent, group multiplier
+    included. Properties just ahead of the opponents, and properties in
+    groups the player is close to owning, are worth more than the rest.
+    Valuing a property takes time proportional to the smaller of the number
+    of distinct opponent positions and 6 * payback_turns, whatever the size
+    of the board or table.
+    """
+    def __init__(self, payback_turns):
+        """
+        :param payback_turns: int representing the number of turns of each
+                              opponent allowed to repay the price
+        """
+        self._payback_turns = payback_turns
+
+    def get_name(self):
+        """
+        :return: string describing the strategy
+        """
+        return f"ROIBuy({self._payback_turns})"
+
+    def should_buy(self, game, name, space):
+        """
+        :return: True if the property is expected to repay its price in time
+        """
+        return self._repays(game, game.get_player_current_position(name),
+                            self._opponents(game, name))
+
+    def bid(self, game, name, spaces):
+        """
+        :return: dictionary bidding each affordable property's price if it
+                 is expected to repay that price in time
+        """
+        balance = game.get_player_account_balance(name)
+        opponents = self._opponents(game, name)     # Counted once per batch
+        bids = {}
+
+        for index, space in spaces:
+            if space.get_price() > balance:         # The rest cost even more
+                break
+
+            if self._repays(game, index, opponents):
+                bids[index] = space.get_price()
+
+        return bids
+
+    def _opponents(self, game, name):
+        """
+        Helper for should_buy and bid. Counts the solvent opponents on each
+        space.
+        :return: dictionary mapping board indices to numbers of opponents
+        """
+        opponents = {}
+
+        for player in game._players.get_solvent():
+            if player.get_name() != name:
+                opponents[player.get_pos()] = opponents.get(player.get_pos(), 0) + 1
+
+        return opponents
+
+    def _repays(self, game, index, opponents):
+        """
+        Helper for should_buy and bid.
+        :param game: RealEstateGame class object
+        :param index: int representing a property's index on the board
+        :param opponents: dictionary mapping board indices to numbers of
+                          solvent opponents on them
+        :return: True if the property is expected to repay its price in time
+        """
+        board_size = len(game._board)
+        ahead = landings_ahead(self._payback_turns)
+
+        if len(opponents) * (1 + len(ahead) // board_size) <= len(ahead):
+            expected = sum(count * expected_landings_at(board_size, index - pos,
+                                                        self._payback_turns)
+                           for pos, count in opponents.items())
+        else:                                       # Visit each reachable distance once
+            expected = sum(ahead[distance] * opponents.get((index - distance) % board_size, 0)
+                           for distance in range(1, len(ahead)))
+
+        space = game.get_space(index)
+
+        return expected * space.get_rent() >= space.get_price()
+
+
+class RandomBuy(BuyStrategy):
+    """
+    Represents a strategy that buys with a fixed probability.
+    """
+    def __init__(self, probability=0.5, seed=None):
+        """
+        :param probability: float in range [0..1] representing chance to buy
+        :param seed: int or None used to seed the strategy's random generator
+        """
+        self._probability = probability
+        self._rng = random.Random(seed)
+
+    def get_name(self):
+        """
+        :return: string describing the strategy
+        """
+        return f"RandomBuy({self._probability})"
+
+    def set_seed(self, seed):
+        """
+        :param seed: int used to reseed the strategy's random generator
+        :return: None
+        """
+        self._rng.seed(seed)
+
+    def should_buy(self, game, name, space):
+        """
+        :return: True with the strategy's probability
+        """
+        return self._rng.random() < self._probability
@@ -0,0 +1,104 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for Strategies.py. Checks the decisions of the
+#                   buying strategies on a fixed board.
+
+
+import random
+import unittest
+
+from MarkovAnalyzer import landings_from
+from RealEstateGame import RealEstateGame
+from Strategies import AlwaysBuy, ROIBuy, ThresholdBuy
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+
+class TestStrategies(unittest.TestCase):
+    """Contains tests for the buying strategies"""
+
+    def setUp(self):
+        """Creates a game of two players on GO"""
+        self.game = RealEstateGame()
+        self.game.create_spaces(50, RENTS)
+        self.game.create_player("Player 1", 100000)
+        self.game.create_player("Player 2", 100000)
+        self.spaces = [(index, self.game.get_space(index)) for index in range(1, len(RENTS) + 1)]
+
+    def test_always_and_threshold_buy(self):
+        """AlwaysBuy bids on everything affordable and ThresholdBuy keeps its reserve"""
+        self.assertEqual(len(AlwaysBuy().bid(self.game, "Player 1", self.spaces)), len(RENTS))
+        self.assertEqual(sorted(ThresholdBuy(100000 - 500).bid(self.game, "Player 1", self.spaces)),
+                         list(range(1, 10)))
+
+    def test_roi_buy_is_selective(self):
+        """ROIBuy buys the properties its opponent is likely to land on soon"""
+        bids = ROIBuy(125).bid(self.game, "Player 1", self.spaces)
+
+        self.assertTrue(0 < len(bids) < len(RENTS))
+        self.assertIn(6, bids)                      # Reached with any one roll
+        self.assertNotIn(24, bids)                  # Just behind the opponent
+
+        self.game.move_player("Player 2", 12)       # Opponent moves past
+        moved = ROIBuy(125).bid(self.game, "Player 1", self.spaces)
+
+        self.assertNotEqual(sorted(moved), sorted(bids))
+        self.assertIn(18, moved)
+
+    def test_roi_buy_counts_opponents(self):
+        """ROIBuy buys more with more opponents to pay rent"""
+        self.assertEqual(ROIBuy(70).bid(self.game, "Player 1", self.spaces), {})
+        self.game.create_player("Player 3", 100000)
+        self.assertTrue(ROIBuy(70).bid(self.game, "Player 1", self.spaces))
+
+
+    def test_roi_buy_matches_markov_chain(self):
+        """ROIBuy's expected rent matches the board's transition matrix"""
+        rng = random.Random(5)
+
+        for opponents in (1, 3, 80):                # 80 visits distances instead
+            game = RealEstateGame()
+            game.create_spaces(50, RENTS)
+
+            for seat in range(opponents + 1):
+                game.create_player(f"Player {seat}", 100000)
+                for move in range(rng.randint(0, 8)):
+                    game.move_player(f"Player {seat}", rng.randint(1, 6))
+
+            landings = landings_from(len(RENTS) + 1, 10)
+            expected = {index for index, space in self.spaces
+                        if sum(landings[game.get_player_current_position(f"Player {seat}"), index]
+                               for seat in range(1, opponents + 1)) * space.get_rent()
+                        >= space.get_price()}
+            spaces = [(index, game.get_space(index)) for index in range(1, len(RENTS) + 1)]
+
+            self.assertEqual(set(ROIBuy(10).bid(game, "Player 0", spaces)), expected)
+
+    def test_roi_buy_large_board(self):
+        """ROIBuy values spaces of a huge lazy board without a dense matrix"""
+        game = RealEstateGame()
+        game.create_spaces(50, [100] * 10 ** 6, lazy=True)
+        game.create_player("Player 1", 100000)
+        game.create_player("Player 2", 100000)
+        game.move_player("Player 1", 5)
+        game.move_player("Player 1", 4)
+        game.move_player("Player 2", 6)
+        strategy = ROIBuy(125)
+
+        self.assertFalse(strategy.should_buy(game, "Player 1", game.get_space(9)))
+
+        for seat in range(3, 30):                   # Many opponents just behind
+            game.create_player(f"Player {seat}", 100000)
+            game.move_player(f"Player {seat}", 6)
+
+        self.assertTrue(strategy.should_buy(game, "Player 1", game.get_space(9)))
+        self.assertEqual(strategy.bid(game, "Player 1", [(10, game.get_space(10)),
+                                                         (5000, game.get_space(5000))]),
+                         {10: 500})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,241 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      Runs large numbers of RealEstateGame games across a pool
+#                   of worker processes. Games are split into shards, each
+#                   shard plays its games with dice from its own
+#                   DiceService, and workers return compact summaries instead of
+#                   game objects.
+
+import argparse
+import json
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from DiceService import DiceService, stream_seed
+from GameDriver import play_game
+from GameStatistics import GameStatistics
+
+
+class ShardSummary:
+    """
+    Represents the results of a shard of games in a compact, picklable form.
+    Stores win counts per player name, the length of every game in turns,
+    and the turn of every bankruptcy. Summaries can be merged so per-shard
+    results combine into a tournament total. May also carry GameStatistics,
+    which stay the same size however many games are played.
+    """
+    def __init__(self, statistics=None):
+        """
+        Creates an empty summary.
+        :param statistics: GameStatistics class object filled by the shard's
+                           games, or None
+        """
+        self._games = 0
+        self._wins = {}
+        self._draws = 0
+        self._lengths = array("I")
+        self._bankruptcy_turns = array("I")
+        self._statistics = statistics
+
+    def get_games(self):
+        """
+        Getter for games
+        :return: int representing the number of games summarized
+        """
+        return self._games
+
+    def get_wins(self):
+        """
+        Getter for wins
+        :return: dictionary mapping player names to number of games won
+        """
+        return dict(self._wins)
+
+    def get_draws(self):
+        """
+        Getter for draws
+        :return: int representing the number of games that hit the turn limit
+        """
+        return self._draws
+
+    def get_lengths(self):
+        """
+        Getter for lengths
+        :return: array of ints representing the length of each game in turns
+        """
+        return self._lengths
+
+    def get_bankruptcy_turns(self):
+        """
+        Getter for bankruptcy turns
+        :return: array of ints representing the turn of each bankruptcy
+        """
+        return self._bankruptcy_turns
+
+    def get_statistics(self):
+        """
+        Getter for statistics
+        :return: GameStatistics class object, or None if not gathered
+        """
+        return self._statistics
+
+    def add_result(self, result):
+        """
+        Adds the outcome of one game to the summary.
+        :param result: GameResult namedtuple returned by play_game
+        :return: None
+        """
+        self._games += 1
+        self._lengths.append(result.turns)
+        self._bankruptcy_turns.extend(result.bankruptcies.values())
+
+        if result.winner == "":
+            self._draws += 1
+        else:
+            self._wins[result.winner] = self._wins.get(result.winner, 0) + 1
+
+    def merge(self, other):
+        """
+        Adds the results of another summary to this one.
+        :param other: ShardSummary class object
+        :return: None
+        """
+        self._games += other._games
+        self._draws += other._draws
+        self._lengths.extend(other._lengths)
+        self._bankruptcy_turns.extend(other._bankruptcy_turns)
+
+        for name, wins in other._wins.items():
+            self._wins[name] = self._wins.get(name, 0) + wins
+
+        if other._statistics is not None:
+            if self._statistics is None:
+                self._statistics = GameStatistics()
+
+            self._statistics.merge(other._statistics)
+
+
+def shard_seed(seed, shard):
+    """
+    Derives the seed of a shard's random stream from the tournament seed.
+    The same tournament seed and shard index always give the same stream,
+    no matter which worker process plays the shard.
+    :param seed: int representing the tournament seed
+    :param shard: int representing the shard index
+    :return: int representing the shard's seed
+    """
+    return stream_seed(seed, shard)
+
+
+def play_shard(rents, payout, players, games, seed, max_turns, statistics=False):
+    """
+    Plays a shard of games in a worker process. Each game rolls from its own
+    stream of the shard's DiceService, so game g of a shard can be replayed
+    with DiceService(seed).replay(g).
+    :param rents: list of ints or floats representing space rent values
+    :param payout: int or float representing payout amount for GO space
+    :param players: list of (name, balance) tuples in seating order
+    :param games: int representing the number of games in the shard
+    :param seed: int representing the shard's seed
+    :param max_turns: int representing the maximum number of moves per game
+    :param statistics: True to also gather GameStatistics
+    :return: ShardSummary class object
+    """
+    dice = DiceService(seed)
+    summary = ShardSummary(GameStatistics() if statistics else None)
+
+    for game in range(games):
+        summary.add_result(play_game(rents, payout, players, max_turns=max_turns,
+                                     dice=dice.stream(game), statistics=summary._statistics))
+        dice.release(game)
+
+    return summary
+
+
+def run_tournament(rents, payout, players, games, workers=None, seed=0,
+                   shards=None, max_turns=10000, statistics=False):
+    """
+    Plays a number of games split into shards across a process pool and
+    merges the per-shard summaries. Results depend only on the seed and the
+    number of shards, not on the number of workers.
+    :param rents: list of ints or floats representing space rent values
+    :param payout: int or float representing payout amount for GO space
+    :param players: list of (name, balance) tuples in seating order
+    :param games: int representing the total number of games
+    :param workers: int representing the number of processes (None for one
+                    per core, 0 to play every shard in this process)
+    :param seed: int representing the tournament seed
+    :param shards: int representing the number of shards (defaults to 64
+                   or fewer if there are fewer games)
+    :param max_turns: int representing the maximum number of moves per game
+    :param statistics: True to also gather GameStatistics in every shard
+    :return: ShardSummary class object with results of every game
+    """
+    if shards is None:
+        shards = min(games, 64)
+
+    shards = max(shards, 1)
+    sizes = [games // shards + (1 if shard < games % shards else 0)
+             for shard in range(shards)]
+    jobs = [(rents, payout, players, sizes[shard], shard_seed(seed, shard), max_turns,
+             statistics) for shard in range(shards)]
+
+    summary = ShardSummary()
+
+    if workers == 0:                            # Play shards in this process
+        for job in jobs:
+            summary.merge(play_shard(*job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(play_shard, *job) for job in jobs]
+
+            for future in futures:              # Merge in shard order
+                summary.merge(future.result())
+
+    return summary
+
+
+def main():
+    """
+    Command line entry point. Plays a tournament on a board with the passed
+    rents and prints win counts and game length statistics.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Run RealEstateGame games in parallel")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--payout", type=float, default=50)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--balance", type=float, default=1500)
+    parser.add_argument("--max-turns", type=int, default=10000)
+    parser.add_argument("--statistics", action="store_true",
+                        help="print running statistics as JSON")
+    parser.add_argument("--rents", type=float, nargs="+",
+                        default=[50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+                                 200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350])
+    args = parser.parse_args()
+
+    players = [(f"Player {seat + 1}", args.balance) for seat in range(args.players)]
+    summary = run_tournament(args.rents, args.payout, players, args.games,
+                             args.workers, args.seed, max_turns=args.max_turns,
+                             statistics=args.statistics)
+
+    lengths = summary.get_lengths()
+    print(f"Games: {summary.get_games()}")
+
+    for name, balance in players:
+        print(f"{name}: {summary.get_wins().get(name, 0)} wins")
+
+    print(f"Draws: {summary.get_draws()}")
+
+    if len(lengths) > 0:
+        print(f"Average length: {sum(lengths) / len(lengths):.1f} turns")
+
+    if summary.get_statistics() is not None:
+        print(json.dumps(summary.get_statistics().summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Author:           Marcos Valdez
+# GitHub username:  MHValdez
+# Date:             10/18/2026
+# Description:      A tester for TournamentRunner.py. Checks that results
+#                   depend only on the seed and the number of shards, and
+#                   that any game of a shard can be replayed on its own.
+
+
+import unittest
+
+from DiceService import DiceService
+from GameDriver import play_game
+from TournamentRunner import ShardSummary, play_shard, run_tournament, shard_seed
+
+
+RENTS = [50, 50, 50, 75, 75, 75, 100, 100, 100, 150, 150, 150,
+         200, 200, 200, 250, 250, 250, 300, 300, 300, 350, 350, 350]
+
+PLAYERS = [("Player 1", 1500), ("Player 2", 1500), ("Player 3", 1500)]
+
+
+class TestTournamentRunner(unittest.TestCase):
+    """Contains reproducibility tests for TournamentRunner"""
+
+    def test_workers_dont_change_results(self):
+        """Shards played in worker processes merge to the same totals"""
+        local = run_tournament(RENTS, 50, PLAYERS, 25, workers=0, seed=4, shards=5,
+                               statistics=True)
+        pooled = run_tournament(RENTS, 50, PLAYERS, 25, workers=2, seed=4, shards=5,
+                                statistics=True)
+
+        self.assertEqual(local.get_games(), 25)
+        self.assertEqual(sum(local.get_wins().values()) + local.get_draws(), 25)
+        self.assertEqual(list(pooled.get_lengths()), list(local.get_lengths()))
+        self.assertEqual(pooled.get_wins(), local.get_wins())
+        self.assertEqual(list(pooled.get_bankruptcy_turns()), list(local.get_bankruptcy_turns()))
+        self.assertEqual(pooled.get_statistics().summary(), local.get_statistics().summary())
+
+    def test_replay_shard_game(self):
+        """Game g of a shard replays from DiceService(seed).replay(g)"""
+        seed = shard_seed(9, 2)
+        summary = play_shard(RENTS, 50, PLAYERS, 4, seed, 10000)
+
+        for game in range(4):
+            result = play_game(RENTS, 50, PLAYERS, dice=DiceService(seed).replay(game))
+            self.assertEqual(result.turns, summary.get_lengths()[game])
+
+    def test_merge(self):
+        """Merged summaries add games, wins, and draws"""
+        first = play_shard(RENTS, 50, PLAYERS, 3, 1, 10000)
+        second = play_shard(RENTS, 50, PLAYERS, 3, 2, 10000)
+        total = ShardSummary()
+        total.merge(first)
+        total.merge(second)
+
+        self.assertEqual(total.get_games(), 6)
+        self.assertEqual(list(total.get_lengths()),
+                         list(first.get_lengths()) + list(second.get_lengths()))
+
+        for name, unused in PLAYERS:
+            self.assertEqual(total.get_wins().get(name, 0),
+                             first.get_wins().get(name, 0) + second.get_wins().get(name, 0))
+
+        self.assertIsNone(total.get_statistics())
+
+
+if __name__ == "__main__":
+    unittest.main()